@@ -0,0 +1,321 @@
+"""
+Benchmark of the resource functions against a local mock of the API, run
+in a separate process.
+
+Each function is called `--requests` times, one call at a time (sync), from
+a thread pool sharing one Session (concurrent) and, with aiohttp
+installed, with an AsyncSession (async). Throughput, p50/p99 latency and
+the peak memory allocated during a shorter run are reported. The latency
+added by the SDK is the measured latency less the server's configured
+`--latency`.
+
+    python benchmarks/bench_api.py --latency 0.005 --error-rate 0.01
+    python benchmarks/bench_api.py --check benchmarks/thresholds.json
+
+With --check the run fails if a result is worse than its threshold.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+try:
+    import asyncio
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mock_server import ServerProcess  # noqa: E402
+
+from freelancersdk.instrumentation import percentile  # noqa: E402
+from freelancersdk.session import Session  # noqa: E402
+from freelancersdk.resources.messages.messages import (  # noqa: E402
+    post_attachment, post_message,
+)
+from freelancersdk.resources.messages.exceptions import (  # noqa: E402
+    MessageNotCreatedException,
+)
+from freelancersdk.resources.messages.helpers import (  # noqa: E402
+    create_attachment,
+)
+from freelancersdk.resources.projects import (  # noqa: E402
+    get_bids, get_projects, search_projects,
+)
+from freelancersdk.resources.projects.exceptions import (  # noqa: E402
+    BidsNotFoundException, ProjectsNotFoundException,
+)
+from freelancersdk.resources.projects.helpers import (  # noqa: E402
+    create_get_projects_object, create_get_projects_project_details_object,
+    create_get_projects_user_details_object,
+)
+from freelancersdk.resources.users import get_users  # noqa: E402
+from freelancersdk.resources.users.exceptions import (  # noqa: E402
+    UsersNotFoundException,
+)
+from freelancersdk.resources.users.helpers import (  # noqa: E402
+    create_get_users_object,
+)
+
+if aiohttp is not None:
+    from freelancersdk.async_session import AsyncSession
+    from freelancersdk.resources.messages import async_messages
+    from freelancersdk.resources.projects import async_projects
+    from freelancersdk.resources.users import async_users
+
+MODES = ('sync', 'concurrent', 'async')
+
+PROJECTS_QUERY = create_get_projects_object(
+    project_ids=list(range(1, 21)),
+    project_details=create_get_projects_project_details_object(
+        full_description=True, jobs=True),
+    user_details=create_get_projects_user_details_object(
+        basic=True, reputation=True),
+)
+
+USERS_QUERY = create_get_users_object(user_ids=list(range(1, 21)))
+
+ATTACHMENT = b'%PDF-1.4 benchmark attachment\n' * 2048
+
+
+def _attachments():
+    return [create_attachment(ATTACHMENT, 'invoice.pdf')]
+
+
+# The calls of each function, with the exceptions it raises on errors: the
+# sync call, and the async call taking an AsyncSession
+SCENARIOS = {
+    'get_projects': (
+        lambda s: get_projects(s, PROJECTS_QUERY).projects,
+        lambda s: async_projects.get_projects(s, PROJECTS_QUERY),
+        (ProjectsNotFoundException,)),
+    'search_projects': (
+        lambda s: search_projects(s, 'python', None, 100, 0).projects,
+        lambda s: async_projects.search_projects(s, 'python', None, 100, 0),
+        (ProjectsNotFoundException,)),
+    'get_bids': (
+        lambda s: get_bids(s, project_ids=[101], limit=100).bids,
+        lambda s: async_projects.get_bids(s, project_ids=[101], limit=100),
+        (BidsNotFoundException,)),
+    'get_users': (
+        lambda s: get_users(s, USERS_QUERY).users,
+        lambda s: async_users.get_users(s, USERS_QUERY),
+        (UsersNotFoundException,)),
+    'post_message': (
+        lambda s: post_message(s, 301, "Let's talk"),
+        lambda s: async_messages.post_message(s, 301, "Let's talk"),
+        (MessageNotCreatedException,)),
+    'post_attachment': (
+        lambda s: post_attachment(s, 301, _attachments()),
+        lambda s: async_messages.post_attachment(s, 301, _attachments()),
+        (MessageNotCreatedException,)),
+}
+
+
+def _timed(call, session, errors):
+    started = time.perf_counter()
+    try:
+        call(session)
+        failed = False
+    except errors:
+        failed = True
+    return time.perf_counter() - started, failed
+
+
+# Each runner makes `warmup` untimed calls, which fill the connection pool,
+# then `count` timed ones. It returns their (seconds, failed) timings and
+# the wall time they took
+
+def run_sync(call, session, count, concurrency, errors, warmup=0):
+    for _ in range(warmup):
+        _timed(call, session, errors)
+    started = time.perf_counter()
+    timings = [_timed(call, session, errors) for _ in range(count)]
+    return timings, time.perf_counter() - started
+
+
+def run_concurrent(call, session, count, concurrency, errors, warmup=0):
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(lambda _: _timed(call, session, errors),
+                      range(warmup)))
+        started = time.perf_counter()
+        timings = list(pool.map(lambda _: _timed(call, session, errors),
+                                range(count)))
+        return timings, time.perf_counter() - started
+
+
+def run_async(call, session, count, concurrency, errors, warmup=0):
+
+    async def timed(semaphore):
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await call(session)
+                failed = False
+            except errors:
+                failed = True
+            return time.perf_counter() - started, failed
+
+    async def run():
+        semaphore = asyncio.Semaphore(concurrency)
+        try:
+            await asyncio.gather(*[timed(semaphore) for _ in range(warmup)])
+            started = time.perf_counter()
+            timings = await asyncio.gather(*[timed(semaphore)
+                                             for _ in range(count)])
+            return timings, time.perf_counter() - started
+        finally:
+            await session.close()
+
+    return asyncio.run(run())
+
+
+RUNNERS = {'sync': run_sync, 'concurrent': run_concurrent,
+           'async': run_async}
+
+
+def make_session(mode, url, concurrency):
+    if mode == 'async':
+        return AsyncSession(oauth_token='benchmark', url=url,
+                            connection_limit=concurrency)
+    return Session(oauth_token='benchmark', url=url,
+                   pool_maxsize=concurrency)
+
+
+def measure(server, name, mode, count, concurrency):
+    """
+    Benchmark one function in one mode and return its results
+    """
+    sync_call, async_call, errors = SCENARIOS[name]
+    call = async_call if mode == 'async' else sync_call
+    runner = RUNNERS[mode]
+    if mode == 'sync':
+        concurrency = 1
+
+    session = make_session(mode, server.url, concurrency)
+    timings, elapsed = runner(call, session, count, concurrency, errors,
+                              warmup=concurrency)
+    latencies = [seconds for seconds, _ in timings]
+
+    peak = None
+    if tracemalloc is not None:
+        # Measured on a separate, shorter run as tracing slows calls down
+        session = make_session(mode, server.url, concurrency)
+        tracemalloc.start()
+        runner(call, session, max(count // 10, concurrency), concurrency,
+               errors, warmup=concurrency)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    p50 = percentile(latencies, 0.5)
+    p99 = percentile(latencies, 0.99)
+    return {
+        'function': name,
+        'mode': mode,
+        'requests': count,
+        'concurrency': concurrency,
+        'errors': sum(1 for _, failed in timings if failed),
+        'throughput': count / elapsed,
+        'p50_ms': p50 * 1000,
+        'p99_ms': p99 * 1000,
+        'overhead_p50_ms': (p50 - server.latency) * 1000,
+        'overhead_p99_ms': (p99 - server.latency) * 1000,
+        'peak_memory_kb': None if peak is None else peak / 1024.0,
+    }
+
+
+def check(results, thresholds):
+    """
+    Return the failures of the results against the thresholds, given per
+    mode and function with '*' as the default, e.g.
+    {"sync": {"*": {"max_overhead_p99_ms": 20}}}
+    """
+    failures = []
+    for result in results:
+        by_function = thresholds.get(result['mode'], {})
+        limits = dict(by_function.get('*', {}))
+        limits.update(by_function.get(result['function'], {}))
+        for limit, bound in sorted(limits.items()):
+            kind, key = limit.split('_', 1)
+            value = result[key]
+            if value is None:
+                continue
+            if (kind == 'max' and value > bound) or \
+                    (kind == 'min' and value < bound):
+                failures.append('{} {}: {} is {:.2f}, limit {}'.format(
+                    result['mode'], result['function'], key, value, bound))
+    return failures
+
+
+def report(results):
+    columns = ('function', 'mode', 'errors', 'throughput', 'p50_ms',
+               'p99_ms', 'overhead_p99_ms', 'peak_memory_kb')
+    print('{:<16} {:<10} {:>6} {:>10} {:>8} {:>8} {:>15} {:>14}'.format(
+        *columns))
+    for result in results:
+        print('{function:<16} {mode:<10} {errors:>6} {throughput:>10.1f} '
+              '{p50_ms:>8.2f} {p99_ms:>8.2f} {overhead_p99_ms:>15.2f} '
+              '{memory:>14}'.format(
+                  memory='-' if result['peak_memory_kb'] is None
+                  else '{:.1f}'.format(result['peak_memory_kb']),
+                  **result))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--requests', type=int, default=200,
+                        help='calls per function and mode')
+    parser.add_argument('--concurrency', type=int, default=8,
+                        help='calls in flight in the concurrent modes')
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='server latency in seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0,
+                        help='fraction of requests answered with a 500')
+    parser.add_argument('--function', action='append',
+                        choices=sorted(SCENARIOS),
+                        help='functions to run, all by default')
+    parser.add_argument('--mode', action='append', choices=MODES,
+                        help='modes to run, all available by default')
+    parser.add_argument('--json', help='write the results to this file')
+    parser.add_argument('--check', metavar='THRESHOLDS',
+                        help='fail if results are worse than these')
+    args = parser.parse_args(argv)
+
+    modes = args.mode or [mode for mode in MODES
+                          if mode != 'async' or aiohttp is not None]
+    if 'async' in modes and aiohttp is None:
+        parser.error('the async mode requires aiohttp')
+    results = []
+    with ServerProcess(latency=args.latency,
+                       error_rate=args.error_rate) as server:
+        for name in args.function or sorted(SCENARIOS):
+            for mode in modes:
+                results.append(measure(server, name, mode, args.requests,
+                                       args.concurrency))
+    report(results)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    if args.check:
+        with open(args.check) as f:
+            failures = check(results, json.load(f))
+        for failure in failures:
+            print('FAIL ' + failure)
+        return 1 if failures else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,181 @@
+"""
+Micro-benchmarks of the hot paths of bulk tools: the query builders and the
+construction of models from JSON data.
+
+Each benchmark's time per call is divided by the time of a fixed reference
+workload measured alongside it, so that the baselines recorded on one
+machine can be compared on another.
+
+    python benchmarks/bench_micro.py
+    python benchmarks/bench_micro.py --update
+    python benchmarks/bench_micro.py --check
+
+--update records the results in benchmarks/baselines.json. --check fails if
+a benchmark is slower than its baseline by more than --tolerance.
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mock_server import make_bid, make_project  # noqa: E402
+
+from freelancersdk.resources.projects.helpers import (  # noqa: E402
+    create_get_projects_object, create_get_projects_project_details_object,
+    create_get_projects_user_details_object,
+)
+from freelancersdk.resources.projects.types import Bid, Project  # noqa: E402
+from freelancersdk.resources.users.helpers import (  # noqa: E402
+    create_get_users_details_object,
+)
+
+BASELINES = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                         'baselines.json')
+
+PROJECT = make_project(101)
+BID = make_bid(201)
+PROJECT_IDS = list(range(1, 21))
+
+
+def _reference():
+    # A fixed workload of string formatting and dict building, which the
+    # benchmarks are measured against
+    d = {}
+    for i in range(20):
+        d['key{}'.format(i)] = i
+    return sorted(d.items())
+
+
+def _project_details():
+    return create_get_projects_project_details_object(
+        full_description=True, jobs=True, upgrades=True, attachments=True,
+        qualifications=True)
+
+
+def _user_details():
+    return create_get_projects_user_details_object(
+        basic=True, avatar=True, country=True, profile_description=True,
+        jobs=True, reputation=True, status=True)
+
+
+def _get_projects_object():
+    return create_get_projects_object(
+        project_ids=PROJECT_IDS, project_details=_project_details(),
+        user_details=_user_details(), limit=20, offset=0)
+
+
+def _users_details():
+    return create_get_users_details_object(
+        basic=True, avatar=True, country=True, profile_description=True,
+        jobs=True, reputation=True, status=True)
+
+
+def _project_access():
+    project = Project(PROJECT)
+    return project.currency.code, project.budget.minimum
+
+
+BENCHMARKS = {
+    'create_get_projects_object': _get_projects_object,
+    'create_get_projects_user_details_object': _user_details,
+    'create_get_users_details_object': _users_details,
+    'Project': lambda: Project(PROJECT),
+    'Project.lazy': lambda: Project.lazy(PROJECT),
+    'Project nested access': _project_access,
+    'Bid': lambda: Bid(BID),
+    'Bid.lazy': lambda: Bid.lazy(BID),
+}
+
+
+def _calls_per_run(timer, run_time):
+    number = 1
+    while timer.timeit(number) < run_time:
+        number *= 2
+    return number
+
+
+def measure(func, repeat=25, run_time=0.01):
+    """
+    Return the best times of one call of func and of the reference workload
+    in seconds. Short runs of the two are interleaved and the fastest of
+    each kept, which filters out most of the noise of a busy machine
+    """
+    timer = timeit.Timer(func)
+    reference = timeit.Timer(_reference)
+    number = _calls_per_run(timer, run_time)
+    reference_number = _calls_per_run(reference, run_time)
+    best = best_reference = float('inf')
+    for _ in range(repeat):
+        best = min(best, timer.timeit(number) / number)
+        best_reference = min(best_reference,
+                             reference.timeit(reference_number) /
+                             reference_number)
+    return best, best_reference
+
+
+def run(names):
+    results = {}
+    for name in names:
+        seconds, reference = measure(BENCHMARKS[name])
+        results[name] = {'ns': round(seconds * 1e9),
+                         'relative': round(seconds / reference, 4)}
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--benchmark', action='append',
+                        choices=sorted(BENCHMARKS),
+                        help='benchmarks to run, all by default')
+    parser.add_argument('--baselines', default=BASELINES,
+                        help='baselines file')
+    parser.add_argument('--update', action='store_true',
+                        help='record the results as the baselines')
+    parser.add_argument('--check', action='store_true',
+                        help='fail if slower than the baselines')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='allowed slowdown over a baseline, 0.25 = 25%%')
+    args = parser.parse_args(argv)
+
+    baselines = {}
+    if os.path.exists(args.baselines):
+        with open(args.baselines) as f:
+            baselines = json.load(f)
+    results = run(args.benchmark or sorted(BENCHMARKS))
+
+    failures = []
+    print('{:<42} {:>10} {:>9} {:>9}'.format('benchmark', 'ns/call',
+                                             'relative', 'baseline'))
+    for name in sorted(results):
+        result = results[name]
+        baseline = baselines.get(name, {}).get('relative')
+        change = ''
+        if baseline:
+            ratio = result['relative'] / baseline
+            change = '{:+.0%}'.format(ratio - 1)
+            if ratio > 1 + args.tolerance:
+                failures.append(name)
+        print('{:<42} {:>10.0f} {:>9.2f} {:>9}'.format(
+            name, result['ns'], result['relative'], change))
+
+    if args.update:
+        baselines.update(results)
+        with open(args.baselines, 'w') as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+            f.write('\n')
+    if args.check:
+        for name in failures:
+            print('FAIL {} is more than {:.0%} slower than its baseline'
+                  .format(name, args.tolerance))
+        return 1 if failures else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
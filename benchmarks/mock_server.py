@@ -0,0 +1,311 @@
+"""
+A local stand-in for the freelancer.com API, serving realistic payloads for
+the endpoints the benchmarks call, with configurable latency and error rate
+"""
+
+import json
+import multiprocessing
+import random
+import threading
+import time
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+    from urllib.parse import parse_qs, urlparse
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+    from urlparse import parse_qs, urlparse
+
+DESCRIPTION = ('We are looking for an experienced developer to build and '
+               'maintain a data pipeline and the web dashboard on top of '
+               'it. ') * 12
+
+
+def make_project(project_id):
+    return {
+        'id': project_id,
+        'owner_id': 1000 + project_id % 97,
+        'title': 'Build a data pipeline and dashboard #{}'.format(project_id),
+        'status': 'active',
+        'seo_url': 'python/build-data-pipeline-{}'.format(project_id),
+        'currency': {'id': 1, 'code': 'USD', 'sign': '$', 'name': 'US Dollar',
+                     'exchange_rate': 1, 'country': 'US'},
+        'description': DESCRIPTION,
+        'preview_description': DESCRIPTION[:200],
+        'deleted': False,
+        'nonpublic': False,
+        'hidebids': False,
+        'type': 'fixed',
+        'bidperiod': 7,
+        'budget': {'minimum': 250, 'maximum': 750},
+        'featured': False,
+        'urgent': False,
+        'bid_stats': {'bid_count': 12, 'bid_avg': 512.5},
+        'time_submitted': 1500000000 + project_id,
+        'time_updated': 1500003600 + project_id,
+        'upgrades': {'featured': False, 'sealed': False, 'nonpublic': False,
+                     'fulltime': False, 'urgent': False, 'qualified': False,
+                     'NDA': False, 'assisted': None},
+        'language': 'en',
+        'jobs': [{'id': job_id, 'name': 'Job {}'.format(job_id),
+                  'category': {'id': job_id % 9, 'name': 'Category'},
+                  'seo_url': 'job-{}'.format(job_id)}
+                 for job_id in (3, 13, 95, 292, 305)],
+        'location': {'country': {'name': 'Australia'}, 'city': 'Sydney'},
+    }
+
+
+def make_bid(bid_id):
+    return {
+        'id': bid_id,
+        'bidder_id': 2000 + bid_id % 89,
+        'project_id': 100 + bid_id % 53,
+        'retracted': False,
+        'amount': 450.0 + bid_id % 100,
+        'period': 7,
+        'description': DESCRIPTION[:600],
+        'project_owner_id': 1000 + bid_id % 97,
+        'submitdate': 1500000000 + bid_id,
+        'time_submitted': 1500000000 + bid_id,
+        'highlighted': False,
+        'sponsored': 0,
+        'milestone_percentage': 50,
+        'award_status': None,
+        'paid_status': None,
+        'complete_status': None,
+        'reputation': {'entire_history': {'overall': 4.9, 'reviews': 120}},
+        'score': 0.9,
+        'distance': None,
+        'frontend_bid_status': 'active',
+        'time_awarded': None,
+        'shortlisted': False,
+    }
+
+
+def make_user(user_id):
+    return {
+        'id': user_id,
+        'username': 'user{}'.format(user_id),
+        'display_name': 'User {}'.format(user_id),
+        'closed': False,
+        'role': 'freelancer',
+        'chosen_role': 'freelancer',
+        'location': {'country': {'name': 'Australia', 'code': 'au'},
+                     'city': 'Sydney'},
+        'avatar': '/img/unknown.png',
+        'registration_date': 1400000000 + user_id,
+        'primary_currency': {'id': 1, 'code': 'USD', 'sign': '$'},
+        'profile_description': DESCRIPTION[:800],
+        'reputation': {'entire_history': {'overall': 4.8, 'reviews': 57,
+                                          'completion_rate': 0.97}},
+        'status': {'payment_verified': True, 'email_verified': True,
+                   'identity_verified': True},
+        'jobs': [{'id': job_id, 'name': 'Job {}'.format(job_id)}
+                 for job_id in (3, 13, 95)],
+    }
+
+
+def make_message(thread_id, message_id):
+    return {
+        'id': message_id,
+        'thread_id': thread_id,
+        'from_user': 1001,
+        'message': "Let's talk",
+        'message_source': 'default_msg',
+        'time_created': 1500000000 + message_id,
+        'attachments': [],
+    }
+
+
+def _ids(params, key, default):
+    values = params.get(key)
+    if not values:
+        return list(range(1, default + 1))
+    return [int(value) for value in values]
+
+
+def _limit(params, default):
+    return int(params.get('limit', [default])[0])
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately, which Nagle's algorithm
+    # would hold back until the client's delayed ACK
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.respond('GET')
+
+    def do_POST(self):
+        self.respond('POST')
+
+    def do_PUT(self):
+        self.respond('PUT')
+
+    def respond(self, method):
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        server = self.server
+        if server.latency:
+            time.sleep(server.latency)
+        url = urlparse(self.path)
+        if server.failed():
+            status, body = 500, server.encode({
+                'status': 'error', 'message': 'Internal server error',
+                'error_code': 'InternalServerError'})
+        else:
+            status, body = server.route(method, url.path.rstrip('/'),
+                                        parse_qs(url.query))
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class MockAPIServer(ThreadingMixIn, HTTPServer):
+    """
+    A threaded HTTP server answering the projects, bids, users and messages
+    endpoints with payloads shaped like the real API's. Every response is
+    delayed by `latency` seconds, and answered with a 500 error with the
+    probability `error_rate`. Use it as a context manager, or call start()
+    and stop()
+    """
+
+    daemon_threads = True
+
+    def __init__(self, latency=0.0, error_rate=0.0, seed=0, port=0):
+        HTTPServer.__init__(self, ('127.0.0.1', port), _Handler)
+        self.latency = latency
+        self.error_rate = error_rate
+        self.requests = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._bodies = {}
+        self._thread = None
+
+    @property
+    def url(self):
+        return 'http://127.0.0.1:{}'.format(self.server_port)
+
+    def failed(self):
+        with self._lock:
+            self.requests += 1
+            return self._random.random() < self.error_rate
+
+    def encode(self, body):
+        return json.dumps(body).encode('utf-8')
+
+    def cached(self, key, build):
+        # Payloads are built once per shape, so that the server is not the
+        # bottleneck of the benchmarks
+        body = self._bodies.get(key)
+        if body is None:
+            body = self._bodies[key] = self.encode(
+                {'status': 'success', 'result': build()})
+        return body
+
+    def route(self, method, path, params):
+        parts = path.strip('/').split('/')
+        namespace, endpoint = parts[1], '/'.join(parts[3:])
+        if namespace == 'projects' and method == 'GET':
+            if endpoint == 'projects':
+                ids = _ids(params, 'projects[]', 20)
+                return 200, self.cached(('projects', tuple(ids)), lambda: {
+                    'projects': [make_project(i) for i in ids],
+                    'users': dict((str(1000 + i % 97),
+                                   make_user(1000 + i % 97)) for i in ids),
+                    'total_count': len(ids),
+                })
+            if endpoint in ('projects/all', 'projects/active'):
+                limit = _limit(params, 10)
+                return 200, self.cached(('search', limit), lambda: {
+                    'projects': [make_project(i) for i in range(1, limit + 1)],
+                    'total_count': 10000,
+                })
+            if endpoint == 'bids':
+                limit = _limit(params, 10)
+                return 200, self.cached(('bids', limit), lambda: {
+                    'bids': [make_bid(i) for i in range(1, limit + 1)],
+                    'total_count': 10000,
+                })
+        if namespace == 'users' and method == 'GET' and endpoint == 'users':
+            ids = _ids(params, 'users[]', 20)
+            return 200, self.cached(('users', tuple(ids)), lambda: {
+                'users': dict((str(i), make_user(i)) for i in ids),
+            })
+        if namespace == 'messages' and method == 'POST' and \
+                len(parts) == 6 and parts[3] == 'threads':
+            thread_id = int(parts[4])
+            return 200, self.cached(('message', thread_id), lambda: (
+                make_message(thread_id, 9000 + thread_id)))
+        return 404, self.encode({'status': 'error', 'message': 'Not found',
+                                 'error_code': 'NotFound'})
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+def _serve(latency, error_rate, seed, ports):
+    server = MockAPIServer(latency=latency, error_rate=error_rate, seed=seed)
+    ports.put(server.server_port)
+    server.serve_forever()
+
+
+class ServerProcess(object):
+    """
+    A MockAPIServer run in a child process, so that it does not compete
+    with the client being measured for the GIL
+    """
+
+    def __init__(self, latency=0.0, error_rate=0.0, seed=0):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.seed = seed
+        self.port = None
+        self._process = None
+
+    @property
+    def url(self):
+        return 'http://127.0.0.1:{}'.format(self.port)
+
+    def start(self):
+        ports = multiprocessing.Queue()
+        self._process = multiprocessing.Process(
+            target=_serve, args=(self.latency, self.error_rate, self.seed,
+                                 ports))
+        self._process.daemon = True
+        self._process.start()
+        self.port = ports.get(timeout=30)
+        return self
+
+    def stop(self):
+        self._process.terminate()
+        self._process.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
@@ -0,0 +1,25 @@
+from freelancersdk.session import Session
+from freelancersdk.resources.projects import apply_bid_actions
+import os
+
+
+# https://developers.freelancer.com/docs/use-cases/performing-a-bid-action
+def sample_apply_bid_actions():
+    oauth_token = os.environ.get('FLN_OAUTH_TOKEN')
+    url = os.environ.get('FLN_URL')
+    session = Session(oauth_token=oauth_token, url=url)
+
+    actions = [
+        ('highlight', 1),
+        ('revoke', 2),
+        ('retract', 3),
+    ]
+    return apply_bid_actions(session, actions, max_workers=4)
+
+
+for outcome in sample_apply_bid_actions():
+    action, bid_id = outcome.item
+    if outcome.ok:
+        print(('Bid %s %s: %s' % (bid_id, action, outcome.result)))
+    else:
+        print(('Bid %s %s failed: %s' % (bid_id, action, outcome.exception)))
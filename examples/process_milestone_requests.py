@@ -0,0 +1,34 @@
+from freelancersdk.resources.projects import process_milestone_requests
+from freelancersdk.session import Session
+import os
+
+
+# https://www.freelancer.com/api/docs/use-cases/milestone-actions
+def sample_process_milestone_requests():
+    url = os.environ.get('FLN_URL')
+    oauth_token = os.environ.get('FLN_OAUTH_TOKEN')
+
+    session = Session(oauth_token=oauth_token, url=url)
+    milestone_requests = [
+        {'id': 1, 'amount': 10},
+        {'id': 2, 'amount': 5000},
+        {'id': 3, 'amount': 0},
+    ]
+
+    def decide(milestone_request):
+        if milestone_request['amount'] == 0:
+            return 'delete'
+        if milestone_request['amount'] > 1000:
+            return 'reject'
+        return 'accept'
+
+    return process_milestone_requests(session, milestone_requests, decide,
+                                      max_workers=8)
+
+
+report = sample_process_milestone_requests()
+for outcome in report.outcomes:
+    print(('Milestone request %s: %s' % (outcome.item['id'],
+                                         outcome.status)))
+print(('Counts: %s' % report.counts()))
+print(('Latency: %s' % report.latency()))
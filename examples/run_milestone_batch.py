@@ -0,0 +1,34 @@
+from freelancersdk.resources.projects import (
+    create_milestone_operation, run_milestone_batch,
+)
+from freelancersdk.resources.projects.types import MilestoneReason
+from freelancersdk.session import Session
+import os
+
+
+# https://www.freelancer.com/api/docs/use-cases/milestone-actions
+def sample_run_milestone_batch():
+    url = os.environ.get('FLN_URL')
+    oauth_token = os.environ.get('FLN_OAUTH_TOKEN')
+
+    session = Session(oauth_token=oauth_token, url=url)
+    operations = [
+        create_milestone_operation(
+            'create', project_id=201, bidder_id=101, amount=10,
+            reason=MilestoneReason.PARTIAL_PAYMENT.value,
+            description='Payroll'),
+        create_milestone_operation('release', milestone_id=1, amount=10),
+        create_milestone_operation('cancel', milestone_id=2),
+    ]
+    # Run again with the same checkpoint after an interruption: operations
+    # already applied are not sent twice
+    return run_milestone_batch(session, operations,
+                               checkpoint='milestones.jsonl')
+
+
+for outcome in sample_run_milestone_batch():
+    if outcome.ok:
+        print(('Milestone %s: %s' % (outcome.item['action'], outcome.result)))
+    else:
+        print(('Milestone %s failed: %s' % (outcome.item['action'],
+                                            outcome.exception)))
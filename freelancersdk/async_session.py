@@ -0,0 +1,305 @@
+"""
+This module contains an asyncio based session to the freelancer.com API.
+It requires Python 3 and the aiohttp package
+"""
+
+import asyncio
+import functools
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from freelancersdk.batch import Outcome
+from freelancersdk.cache import ResponseCache
+from freelancersdk.compression import Compression
+from freelancersdk.conditional import ConditionalRequests
+from freelancersdk.exceptions import AuthTokenNotSuppliedException
+from freelancersdk.instrumentation import Instrumentation
+from freelancersdk.ratelimit import RateLimiter
+from freelancersdk.retry import RetryPolicy
+from freelancersdk.session import BaseSession, BufferedResponse
+from freelancersdk.tracing import (
+    current_span, function_span, send_span, trace_decode,
+)
+
+
+def _encode_values(data):
+    # Flatten a dict the same way requests does, so list values such as
+    # {'projects[]': [1, 2]} become repeated keys
+    if data is None:
+        return None
+    if not isinstance(data, dict):
+        return data
+    fields = []
+    for key, values in data.items():
+        if isinstance(values, (str, bytes)) or \
+                not hasattr(values, '__iter__'):
+            values = [values]
+        for value in values:
+            if value is not None:
+                fields.append((key, str(value)))
+    return fields
+
+
+def _multipart(data, files):
+    form = aiohttp.FormData()
+    for key, value in _encode_values(data) or []:
+        form.add_field(key, value)
+    for key, (file_name, file_object) in files:
+        form.add_field(key, file_object, filename=file_name)
+    return form
+
+
+class AsyncSession(BaseSession):
+    """
+    This class will manage an asyncio HTTP session to the freelancer.com API.
+    The resource functions in the async_* modules take it in place of a
+    Session. Its middleware must be coroutine functions.
+
+    `connection_limit` caps the number of open connections, in total and
+    per host with `connection_limit_per_host` (0 means no limit). Idle
+    connections are kept alive for `keepalive_timeout` seconds.
+    """
+
+    def __init__(self, oauth_token=None, url='https://www.freelancer.com',
+                 connection_limit=100, connection_limit_per_host=0,
+                 keepalive_timeout=15, middlewares=None, json_loads=None,
+                 tracer=None):
+        if not oauth_token:
+            raise AuthTokenNotSuppliedException('OAuth token not supplied')
+        if aiohttp is None:
+            raise ImportError('AsyncSession requires the aiohttp package')
+        super(AsyncSession, self).__init__(url, middlewares=middlewares,
+                                           json_loads=json_loads,
+                                           tracer=tracer)
+
+        # The aiohttp session must be created from within the event loop,
+        # so it is only created on the first request
+        self.session = None
+        self.connector_options = {
+            'limit': connection_limit,
+            'limit_per_host': connection_limit_per_host,
+            'keepalive_timeout': keepalive_timeout,
+        }
+
+        # Set default headers
+        self.headers = {'Freelancer-OAuth-V1': oauth_token,
+                        'User-Agent': 'Freelancer.com SDK',
+                        }
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def send(self, request):
+        """
+        Send the request and read the response body
+        """
+        if self.session is None:
+            trace_configs = []
+            if self.tracer is not None:
+                trace_configs.append(_connect_trace_config())
+            connector = aiohttp.TCPConnector(**self.connector_options)
+            self.session = aiohttp.ClientSession(connector=connector,
+                                                 headers=self.headers,
+                                                 trace_configs=trace_configs)
+
+        options = dict(request.options)
+        files = options.pop('files', None)
+        if files:
+            options['data'] = _multipart(options.get('data'), files)
+        else:
+            options['data'] = _encode_values(options.get('data'))
+        options['params'] = _encode_values(options.get('params'))
+
+        if self.tracer is None:
+            return await self._send(request, options)
+        with send_span(self.tracer, request) as span:
+            response = await self._send(request, options, span)
+            span.set_attribute('http.status_code', response.status_code)
+        trace_decode(self.tracer, response)
+        return response
+
+    async def _send(self, request, options, span=None):
+        async with self.session.request(request.method, request.url,
+                                        **options) as response:
+            if span is not None:
+                # The response headers have arrived
+                wait = self.tracer.start_span('wait', parent=span,
+                                              start_time=span.start_time)
+                wait.end()
+            content = await response.read()
+            return BufferedResponse(response.status, content,
+                                    headers=response.headers,
+                                    url=str(response.url),
+                                    encoding=response.charset,
+                                    loads=self.json_loads)
+
+
+def _connect_trace_config():
+    # Records a connect span for each new connection aiohttp opens
+    config = aiohttp.TraceConfig()
+
+    async def start(session, context, params):
+        span = current_span()
+        context.span = None
+        if span is not None:
+            context.span = span.tracer.start_span('connect', parent=span)
+
+    async def end(session, context, params):
+        if context.span is not None:
+            context.span.end()
+
+    config.on_connection_create_start.append(start)
+    config.on_connection_create_end.append(end)
+    return config
+
+
+def traced_async(func):
+    """
+    tracing.traced for the coroutine functions of the async_* modules
+    """
+    start = function_span(func)
+
+    @functools.wraps(func)
+    async def wrapper(session, *args, **kwargs):
+        tracer = getattr(session, 'tracer', None)
+        if tracer is None:
+            return await func(session, *args, **kwargs)
+        with start(tracer, args, kwargs):
+            return await func(session, *args, **kwargs)
+
+    return wrapper
+
+
+class AsyncRetryPolicy(RetryPolicy):
+    """
+    RetryPolicy for AsyncSession, which waits with asyncio.sleep
+    """
+
+    def __init__(self, sleep=asyncio.sleep, **kwargs):
+        super(AsyncRetryPolicy, self).__init__(sleep=sleep, **kwargs)
+
+    def should_retry_error(self, request, error):
+        if isinstance(error, aiohttp.ClientConnectorError):
+            return True
+        if isinstance(error, (aiohttp.ClientError, asyncio.TimeoutError)):
+            return self.is_idempotent(request)
+        return False
+
+    async def __call__(self, request, send):
+        retry = 0
+        while True:
+            try:
+                response = await send(request)
+            except Exception as e:
+                if retry >= self.max_retries or \
+                        not self.should_retry_error(request, e):
+                    raise
+                delay = self.backoff(retry)
+            else:
+                if retry >= self.max_retries or \
+                        not self.should_retry_status(request,
+                                                     response.status_code):
+                    return response
+                delay = self.backoff(retry, response)
+            retry += 1
+            request.context['retries'] = retry
+            await self.sleep(delay)
+
+
+class AsyncRateLimiter(RateLimiter):
+    """
+    RateLimiter for AsyncSession, which waits with asyncio.sleep
+    """
+
+    def __init__(self, sleep=asyncio.sleep, **kwargs):
+        super(AsyncRateLimiter, self).__init__(sleep=sleep, **kwargs)
+
+    async def __call__(self, request, send):
+        wait = self.bucket(request.namespace).reserve()
+        if wait > 0:
+            await self.sleep(wait)
+        response = await send(request)
+        self.throttle(request, response)
+        return response
+
+
+class AsyncResponseCache(ResponseCache):
+    """
+    ResponseCache for AsyncSession
+    """
+
+    async def __call__(self, request, send):
+        key, cached = self.lookup(request)
+        if cached is not None:
+            return cached
+        return self.store(key, request, await send(request))
+
+
+class AsyncConditionalRequests(ConditionalRequests):
+    """
+    ConditionalRequests for AsyncSession
+    """
+
+    async def __call__(self, request, send):
+        key = self.prepare(request)
+        return self.process(key, await send(request))
+
+
+class AsyncCompression(Compression):
+    """
+    Compression for AsyncSession. aiohttp decodes the response, so the
+    compressed size is taken from its Content-Length
+    """
+
+    async def __call__(self, request, send):
+        self.prepare(request)
+        response = await send(request)
+        self.measure(request, response)
+        return response
+
+
+class AsyncInstrumentation(Instrumentation):
+    """
+    Instrumentation for AsyncSession
+    """
+
+    async def __call__(self, request, send):
+        if not self.enabled:
+            return await send(request)
+        started = self.start(request)
+        try:
+            response = await send(request)
+        except Exception:
+            self.finish(request, None, started)
+            raise
+        self.finish(request, response, started)
+        return response
+
+
+async def run_batch_async(func, items, max_concurrency=4):
+    """
+    Await `func(item)` for every item with at most `max_concurrency` calls
+    in flight and return their Outcomes in the order of the items, like
+    batch.run_batch
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def call(item):
+        async with semaphore:
+            try:
+                return Outcome(item, result=await func(item))
+            except Exception as e:
+                return Outcome(item, exception=e)
+
+    return await asyncio.gather(*[call(item) for item in items])
@@ -0,0 +1,130 @@
+"""
+This module contains helpers to run many API calls as one batch
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import contextvars
+except ImportError:
+    contextvars = None
+
+try:
+    from urllib import urlencode
+except ImportError:
+    from urllib.parse import urlencode
+
+# Keeps the whole URL well below the 8KB limit of common proxies
+MAX_QUERY_LENGTH = 4000
+
+
+class Outcome(object):
+    """
+    The outcome of one item of a batch: either the `result` of the call or
+    the `exception` it raised
+    """
+
+    def __init__(self, item, result=None, exception=None):
+        self.item = item
+        self.result = result
+        self.exception = exception
+
+    @property
+    def ok(self):
+        return self.exception is None
+
+    def __repr__(self):
+        if self.ok:
+            return '<Outcome {!r}: ok>'.format(self.item)
+        return '<Outcome {!r}: {!r}>'.format(self.item, self.exception)
+
+
+def submit(executor, func, *args):
+    """
+    Submit `func(*args)` to the executor, run in a copy of the caller's
+    context so that the spans it starts keep the caller's span as parent
+    """
+    if contextvars is None:
+        return executor.submit(func, *args)
+    return executor.submit(contextvars.copy_context().run, func, *args)
+
+
+def run_batch(func, items, max_workers=4):
+    """
+    Call `func(item)` for every item on up to `max_workers` threads and
+    return their Outcomes in the order of the items. An item failing does
+    not stop the others
+    """
+    def call(item):
+        try:
+            return Outcome(item, result=func(item))
+        except Exception as e:
+            return Outcome(item, exception=e)
+
+    items = list(items)
+    if max_workers <= 1 or len(items) <= 1:
+        return [call(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as ex:
+        futures = [submit(ex, call, item) for item in items]
+        return [future.result() for future in futures]
+
+
+def unique(values):
+    """
+    Return the values without duplicates, in the order they first appear
+    """
+    seen = set()
+    return [v for v in values if not (v in seen or seen.add(v))]
+
+
+def chunk_query(query, key, max_length=MAX_QUERY_LENGTH, max_values=None):
+    """
+    Split the list of values under `key`, e.g. 'projects[]', across as many
+    copies of the query as needed to keep every encoded query string within
+    `max_length` characters and `max_values` values
+    """
+    rest = dict(query)
+    values = rest.pop(key, None) or []
+    base = len(urlencode(rest, doseq=True)) + 1
+    chunks = []
+    chunk, length = [], base
+    for value in values:
+        size = len(urlencode({key: value})) + 1
+        if chunk and (length + size > max_length or
+                      (max_values and len(chunk) >= max_values)):
+            chunks.append(chunk)
+            chunk, length = [], base
+        chunk.append(value)
+        length += size
+    if chunk:
+        chunks.append(chunk)
+    queries = []
+    for chunk in chunks:
+        chunk_query = dict(rest)
+        chunk_query[key] = chunk
+        queries.append(chunk_query)
+    return queries
+
+
+def merge_results(results):
+    """
+    Merge the results of several calls to one list endpoint: lists, e.g.
+    'projects', are concatenated, maps, e.g. 'users', are combined and the
+    'total_count' of the calls are added up
+    """
+    merged = {}
+    for result in results:
+        for key, value in result.items():
+            current = merged.get(key)
+            if isinstance(value, (list, dict)):
+                if current is None:
+                    merged[key] = current = type(value)()
+                if isinstance(value, list):
+                    current.extend(value)
+                else:
+                    current.update(value)
+            elif key == 'total_count' and current is not None:
+                merged[key] = current + value
+            elif current is None:
+                merged[key] = value
+    return merged
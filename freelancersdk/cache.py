@@ -0,0 +1,315 @@
+"""
+This module contains the response cache middleware for Session
+"""
+
+import fnmatch
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from freelancersdk.session import BufferedResponse
+
+_monotonic = getattr(time, 'monotonic', time.time)
+
+# Time to live in seconds of responses which rarely change, by
+# (namespace, endpoint). Endpoints may contain shell-style wildcards
+DEFAULT_TTLS = {
+    ('projects', 'jobs'): 24 * 3600,
+    ('users', 'self'): 3600,
+}
+
+_Entry = namedtuple('_Entry', 'expires namespace endpoint size response')
+
+
+def normalize_params(params):
+    """
+    Flatten params the way requests encodes them into a tuple of pairs
+    sorted by key. The order of the values of one key is kept, as it can
+    change the result
+    """
+    if not params:
+        return ()
+    if isinstance(params, dict):
+        params = params.items()
+    pairs = []
+    for key, values in params:
+        if isinstance(values, (list, tuple)):
+            pairs.extend((key, str(v)) for v in values if v is not None)
+        elif values is not None:
+            pairs.append((key, str(values)))
+    return tuple(sorted(pairs, key=lambda pair: pair[0]))
+
+
+class SQLiteCache(object):
+    """
+    A disk cache of responses in a SQLite database at `path`, which can be
+    shared by threads and processes and outlives them. Expired responses are
+    removed when read, and the least recently used ones once the bodies take
+    more than `max_bytes`. The database is in WAL mode so that readers don't
+    wait for writers; writers wait up to `timeout` seconds for each other.
+    """
+
+    def __init__(self, path, max_bytes=256 * 1024 * 1024, timeout=10,
+                 clock=time.time):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.clock = clock
+        self._local = threading.local()
+        self._connect().close()
+
+    def _connect(self):
+        db = sqlite3.connect(self.path, timeout=self.timeout,
+                             isolation_level=None)
+        db.execute('PRAGMA journal_mode=WAL')
+        db.execute('PRAGMA synchronous=NORMAL')
+        db.execute('CREATE TABLE IF NOT EXISTS responses ('
+                   'key TEXT PRIMARY KEY, namespace TEXT, endpoint TEXT, '
+                   'expires REAL, accessed REAL, size INTEGER, '
+                   'status INTEGER, headers TEXT, url TEXT, encoding TEXT, '
+                   'content BLOB)')
+        db.execute('CREATE INDEX IF NOT EXISTS responses_accessed '
+                   'ON responses (accessed)')
+        return db
+
+    @property
+    def db(self):
+        # One connection per thread, reopened after a fork
+        local = self._local
+        if getattr(local, 'pid', None) != os.getpid():
+            local.db = self._connect()
+            local.pid = os.getpid()
+        return local.db
+
+    def get(self, key):
+        """
+        Return the expiry time and response cached under `key`, or None
+        """
+        now = self.clock()
+        row = self.db.execute(
+            'SELECT expires, status, headers, url, encoding, content '
+            'FROM responses WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None
+        expires, status, headers, url, encoding, content = row
+        if expires <= now:
+            self.db.execute('DELETE FROM responses WHERE key = ? '
+                            'AND expires <= ?', (key, now))
+            return None
+        self.db.execute('UPDATE responses SET accessed = ? WHERE key = ?',
+                        (now, key))
+        return expires, BufferedResponse(status, bytes(content),
+                                         headers=json.loads(headers),
+                                         url=url, encoding=encoding)
+
+    def set(self, key, namespace, endpoint, expires, response):
+        """
+        Cache a response under `key` until `expires` and evict the least
+        recently used responses beyond max_bytes
+        """
+        db = self.db
+        db.execute('BEGIN IMMEDIATE')
+        try:
+            db.execute(
+                'INSERT OR REPLACE INTO responses VALUES '
+                '(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (key, namespace, endpoint, expires, self.clock(),
+                 len(response.content), response.status_code,
+                 json.dumps(dict(response.headers)), response.url,
+                 response.encoding, sqlite3.Binary(response.content)))
+            size = db.execute(
+                'SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+            if size > self.max_bytes:
+                for evicted, entry_size in db.execute(
+                        'SELECT key, size FROM responses '
+                        'ORDER BY accessed').fetchall():
+                    db.execute('DELETE FROM responses WHERE key = ?',
+                               (evicted,))
+                    size -= entry_size
+                    if size <= self.max_bytes:
+                        break
+            db.execute('COMMIT')
+        except Exception:
+            db.execute('ROLLBACK')
+            raise
+
+    def invalidate(self, namespace=None, endpoint=None):
+        """
+        Remove the responses of a namespace, optionally only those of the
+        endpoints matching `endpoint`
+        """
+        query, args = 'DELETE FROM responses WHERE 1', []
+        if namespace is not None:
+            query += ' AND namespace = ?'
+            args.append(namespace)
+        if endpoint is not None:
+            query += ' AND endpoint GLOB ?'
+            args.append(endpoint)
+        self.db.execute(query, args)
+
+    def clear(self):
+        self.db.execute('DELETE FROM responses')
+
+    def close(self):
+        db = getattr(self._local, 'db', None)
+        if db is not None:
+            db.close()
+            self._local.db = None
+            self._local.pid = None
+
+
+class ResponseCache(object):
+    """
+    Middleware which caches successful GET responses in memory.
+
+    Responses live for `ttl` seconds, or for the time set in `ttls` for
+    their (namespace, endpoint), e.g. {('users', 'self'): 3600}; a time of
+    0 disables caching for that endpoint. The least recently used responses
+    are evicted once the cached bodies take more than `max_bytes`.
+
+    Responses missing from memory are looked up in `disk`, e.g. a
+    SQLiteCache, if given, and successful responses are written to both.
+
+    Requests are keyed on their URL, params and headers, but not on the
+    session's OAuth token, so every session needs a cache of its own and
+    only sessions of the same user may share a disk cache.
+    """
+
+    def __init__(self, ttl=60, ttls=DEFAULT_TTLS, max_bytes=16 * 1024 * 1024,
+                 disk=None, clock=_monotonic):
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.max_bytes = max_bytes
+        self.disk = disk
+        self.clock = clock
+        self.size = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def ttl_for(self, request):
+        for (namespace, endpoint), ttl in self.ttls.items():
+            if namespace == request.namespace and \
+                    fnmatch.fnmatchcase(request.endpoint, endpoint):
+                return ttl
+        return self.ttl
+
+    def key(self, request):
+        options = request.options
+        return (request.url, normalize_params(options.get('params')),
+                normalize_params(options.get('headers')))
+
+    def lookup(self, request):
+        """
+        Return the cache key of a request and its cached response, if any.
+        The key is None for requests which are not cached
+        """
+        if request.method != 'GET' or self.ttl_for(request) <= 0:
+            return None, None
+        key = self.key(request)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.expires > self.clock():
+                    self._entries[key] = self._entries.pop(key)
+                    self.hits += 1
+                    return key, entry.response
+                self._remove(key)
+        if self.disk is not None:
+            found = self.disk.get(json.dumps(key))
+            if found is not None:
+                expires, response = found
+                ttl = expires - self.disk.clock()
+                with self._lock:
+                    self._put(key, request, ttl, response)
+                    self.hits += 1
+                    self.disk_hits += 1
+                return key, response
+        with self._lock:
+            self.misses += 1
+        return key, None
+
+    def store(self, key, request, response):
+        """
+        Cache a successful response to a request looked up under `key` and
+        return it
+        """
+        if key is None or response.status_code != 200:
+            return response
+        cached = BufferedResponse(response.status_code, response.content,
+                                  headers=response.headers, url=response.url,
+                                  encoding=response.encoding)
+        ttl = self.ttl_for(request)
+        if self.disk is not None:
+            self.disk.set(json.dumps(key), request.namespace,
+                          request.endpoint, self.disk.clock() + ttl, cached)
+        with self._lock:
+            self._put(key, request, ttl, cached)
+        return response
+
+    def _put(self, key, request, ttl, response):
+        size = len(response.content)
+        if key in self._entries:
+            self._remove(key)
+        if size > self.max_bytes:
+            return
+        self._entries[key] = _Entry(self.clock() + ttl, request.namespace,
+                                    request.endpoint, size, response)
+        self.size += size
+        while self.size > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _remove(self, key):
+        self.size -= self._entries.pop(key).size
+
+    def invalidate(self, namespace=None, endpoint=None):
+        """
+        Remove the cached responses of a namespace, e.g. 'users', optionally
+        only those of endpoints matching `endpoint`, e.g. 'self' or 'bids/*'.
+        Without arguments, all responses are removed
+        """
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                if namespace is not None and entry.namespace != namespace:
+                    continue
+                if endpoint is not None and \
+                        not fnmatch.fnmatchcase(entry.endpoint, endpoint):
+                    continue
+                self._remove(key)
+        if self.disk is not None:
+            self.disk.invalidate(namespace, endpoint)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+        if self.disk is not None:
+            self.disk.clear()
+
+    def stats(self):
+        """
+        Return the number of hits, of which disk hits, misses and evictions
+        and the number and size in bytes of the responses cached in memory
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self.size,
+            }
+
+    def __call__(self, request, send):
+        key, cached = self.lookup(request)
+        if cached is not None:
+            return cached
+        return self.store(key, request, send(request))
@@ -0,0 +1,140 @@
+"""
+This module contains the compression middleware for Session
+"""
+
+import json
+import threading
+import zlib
+
+try:
+    from urllib3.util.request import ACCEPT_ENCODING
+except ImportError:
+    ACCEPT_ENCODING = 'gzip,deflate'
+
+# Preferred content encodings, best first
+ENCODINGS = ('zstd', 'br', 'gzip', 'deflate')
+
+
+def accept_encoding():
+    """
+    Return the Accept-Encoding header for the content encodings that can be
+    decoded here, best first. Brotli and Zstandard need the brotli and
+    zstandard packages
+    """
+    available = set(e.strip() for e in ACCEPT_ENCODING.split(','))
+    return ', '.join(e for e in ENCODINGS if e in available)
+
+
+def gzip_compress(data, level=6):
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+def wire_size(response):
+    """
+    Return the number of body bytes of a response as received, before
+    decompression, or None if unknown
+    """
+    raw = getattr(response, 'raw', None)
+    try:
+        size = raw.tell()
+    except (AttributeError, ValueError):
+        size = None
+    if isinstance(size, int):
+        return size
+    length = response.headers.get('Content-Length')
+    if length and length.isdigit():
+        return int(length)
+    return None
+
+
+class Compression(object):
+    """
+    Middleware which asks for the best compressed response encoding
+    available and counts the bytes received per endpoint family, as sent
+    (compressed) and after decoding (uncompressed).
+
+    With `compress_requests`, JSON request bodies of at least
+    `min_request_size` bytes, e.g. from bulk create_project calls, are sent
+    gzip compressed. Only enable it if the server accepts
+    Content-Encoding: gzip request bodies.
+
+    The counts of each request are also left in request.context as
+    'compressed_bytes', 'uncompressed_bytes' and 'content_encoding'.
+    """
+
+    def __init__(self, compress_requests=False, min_request_size=1024,
+                 level=6):
+        self.compress_requests = compress_requests
+        self.min_request_size = min_request_size
+        self.level = level
+        self.accept_encoding = accept_encoding()
+        self.counts = {}
+        self._lock = threading.Lock()
+
+    def prepare(self, request):
+        """
+        Add the Accept-Encoding header to a request and compress its body
+        """
+        options = dict(request.options)
+        headers = dict(options.get('headers') or {})
+        headers['Accept-Encoding'] = self.accept_encoding
+        body = options.get('json')
+        if self.compress_requests and body is not None:
+            data = json.dumps(body).encode('utf-8')
+            if len(data) >= self.min_request_size:
+                del options['json']
+                options['data'] = gzip_compress(data, self.level)
+                headers['Content-Type'] = 'application/json'
+                headers['Content-Encoding'] = 'gzip'
+                request.context['request_bytes'] = len(data)
+                request.context['compressed_request_bytes'] = \
+                    len(options['data'])
+        options['headers'] = headers
+        request.options = options
+
+    def measure(self, request, response):
+        """
+        Count the compressed and uncompressed bytes of a response
+        """
+        if request.options.get('stream'):
+            # The body has not been read yet
+            return
+        uncompressed = len(response.content or b'')
+        compressed = wire_size(response)
+        if compressed is None:
+            compressed = uncompressed
+        encoding = response.headers.get('Content-Encoding', 'identity')
+        request.context['compressed_bytes'] = compressed
+        request.context['uncompressed_bytes'] = uncompressed
+        request.context['content_encoding'] = encoding
+        with self._lock:
+            counts = self.counts.setdefault(request.namespace, {
+                'responses': 0, 'compressed_bytes': 0,
+                'uncompressed_bytes': 0,
+            })
+            counts['responses'] += 1
+            counts['compressed_bytes'] += compressed
+            counts['uncompressed_bytes'] += uncompressed
+
+    def stats(self):
+        """
+        Return the number of responses and their compressed and uncompressed
+        bytes, in total and per endpoint family
+        """
+        with self._lock:
+            families = dict((family, dict(counts))
+                            for family, counts in self.counts.items())
+        total = {'responses': 0, 'compressed_bytes': 0,
+                 'uncompressed_bytes': 0}
+        for counts in families.values():
+            for key in total:
+                total[key] += counts[key]
+        total['families'] = families
+        return total
+
+    def __call__(self, request, send):
+        self.prepare(request)
+        response = send(request)
+        self.measure(request, response)
+        return response
@@ -0,0 +1,143 @@
+"""
+This module contains the conditional request middleware for Session
+"""
+
+import threading
+from collections import OrderedDict
+
+from freelancersdk.cache import normalize_params
+from freelancersdk.session import BufferedResponse
+
+
+class NotModified(dict):
+    """
+    The result of a request which the server answered with 304 Not
+    Modified. It holds the same data as the previous result
+    """
+    not_modified = True
+
+
+def not_modified(result):
+    """
+    Whether a result is unchanged since the previous request
+    """
+    return getattr(result, 'not_modified', False)
+
+
+class _Validated(object):
+    # The validators of a response and its body, which is parsed the first
+    # time the server tells us it has not changed
+
+    def __init__(self, response):
+        self.etag = response.headers.get('ETag')
+        self.last_modified = response.headers.get('Last-Modified')
+        self.response = BufferedResponse(
+            response.status_code, response.content, headers=response.headers,
+            url=response.url, encoding=response.encoding)
+        self._body = None
+        self._lock = threading.Lock()
+
+    def body(self):
+        with self._lock:
+            if self._body is None:
+                self._body = self.response.json()
+            return self._body
+
+
+class NotModifiedResponse(BufferedResponse):
+    """
+    The previous response to a request, returned in place of a 304 Not
+    Modified response. Its json() gives the previously parsed body, whose
+    dict result is a NotModified
+    """
+    not_modified = True
+
+    def __init__(self, validated):
+        previous = validated.response
+        super(NotModifiedResponse, self).__init__(
+            previous.status_code, previous.content, headers=previous.headers,
+            url=previous.url, encoding=previous.encoding)
+        self._validated = validated
+
+    def json(self):
+        body = dict(self._validated.body())
+        if isinstance(body.get('result'), dict):
+            body['result'] = NotModified(body['result'])
+        return body
+
+
+class ConditionalRequests(object):
+    """
+    Middleware which remembers the ETag and Last-Modified headers of GET
+    responses and sends them back as If-None-Match and If-Modified-Since
+    when the same request is made again, e.g. when polling get_projects or
+    get_bids.
+
+    When the server answers 304 Not Modified, the previous response is
+    returned instead, without parsing its body again. The resource function
+    then returns a NotModified result; use `not_modified(result)` to tell.
+    The validators of the `max_entries` most recent requests are kept.
+    """
+
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(self, request):
+        return (request.url, normalize_params(request.options.get('params')))
+
+    def prepare(self, request):
+        """
+        Add the conditional headers to a request and return its key, which
+        is None for requests that are not conditional
+        """
+        if request.method != 'GET':
+            return None
+        key = self.key(request)
+        with self._lock:
+            validated = self._entries.get(key)
+        if validated is not None:
+            headers = dict(request.options.get('headers') or {})
+            if validated.etag:
+                headers['If-None-Match'] = validated.etag
+            if validated.last_modified:
+                headers['If-Modified-Since'] = validated.last_modified
+            request.options = dict(request.options, headers=headers)
+        return key
+
+    def process(self, key, response):
+        """
+        Remember the validators of a response, or replace a 304 response
+        with the previous one
+        """
+        if key is None:
+            return response
+        if response.status_code == 304:
+            with self._lock:
+                validated = self._entries.get(key)
+                if validated is not None:
+                    self._entries[key] = self._entries.pop(key)
+            if validated is None:
+                return response
+            return NotModifiedResponse(validated)
+        if response.status_code == 200:
+            validated = None
+            if response.headers.get('ETag') or \
+                    response.headers.get('Last-Modified'):
+                validated = _Validated(response)
+            with self._lock:
+                self._entries.pop(key, None)
+                if validated is not None:
+                    self._entries[key] = validated
+                    while len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+        return response
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __call__(self, request, send):
+        key = self.prepare(request)
+        return self.process(key, send(request))
@@ -0,0 +1,144 @@
+"""
+This module contains the JSON decoding helpers for sessions: the choice of
+a fast decoder and an incremental parser for large list results
+"""
+
+import codecs
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+# Size of the chunks streamed responses are read in
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_decoder = json.JSONDecoder()
+
+_WHITESPACE = ' \t\n\r'
+
+
+def fastest_loads():
+    """
+    Return the fastest JSON decoder installed, orjson or ujson, falling back
+    to the standard library. Pass it as a session's `json_loads`
+    """
+    if orjson is not None:
+        return orjson.loads
+    if ujson is not None:
+        return ujson.loads
+    return json.loads
+
+
+def decode_json(response, loads):
+    """
+    Decode the body of a response with `loads`, which is given the raw
+    bytes. Decoders such as orjson read UTF-8 bytes directly
+    """
+    return loads(response.content)
+
+
+class _Reader(object):
+    # A text buffer over a stream of byte chunks which JSON values are
+    # decoded from one at a time
+
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.text = codecs.getincrementaldecoder('utf-8')()
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def read(self, size=1):
+        # Read chunks until at least `size` more characters are buffered
+        if self.pos > 65536:
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+        wanted = len(self.buffer) + size
+        while len(self.buffer) < wanted and not self.eof:
+            try:
+                chunk = next(self.chunks)
+            except StopIteration:
+                self.eof = True
+                self.buffer += self.text.decode(b'', final=True)
+            else:
+                self.buffer += self.text.decode(chunk)
+        return len(self.buffer) >= wanted
+
+    def peek(self):
+        while True:
+            while self.pos < len(self.buffer):
+                if self.buffer[self.pos] not in _WHITESPACE:
+                    return self.buffer[self.pos]
+                self.pos += 1
+            if not self.read():
+                return None
+
+    def expect(self, chars):
+        char = self.peek()
+        if char is None or char not in chars:
+            raise ValueError('Expected {!r} at offset {} of the JSON '
+                             'document, found {!r}'.format(
+                                 chars, self.pos, char))
+        self.pos += 1
+        return char
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+            except ValueError:
+                if self.eof:
+                    raise
+                # Read at least as much again as the incomplete value, so
+                # that a large value is not decoded over and over
+                self.read(max(len(self.buffer) - self.pos, 4096))
+                continue
+            # A number at the end of the buffer may continue in the next
+            # chunk
+            if end == len(self.buffer) and not self.eof:
+                self.read()
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_array(chunks, path):
+    """
+    Yield the items of the array found at `path`, e.g. ('result',
+    'projects'), of a JSON document read in byte chunks. Items are decoded
+    one at a time as their data arrives, so the whole document is never
+    held in memory. Values before the array at other keys are skipped.
+    Nothing is yielded if the path is missing or null
+    """
+    reader = _Reader(chunks)
+    for key in path:
+        if reader.peek() == 'n':
+            return
+        reader.expect('{')
+        if reader.peek() == '}':
+            return
+        while True:
+            name = reader.value()
+            reader.expect(':')
+            if name == key:
+                break
+            reader.value()
+            if reader.expect(',}') == '}':
+                return
+    if reader.peek() == 'n':
+        return
+    reader.expect('[')
+    if reader.peek() == ']':
+        return
+    while True:
+        yield reader.value()
+        if reader.expect(',]') == ']':
+            return
@@ -0,0 +1,267 @@
+"""
+This module contains the instrumentation middleware for Session: request
+hooks, latency histograms and counters per endpoint
+"""
+
+import json
+import math
+import threading
+import time
+
+try:
+    from urllib import urlencode
+except ImportError:
+    from urllib.parse import urlencode
+
+_clock = getattr(time, 'perf_counter', time.time)
+
+# Upper bounds of the latency histogram buckets, in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+                   10.0)
+
+
+def endpoint_label(endpoint):
+    """
+    Return an endpoint with its ids replaced, e.g. threads/{id}/messages
+    for threads/123/messages/, so that all calls to it are counted together
+    """
+    return '/'.join('{id}' if part.isdigit() else part
+                    for part in endpoint.strip('/').split('/'))
+
+
+def _body_size(options):
+    # The size of the body as requests encodes it: `json` bodies are dumped
+    # with the default separators and form `data` is url encoded
+    data = options.get('data')
+    if data is None and options.get('json') is not None:
+        data = json.dumps(options['json'])
+    elif isinstance(data, (dict, list, tuple)):
+        data = urlencode(data, doseq=True)
+    if isinstance(data, bytes):
+        return len(data)
+    if isinstance(data, str):
+        return len(data.encode('utf-8'))
+    return 0
+
+
+def percentile(values, q):
+    """
+    Return the nearest-rank q-quantile of a non-empty list of values, e.g.
+    q=0.99 for the p99
+    """
+    ordered = sorted(values)
+    # Rounded first so that e.g. 0.07 * 100 does not reach rank 8
+    rank = int(math.ceil(round(q * len(ordered), 9))) - 1
+    return ordered[min(max(rank, 0), len(ordered) - 1)]
+
+
+class Histogram(object):
+    """
+    Counts of observed values by bucket upper bound, with their sum
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        i = 0
+        for bound in self.buckets:
+            if value <= bound:
+                break
+            i += 1
+        self.counts[i] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        """
+        Return (upper bound, count of values up to it) pairs, ending with
+        the total count at +Inf
+        """
+        pairs = []
+        total = 0
+        for bound, count in zip(self.buckets + (float('inf'),),
+                                self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+    def quantile(self, q):
+        """
+        Return the upper bound of the bucket the q-quantile falls in
+        """
+        rank = q * self.count
+        for bound, total in self.cumulative():
+            if total >= rank and total:
+                return bound
+        return None
+
+
+class _Metrics(object):
+    # The measurements of one endpoint
+
+    def __init__(self, buckets):
+        self.latency = Histogram(buckets)
+        self.statuses = {}
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+
+def _sample(name, labels, value):
+    return '{}{{{}}} {}'.format(name, ','.join(
+        '{}="{}"'.format(label, text) for label, text in labels), value)
+
+
+def _format_bound(bound):
+    return '+Inf' if bound == float('inf') else repr(float(bound))
+
+
+class Instrumentation(object):
+    """
+    Middleware which times requests and counts their status codes and
+    payload sizes per endpoint, e.g. projects bids/{id}, and runs hooks
+    around them.
+
+    Hooks added with `before_request` are called with the request before
+    it is sent. Hooks added with `after_request` are called with the
+    request, the response (None if sending raised) and the time taken in
+    seconds. Set `enabled` to False to turn it all off, leaving only an
+    attribute check per request.
+
+    `stats()` returns the measurements and `export()` them in the
+    Prometheus text format. Add it first to time retries and rate limiting
+    waits as part of the call, or last to time single attempts.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, enabled=True,
+                 clock=_clock):
+        self.buckets = tuple(buckets)
+        self.enabled = enabled
+        self.clock = clock
+        self.before_hooks = []
+        self.after_hooks = []
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def before_request(self, hook):
+        """
+        Add a hook called as hook(request) before each request. Returns the
+        hook, so it can be used as a decorator
+        """
+        self.before_hooks.append(hook)
+        return hook
+
+    def after_request(self, hook):
+        """
+        Add a hook called as hook(request, response, seconds) after each
+        request. Returns the hook, so it can be used as a decorator
+        """
+        self.after_hooks.append(hook)
+        return hook
+
+    def start(self, request):
+        for hook in self.before_hooks:
+            hook(request)
+        return self.clock()
+
+    def finish(self, request, response, started):
+        """
+        Record a request which was sent at `started`, given its response or
+        None if it failed
+        """
+        elapsed = self.clock() - started
+        if response is None:
+            status = 'error'
+            size = 0
+        else:
+            status = str(response.status_code)
+            size = 0
+            if not request.options.get('stream'):
+                size = len(response.content or b'')
+        key = (request.method, request.namespace,
+               endpoint_label(request.endpoint))
+        with self._lock:
+            metrics = self._metrics.get(key)
+            if metrics is None:
+                metrics = self._metrics[key] = _Metrics(self.buckets)
+            metrics.latency.observe(elapsed)
+            metrics.statuses[status] = metrics.statuses.get(status, 0) + 1
+            metrics.request_bytes += _body_size(request.options)
+            metrics.response_bytes += size
+        for hook in self.after_hooks:
+            hook(request, response, elapsed)
+
+    def stats(self):
+        """
+        Return a dict of the measurements by (method, namespace, endpoint)
+        """
+        stats = {}
+        with self._lock:
+            for key, metrics in self._metrics.items():
+                latency = metrics.latency
+                stats[key] = {
+                    'count': latency.count,
+                    'seconds': latency.sum,
+                    'p50': latency.quantile(0.5),
+                    'p99': latency.quantile(0.99),
+                    'statuses': dict(metrics.statuses),
+                    'request_bytes': metrics.request_bytes,
+                    'response_bytes': metrics.response_bytes,
+                }
+        return stats
+
+    def export(self, prefix='freelancersdk'):
+        """
+        Return the measurements in the Prometheus text exposition format
+        """
+        durations = prefix + '_request_duration_seconds'
+        responses = prefix + '_responses_total'
+        request_bytes = prefix + '_request_bytes_total'
+        response_bytes = prefix + '_response_bytes_total'
+        lines = dict((name, ['# TYPE {} {}'.format(name, kind)])
+                     for name, kind in ((durations, 'histogram'),
+                                        (responses, 'counter'),
+                                        (request_bytes, 'counter'),
+                                        (response_bytes, 'counter')))
+        with self._lock:
+            for key in sorted(self._metrics):
+                metrics = self._metrics[key]
+                labels = list(zip(('method', 'namespace', 'endpoint'), key))
+                for bound, total in metrics.latency.cumulative():
+                    lines[durations].append(_sample(
+                        durations + '_bucket',
+                        labels + [('le', _format_bound(bound))], total))
+                lines[durations].append(_sample(
+                    durations + '_sum', labels, repr(metrics.latency.sum)))
+                lines[durations].append(_sample(
+                    durations + '_count', labels, metrics.latency.count))
+                for status in sorted(metrics.statuses):
+                    lines[responses].append(_sample(
+                        responses, labels + [('status', status)],
+                        metrics.statuses[status]))
+                lines[request_bytes].append(_sample(
+                    request_bytes, labels, metrics.request_bytes))
+                lines[response_bytes].append(_sample(
+                    response_bytes, labels, metrics.response_bytes))
+        return '\n'.join(line for name in (durations, responses,
+                                           request_bytes, response_bytes)
+                         for line in lines[name]) + '\n'
+
+    def reset(self):
+        with self._lock:
+            self._metrics.clear()
+
+    def __call__(self, request, send):
+        if not self.enabled:
+            return send(request)
+        started = self.start(request)
+        try:
+            response = send(request)
+        except Exception:
+            self.finish(request, None, started)
+            raise
+        self.finish(request, response, started)
+        return response
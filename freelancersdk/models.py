@@ -0,0 +1,318 @@
+"""
+This module contains the base class of the objects built from the JSON
+data retrieved from the API
+"""
+
+import keyword
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+_setattr = object.__setattr__
+_getattribute = object.__getattribute__
+_MISSING = object()
+
+
+def _nested(name, slot, model):
+    # A field holding a sub-object, which is built from its JSON data the
+    # first time it is read
+    def get(self):
+        value = getattr(self, slot)
+        if type(value) is dict:
+            value = model(value)
+            _setattr(self, slot, value)
+        return value
+
+    def set(self, value):
+        _setattr(self, slot, value)
+
+    return property(get, set)
+
+
+def _make_init(slots):
+    # Generate an __init__ which copies the keys of the JSON data into the
+    # slots with plain attribute assignments, the fastest way to set them
+    lines = ['def __init__(self, data):',
+             '    get = data.get',
+             '    found = 0']
+    for field, slot in slots.items():
+        if keyword.iskeyword(slot):
+            assign = '_setattr(self, {!r}, value)'.format(slot)
+        else:
+            assign = 'self.{} = value'.format(slot)
+        lines += ['    value = get({!r}, _MISSING)'.format(field),
+                  '    if value is not _MISSING:',
+                  '        ' + assign,
+                  '        found += 1']
+    lines += ['    if found == len(data):',
+              '        self._extra = None',
+              '    else:',
+              '        self._extra = dict((k, v) for k, v in data.items()',
+              '                           if k not in _slots)']
+    namespace = {'_setattr': _setattr, '_MISSING': _MISSING,
+                 '_slots': slots}
+    exec('\n'.join(lines), namespace)
+    return namespace['__init__']
+
+
+class ModelType(type):
+    """
+    Metaclass of Model, which turns the declared `fields` of a class into
+    __slots__. Fields listed in `nested` with a Model class hold lazily
+    built sub-objects of that class
+    """
+
+    def __new__(mcs, name, bases, namespace):
+        nested = namespace.get('nested', {})
+        slots = list(namespace.get('__slots__', ()))
+        for field in namespace.get('fields', ()):
+            if field in nested:
+                slot = '_' + field
+                namespace[field] = _nested(field, slot, nested[field])
+                slots.append(slot)
+            else:
+                slots.append(field)
+        namespace['__slots__'] = tuple(slots)
+        cls = super(ModelType, mcs).__new__(mcs, name, bases, namespace)
+        cls._slots = {}
+        for klass in reversed(cls.__mro__):
+            own_nested = klass.__dict__.get('nested', {})
+            for field in klass.__dict__.get('fields', ()):
+                cls._slots[field] = \
+                    '_' + field if field in own_nested else field
+        cls._fields_by_slot = dict((slot, field)
+                                   for field, slot in cls._slots.items())
+        if '__init__' not in namespace:
+            cls.__init__ = _make_init(cls._slots)
+        return cls
+
+
+# Created through the metaclass directly to work on Python 2 and 3
+_Base = ModelType('_Base', (object,), {'__slots__': ()})
+
+
+class Model(_Base):
+    """
+    An object built from the JSON data retrieved from the API.
+
+    Subclasses declare their known keys in `fields`, which are stored in
+    slots instead of an instance dict. Other keys are kept in an overflow
+    dict and are still readable as attributes, but only fields can be
+    assigned. A missing key raises AttributeError, as before.
+
+    Models are read-only Mappings of their keys, so
+    `thread.thread['context']['id']` and `dict(project.currency)` keep
+    working now that nested objects are models too, and a model compares
+    equal to a dict or model with the same content. Models are not dicts
+    though: use to_dict() to serialize one, e.g. with json.dumps.
+    """
+
+    __slots__ = ('_extra',)
+    fields = ()
+    nested = {}
+
+    def __init__(self, data):
+        _setattr(self, '_extra', dict(data))
+
+    @classmethod
+    def lazy(cls, data):
+        """
+        Return a view of the JSON data which behaves like an instance of
+        this class, but copies each field out of `data` only when it is
+        first read. `data` must not be changed afterwards
+        """
+        lazy_class = cls.__dict__.get('_lazy_class')
+        if lazy_class is None:
+            lazy_class = _make_lazy_class(cls)
+            cls._lazy_class = lazy_class
+        return lazy_class(data)
+
+    def _overflow(self):
+        return self._extra or ()
+
+    def __getattr__(self, name):
+        # Only called when the attribute is not set
+        try:
+            extra = _getattribute(self, '_extra')
+        except AttributeError:
+            extra = None
+        if extra and name in extra:
+            return extra[name]
+        raise AttributeError('{} has no attribute {!r}'.format(
+            type(self).__name__, name))
+
+    def keys(self):
+        keys = [field for field, slot in self._slots.items()
+                if hasattr(self, slot)]
+        return keys + list(self._extra or ())
+
+    def __getitem__(self, key):
+        if key in self._slots or key in self._overflow():
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                pass
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        if key in self._slots:
+            return hasattr(self, self._slots[key])
+        return key in self._overflow()
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def values(self):
+        return [self[key] for key in self.keys()]
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def __eq__(self, other):
+        if isinstance(other, Model):
+            return self.to_dict() == other.to_dict()
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    # Like dicts, models are mutable and compare by content
+    __hash__ = None
+
+    def to_dict(self):
+        """
+        Return the JSON data of the object, including changes
+        """
+        data = {}
+        for key, value in self.items():
+            if isinstance(value, Model):
+                value = value.to_dict()
+            data[key] = value
+        return data
+
+    def __getstate__(self):
+        return self.to_dict()
+
+    def __setstate__(self, state):
+        self.__init__(state)
+
+    def __repr__(self):
+        return '<{} {!r}>'.format(type(self).__name__,
+                                  self.get('id', self.to_dict()))
+
+
+Mapping.register(Model)
+
+
+def _is_set(model, slot):
+    try:
+        _getattribute(model, slot)
+        return True
+    except AttributeError:
+        return False
+
+
+def _make_lazy_class(model):
+    # A subclass of the model which keeps the JSON data and fills the slots
+    # from it as they are read
+
+    def __init__(self, data):
+        _setattr(self, '_data', data)
+        _setattr(self, '_extra', None)
+
+    def __getattr__(self, name):
+        data = _getattribute(self, '_data')
+        field = self._fields_by_slot.get(name)
+        if field is not None:
+            if field in data:
+                value = data[field]
+                _setattr(self, name, value)
+                return value
+        elif name not in self._slots and name in data:
+            return data[name]
+        raise AttributeError('{} has no attribute {!r}'.format(
+            model.__name__, name))
+
+    def _overflow(self):
+        return self._data
+
+    def keys(self):
+        data = self._data
+        keys = [field for field, slot in self._slots.items()
+                if field in data or _is_set(self, slot)]
+        return keys + [key for key in data if key not in self._slots]
+
+    def __reduce__(self):
+        return model, (self.to_dict(),)
+
+    namespace = {
+        '__slots__': ('_data',),
+        '__module__': model.__module__,
+        '__doc__': 'Lazy view of a {}'.format(model.__name__),
+        '__init__': __init__,
+        '__getattr__': __getattr__,
+        '_overflow': _overflow,
+        'keys': keys,
+        '__reduce__': __reduce__,
+    }
+    lazy_class = ModelType('Lazy' + model.__name__, (model,), namespace)
+    lazy_class._lazy_class = lazy_class
+    return lazy_class
+
+
+class lazy_property(object):
+    """
+    A property computed on first access and then stored on the instance
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.__doc__ = func.__doc__
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        value = self.func(instance)
+        instance.__dict__[self.func.__name__] = value
+        return value
+
+
+def index(items, model):
+    """
+    Turn a map of JSON objects by id, as sent alongside results, e.g. their
+    users, into a dict of lazy models by integer id
+    """
+    if not items:
+        return {}
+    return dict((int(key), model.lazy(value))
+                for key, value in items.items())
+
+
+class Result(dict):
+    """
+    The result of a read call. It is the JSON result as a dict, as before,
+    with typed access to its contents added by subclasses. `not_modified` is
+    True if it is the previous result of a conditional request
+    """
+
+    def __init__(self, data):
+        super(Result, self).__init__(data)
+        self.not_modified = getattr(data, 'not_modified', False)
+
+    @property
+    def total_count(self):
+        return self.get('total_count')
@@ -0,0 +1,160 @@
+"""
+This module contains helpers to page through list endpoints
+"""
+
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from freelancersdk.batch import submit
+
+try:
+    from Queue import Queue, Full
+except ImportError:
+    from queue import Queue, Full
+
+_ITEM, _ERROR, _DONE = range(3)
+
+
+class Pager(object):
+    """
+    Iterate over the items of consecutive pages of a list endpoint.
+
+    `fetch_page(offset, limit)` returns the result of one page, whose
+    `items_key` holds the items, e.g. 'projects'. Paging stops at the
+    result's total_count, after `max_items` items or at the first empty
+    page. Without a total_count it also stops at the first short page;
+    with one, a short page means the server caps the page size, and paging
+    goes on from the end of that page with pages of its size.
+    With `read_ahead` > 0, up to that many following pages are fetched in
+    background threads while the current page is consumed.
+    """
+
+    def __init__(self, fetch_page, items_key, page_size, offset=0,
+                 read_ahead=0, max_items=None):
+        self.fetch_page = fetch_page
+        self.items_key = items_key
+        self.page_size = page_size
+        self.offset = offset
+        self.read_ahead = read_ahead
+        self.end = None if max_items is None else offset + max_items
+        self.total_count = None
+
+    def _stop(self):
+        if self.total_count is None:
+            return self.end
+        if self.end is None:
+            return self.total_count
+        return min(self.end, self.total_count)
+
+    def _schedule(self, pending, executor):
+        stop = self._stop()
+        while len(pending) <= self.read_ahead and \
+                (stop is None or self.offset < stop):
+            limit = self.page_size
+            if stop is not None:
+                limit = min(limit, stop - self.offset)
+            future = None
+            if executor is not None:
+                future = submit(executor, self.fetch_page, self.offset,
+                                limit)
+            pending.append((self.offset, limit, future))
+            self.offset += limit
+
+    def _cancel(self, pending):
+        while pending:
+            _, _, future = pending.pop()
+            if future is not None:
+                future.cancel()
+
+    def __iter__(self):
+        pending = deque()
+        executor = None
+        if self.read_ahead > 0:
+            executor = ThreadPoolExecutor(max_workers=self.read_ahead)
+        try:
+            self._schedule(pending, executor)
+            while pending:
+                offset, limit, future = pending.popleft()
+                if future is None:
+                    result = self.fetch_page(offset, limit)
+                else:
+                    result = future.result()
+                if self.total_count is None and \
+                        result.get('total_count') is not None:
+                    self.total_count = result['total_count']
+                    # Drop pages fetched ahead past the end of the results
+                    while pending and pending[-1][0] >= self.total_count:
+                        _, _, skipped = pending.pop()
+                        if skipped is not None:
+                            skipped.cancel()
+                items = result.get(self.items_key) or []
+                for item in items:
+                    yield item
+                if not items or \
+                        (len(items) < limit and self.total_count is None):
+                    return
+                if len(items) < limit:
+                    # The pages fetched ahead assumed a full page
+                    self._cancel(pending)
+                    self.offset = offset + len(items)
+                    self.page_size = len(items)
+                self._schedule(pending, executor)
+        finally:
+            self._cancel(pending)
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+
+def merge_iterators(iterables, max_workers, buffer_size=100):
+    """
+    Consume several iterables in parallel worker threads and yield their
+    items as they arrive. Items of one iterable keep their order. At most
+    `buffer_size` items are held before the workers wait for the consumer
+    """
+    iterables = list(iterables)
+    if max_workers <= 1 or len(iterables) <= 1:
+        for iterable in iterables:
+            for item in iterable:
+                yield item
+        return
+
+    items = Queue(maxsize=buffer_size)
+    stopped = threading.Event()
+
+    def put(entry):
+        while not stopped.is_set():
+            try:
+                items.put(entry, timeout=0.1)
+                return True
+            except Full:
+                pass
+        return False
+
+    def consume(iterable):
+        try:
+            for item in iterable:
+                if not put((_ITEM, item)):
+                    return
+        except Exception as e:
+            put((_ERROR, e))
+        finally:
+            put((_DONE, None))
+
+    executor = ThreadPoolExecutor(max_workers=min(max_workers,
+                                                  len(iterables)))
+    try:
+        for iterable in iterables:
+            submit(executor, consume, iterable)
+        remaining = len(iterables)
+        while remaining:
+            kind, value = items.get()
+            if kind == _ITEM:
+                yield value
+            elif kind == _ERROR:
+                raise value
+            else:
+                remaining -= 1
+    finally:
+        stopped.set()
+        executor.shutdown(wait=False)
@@ -0,0 +1,120 @@
+"""
+This module contains the connection pooling transport used by Session
+"""
+
+import socket
+import threading
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from freelancersdk.tracing import traced_connection
+
+try:
+    from urlparse import urlparse
+except ImportError:
+    from urllib.parse import urlparse
+
+
+def keep_alive_socket_options(idle=60, interval=10, count=6):
+    """
+    Socket options which enable TCP keep-alive probes on pooled connections,
+    so idle connections are not silently dropped by NATs and load balancers
+    """
+    options = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    if hasattr(socket, 'TCP_KEEPIDLE'):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, idle))
+    elif hasattr(socket, 'TCP_KEEPALIVE'):
+        # macOS
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPALIVE, idle))
+    if hasattr(socket, 'TCP_KEEPINTVL'):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, interval))
+    if hasattr(socket, 'TCP_KEEPCNT'):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPCNT, count))
+    return options
+
+
+class ConnectionStats(object):
+    """
+    Thread safe counters of requests sent and connections opened, per host
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hosts = {}
+
+    def _count(self, host, key):
+        with self._lock:
+            counts = self._hosts.setdefault(host, {'requests': 0,
+                                                   'connections': 0})
+            counts[key] += 1
+
+    def request_sent(self, host):
+        self._count(host, 'requests')
+
+    def connection_opened(self, host):
+        self._count(host, 'connections')
+
+    def snapshot(self):
+        """
+        Return the counters as a dict. Connections which served more than one
+        request are counted as reused
+        """
+        with self._lock:
+            hosts = dict((host, dict(counts))
+                         for host, counts in self._hosts.items())
+        totals = {'requests': 0, 'connections': 0}
+        for counts in hosts.values():
+            counts['reused'] = max(counts['requests'] - counts['connections'],
+                                   0)
+            totals['requests'] += counts['requests']
+            totals['connections'] += counts['connections']
+        totals['reused'] = max(totals['requests'] - totals['connections'], 0)
+        totals['hosts'] = hosts
+        return totals
+
+    def reset(self):
+        with self._lock:
+            self._hosts.clear()
+
+
+def _counting_pool(pool_class, stats):
+    def _new_conn(self):
+        stats.connection_opened(self.host)
+        return pool_class._new_conn(self)
+
+    return type('Counting' + pool_class.__name__, (pool_class,),
+                {'_new_conn': _new_conn,
+                 'ConnectionCls': traced_connection(pool_class.ConnectionCls)})
+
+
+class PoolingAdapter(HTTPAdapter):
+    """
+    A HTTPAdapter with configurable socket options which records how often
+    pooled connections are reused
+    """
+
+    def __init__(self, pool_connections=10, pool_maxsize=10, pool_block=False,
+                 socket_options=None, stats=None):
+        self.socket_options = socket_options
+        self.stats = stats or ConnectionStats()
+        super(PoolingAdapter, self).__init__(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+            pool_block=pool_block)
+
+    def init_poolmanager(self, connections, maxsize, block=False,
+                         **pool_kwargs):
+        if self.socket_options is not None:
+            pool_kwargs['socket_options'] = self.socket_options
+        super(PoolingAdapter, self).init_poolmanager(connections, maxsize,
+                                                     block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _counting_pool(HTTPConnectionPool, self.stats),
+            'https': _counting_pool(HTTPSConnectionPool, self.stats),
+        }
+
+    def send(self, request, **kwargs):
+        self.stats.request_sent(urlparse(request.url).hostname)
+        return super(PoolingAdapter, self).send(request, **kwargs)
@@ -0,0 +1,166 @@
+"""
+This module contains the client side rate limiting middleware for Session
+"""
+
+import os
+import struct
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from freelancersdk.retry import parse_retry_after
+
+_monotonic = getattr(time, 'monotonic', time.time)
+
+
+class TokenBucket(object):
+    """
+    A thread safe token bucket which refills at `rate` tokens per second up
+    to `capacity` tokens.
+
+    Callers reserve a token and are told exactly how long to wait for it.
+    The bucket can go into debt, so concurrent callers queue up one
+    1/rate interval apart and throughput stays at the rate instead of
+    everybody waking up at once.
+    """
+
+    def __init__(self, rate, capacity=None, clock=_monotonic):
+        self.rate = float(rate)
+        self.capacity = float(capacity or rate)
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated = clock()
+
+    def _take(self, tokens, updated, now, count):
+        tokens = min(self.capacity, tokens + (now - updated) * self.rate)
+        tokens -= count
+        return tokens, max(-tokens / self.rate, 0.0)
+
+    def reserve(self, count=1):
+        """
+        Take `count` tokens and return the number of seconds to wait before
+        using them
+        """
+        with self._lock:
+            now = self.clock()
+            self._tokens, wait = self._take(self._tokens, self._updated, now,
+                                            count)
+            self._updated = now
+            return wait
+
+    def pause(self, seconds):
+        """
+        Hand out no tokens for the next `seconds`, e.g. after the server
+        responded with 429 Too Many Requests
+        """
+        with self._lock:
+            now = self.clock()
+            tokens, _ = self._take(self._tokens, self._updated, now, 0)
+            self._tokens = min(tokens, -seconds * self.rate)
+            self._updated = now
+
+
+class FileTokenBucket(TokenBucket):
+    """
+    A token bucket whose state is kept in a file, so that processes on the
+    same host can share it. The file is locked with fcntl while the bucket
+    is updated
+    """
+
+    _format = '!dd'
+
+    def __init__(self, path, rate, capacity=None, clock=time.time):
+        if fcntl is None:
+            raise ImportError('FileTokenBucket requires fcntl')
+        super(FileTokenBucket, self).__init__(rate, capacity, clock)
+        self.path = path
+
+    def _update(self, count, pause=None):
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            now = self.clock()
+            data = os.read(fd, struct.calcsize(self._format))
+            if len(data) == struct.calcsize(self._format):
+                tokens, updated = struct.unpack(self._format, data)
+            else:
+                tokens, updated = self.capacity, now
+            tokens, wait = self._take(tokens, updated, now, count)
+            if pause is not None:
+                tokens = min(tokens, -pause * self.rate)
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.write(fd, struct.pack(self._format, tokens, now))
+            return wait
+        finally:
+            os.close(fd)
+
+    def reserve(self, count=1):
+        with self._lock:
+            return self._update(count)
+
+    def pause(self, seconds):
+        with self._lock:
+            self._update(0, pause=seconds)
+
+
+class RateLimiter(object):
+    """
+    Middleware which throttles requests with one token bucket per endpoint
+    family (projects, users, messages and contests).
+
+    `rate` is the default number of requests per second and `rates` sets it
+    per family, e.g. {'projects': 20, 'users': 5}. `capacity` is the burst
+    size, one second worth of requests by default. If `directory` is given,
+    the buckets are kept in files in that directory and shared by all
+    processes using it.
+
+    A 429 response pauses the whole family for the Retry-After period.
+    Add it after a RetryPolicy so that every retry also waits for a token.
+    """
+
+    def __init__(self, rate=10, rates=None, capacity=None, directory=None,
+                 sleep=time.sleep):
+        self.rate = rate
+        self.rates = dict(rates or {})
+        self.capacity = capacity
+        self.directory = directory
+        self.sleep = sleep
+        self.buckets = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, family):
+        try:
+            return self.buckets[family]
+        except KeyError:
+            pass
+        with self._lock:
+            if family not in self.buckets:
+                rate = self.rates.get(family, self.rate)
+                if self.directory:
+                    path = os.path.join(self.directory,
+                                        '{}.bucket'.format(family))
+                    bucket = FileTokenBucket(path, rate, self.capacity)
+                else:
+                    bucket = TokenBucket(rate, self.capacity)
+                self.buckets[family] = bucket
+            return self.buckets[family]
+
+    def throttle(self, request, response):
+        if response.status_code == 429:
+            bucket = self.bucket(request.namespace)
+            retry_after = parse_retry_after(
+                response.headers.get('Retry-After'))
+            bucket.pause(retry_after or 1.0 / bucket.rate)
+
+    def __call__(self, request, send):
+        wait = self.bucket(request.namespace).reserve()
+        if wait > 0:
+            self.sleep(wait)
+        response = send(request)
+        self.throttle(request, response)
+        return response
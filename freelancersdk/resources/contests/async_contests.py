@@ -0,0 +1,24 @@
+"""
+This module contains awaitable functions for contest operations. They take an
+AsyncSession and mirror the functions in the contests module, sharing their
+requests and the parsing of the replies
+"""
+
+from freelancersdk.async_session import traced_async
+from freelancersdk.resources.results import parse_result
+from freelancersdk.resources.contests.types import Contest
+from freelancersdk.resources.contests.exceptions import \
+    ContestNotCreatedException
+from freelancersdk.resources.contests.contests import _create_contest_request
+
+
+@traced_async
+async def create_contest(session, title, description, type, duration,
+                         job_ids, currency_id, prize):
+    """
+    Create a contest
+    """
+    response = await _create_contest_request(session, title, description,
+                                             type, duration, job_ids,
+                                             currency_id, prize)
+    return parse_result(response, ContestNotCreatedException, Contest)
@@ -2,17 +2,17 @@
 This module contains functions for contest operations
 """
 
+from freelancersdk.tracing import traced
+from freelancersdk.resources.results import parse_result
 from freelancersdk.resources.contests.types import Contest
 from freelancersdk.resources.contests.helpers import make_post_request
 from freelancersdk.resources.contests.exceptions import \
     ContestNotCreatedException
 
 
-def create_contest(session, title, description, type, duration, job_ids, currency_id,
-                   prize):
-    """
-    Create a contest
-    """
+def _create_contest_request(session, title, description, type, duration,
+                            job_ids, currency_id, prize):
+    # Shared with the async_contests module
     contest_data = {
         'title': title,
         'description': description,
@@ -24,10 +24,15 @@ def create_contest(session, title, description, type, duration, job_ids, currenc
     }
 
     # POST /api/contests/0.1/contests/
-    response = make_post_request(session, 'contests', json_data=contest_data)
-    json_data = response.json()
-    if response.status_code == 200:
-        return Contest(json_data['result'])
-    else:
-        raise ContestNotCreatedException(message=json_data['message'],
-                                         error_code=json_data['error_code'])
+    return make_post_request(session, 'contests', json_data=contest_data)
+
+
+@traced
+def create_contest(session, title, description, type, duration, job_ids, currency_id,
+                   prize):
+    """
+    Create a contest
+    """
+    response = _create_contest_request(session, title, description, type,
+                                       duration, job_ids, currency_id, prize)
+    return parse_result(response, ContestNotCreatedException, Contest)
@@ -1,7 +1,11 @@
-class Contest:
+from freelancersdk.models import Model
+
+
+class Contest(Model):
     """
     Create a Contest object from the JSON data retrieved from the API
     """
-    def __init__(self, contest_data):
-        for k in iter(contest_data):
-            setattr(self, k, contest_data[k])
+    fields = ('id', 'owner_id', 'title', 'description', 'status', 'type',
+              'duration', 'jobs', 'currency', 'prize', 'seo_url',
+              'time_submitted', 'time_updated', 'entry_count', 'bid_count',
+              'upgrades', 'draft')
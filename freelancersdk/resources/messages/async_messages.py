@@ -0,0 +1,55 @@
+"""
+This module contains awaitable functions for message operations. They take an
+AsyncSession and mirror the functions in the messages module, sharing their
+requests and the parsing of the replies
+"""
+
+from freelancersdk.async_session import traced_async
+from freelancersdk.resources.results import parse_result
+from freelancersdk.resources.messages.types import (
+    Thread, Message
+)
+from freelancersdk.resources.messages.exceptions import (
+    ThreadNotCreatedException, MessageNotCreatedException
+)
+from freelancersdk.resources.messages.messages import (
+    _create_thread_request, _post_message_request, _post_attachment_request,
+)
+
+
+@traced_async
+async def create_thread(session, member_ids, context_type, context, message):
+    """
+    Create a thread
+    """
+    response = await _create_thread_request(session, member_ids,
+                                            context_type, context, message)
+    return parse_result(response, ThreadNotCreatedException, Thread)
+
+
+@traced_async
+async def create_project_thread(session, member_ids, project_id, message):
+    """
+    Create a project thread
+    """
+    return await create_thread(session, member_ids, 'project', project_id,
+                               message)
+
+
+@traced_async
+async def post_message(session, thread_id, message):
+    """
+    Add a message to a thread
+    """
+    response = await _post_message_request(session, thread_id, message)
+    return parse_result(response, MessageNotCreatedException, Message)
+
+
+@traced_async
+async def post_attachment(session, thread_id, attachments):
+    """
+    Add a message to a thread
+    """
+    response = await _post_attachment_request(session, thread_id,
+                                              attachments)
+    return parse_result(response, MessageNotCreatedException, Message)
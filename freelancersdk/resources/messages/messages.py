@@ -2,6 +2,8 @@
 This module contains functions for message operations
 """
 
+from freelancersdk.tracing import traced
+from freelancersdk.resources.results import parse_result
 from freelancersdk.resources.messages.types import (
     Thread, Message
 )
@@ -10,11 +12,14 @@ from freelancersdk.resources.messages.exceptions import (
     ThreadNotCreatedException, MessageNotCreatedException
 )
 
+# The private _*_request functions below build the payload of a call and
+# send it, returning the response, or an awaitable of it with an
+# AsyncSession. The async_messages module shares them, and the parsing of
+# the replies, with this module
 
-def create_thread(session, member_ids, context_type, context, message):
-    """
-    Create a thread
-    """
+
+def _create_thread_request(session, member_ids, context_type, context,
+                           message):
     headers = {
         'Content-Type': 'application/x-www-form-urlencoded'
     }
@@ -26,16 +31,21 @@ def create_thread(session, member_ids, context_type, context, message):
     }
 
     # POST /api/messages/0.1/threads/
-    response = make_post_request(session, 'threads', headers,
-                                 form_data=thread_data)
-    json_data = response.json()
-    if response.status_code == 200:
-        return Thread(json_data['result'])
-    else:
-        raise ThreadNotCreatedException(message=json_data['message'],
-                                        error_code=json_data['error_code'])
+    return make_post_request(session, 'threads', headers,
+                             form_data=thread_data)
 
 
+@traced
+def create_thread(session, member_ids, context_type, context, message):
+    """
+    Create a thread
+    """
+    response = _create_thread_request(session, member_ids, context_type,
+                                      context, message)
+    return parse_result(response, ThreadNotCreatedException, Thread)
+
+
+@traced
 def create_project_thread(session, member_ids, project_id, message):
     """
     Create a project thread
@@ -43,10 +53,7 @@ def create_project_thread(session, member_ids, project_id, message):
     return create_thread(session, member_ids, 'project', project_id, message)
 
 
-def post_message(session, thread_id, message):
-    """
-    Add a message to a thread
-    """
+def _post_message_request(session, thread_id, message):
     headers = {
         'Content-Type': 'application/x-www-form-urlencoded'
     }
@@ -56,20 +63,20 @@ def post_message(session, thread_id, message):
 
     # POST /api/messages/0.1/threads/{thread_id}/messages/
     endpoint = 'threads/{}/messages'.format(thread_id)
-    response = make_post_request(session, endpoint, headers,
-                                 form_data=message_data)
-    json_data = response.json()
-    if response.status_code == 200:
-        return Message(json_data['result'])
-    else:
-        raise MessageNotCreatedException(message=json_data['message'],
-                                         error_code=json_data['error_code'])
+    return make_post_request(session, endpoint, headers,
+                             form_data=message_data)
 
 
-def post_attachment(session, thread_id, attachments):
+@traced
+def post_message(session, thread_id, message):
     """
     Add a message to a thread
     """
+    response = _post_message_request(session, thread_id, message)
+    return parse_result(response, MessageNotCreatedException, Message)
+
+
+def _post_attachment_request(session, thread_id, attachments):
     files = []
     filenames = []
     for attachment in attachments:
@@ -81,11 +88,14 @@ def post_attachment(session, thread_id, attachments):
 
     # POST /api/messages/0.1/threads/{thread_id}/messages/
     endpoint = 'threads/{}/messages'.format(thread_id)
-    response = make_post_request(session, endpoint,
-                                 form_data=message_data, files=files)
-    json_data = response.json()
-    if response.status_code == 200:
-        return Message(json_data['result'])
-    else:
-        raise MessageNotCreatedException(message=json_data['message'],
-                                         error_code=json_data['error_code'])
+    return make_post_request(session, endpoint,
+                             form_data=message_data, files=files)
+
+
+@traced
+def post_attachment(session, thread_id, attachments):
+    """
+    Add a message to a thread
+    """
+    response = _post_attachment_request(session, thread_id, attachments)
+    return parse_result(response, MessageNotCreatedException, Message)
@@ -1,16 +1,35 @@
-class Thread:
+from freelancersdk.models import Model
+
+
+class Context(Model):
+    """
+    The object a messages thread is about, e.g. a project
+    """
+    fields = ('id', 'type', 'description')
+
+
+class ThreadDetails(Model):
+    """
+    The details of a messages thread: its members, owner and context
+    """
+    fields = ('id', 'thread_type', 'time_created', 'members', 'owner',
+              'context', 'is_read', 'is_muted')
+    nested = {'context': Context}
+
+
+class Thread(Model):
     """
     Create a Messages Thread object from the JSON data retrieved from the API
     """
-    def __init__(self, project_data):
-        for k in iter(project_data):
-            setattr(self, k, project_data[k])
+    fields = ('id', 'thread', 'context', 'time_read', 'time_updated',
+              'is_muted', 'is_read', 'message', 'message_count')
+    nested = {'thread': ThreadDetails, 'context': Context}
 
 
-class Message:
+class Message(Model):
     """
     Create a Messages object from the JSON data retrieved from the API
     """
-    def __init__(self, project_data):
-        for k in iter(project_data):
-            setattr(self, k, project_data[k])
+    fields = ('id', 'thread_id', 'from_user_id', 'from_user', 'message',
+              'time_created', 'attachments', 'client_message_id',
+              'message_source')
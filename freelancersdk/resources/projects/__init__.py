@@ -2,3 +2,5 @@ projects_endpoint = 'api/projects/0.1'
 
 from freelancersdk.resources.projects.helpers import *
 from freelancersdk.resources.projects.projects import *
+from freelancersdk.resources.projects.jobs import *
+from freelancersdk.resources.projects.milestones import *
@@ -0,0 +1,295 @@
+"""
+This module contains awaitable functions for project operations. They take an
+AsyncSession and mirror the functions in the projects module, sharing their
+requests and the parsing of the replies
+"""
+
+from freelancersdk.async_session import run_batch_async, traced_async
+from freelancersdk.resources.results import parse_result, parse_status
+from freelancersdk.resources.projects.types import (
+    Bid, Milestone, MilestoneRequest, ProjectsResult, BidsResult
+)
+from freelancersdk.resources.projects.exceptions import (
+    ProjectsNotFoundException,
+    BidNotPlacedException, BidsNotFoundException, BidNotAwardedException,
+    BidNotRevokedException, BidNotAcceptedException, BidNotRetractedException,
+    BidNotHighlightedException,
+    MilestoneNotCreatedException, MilestoneNotReleasedException,
+    MilestoneNotRequestedReleaseException, MilestoneNotCancelledException,
+    MilestoneRequestNotCreatedException, MilestoneRequestNotAcceptedException,
+    MilestoneRequestNotRejectedException, MilestoneRequestNotDeletedException,
+    ReviewNotPostedException,
+    JobsNotFoundException
+)
+from freelancersdk.resources.projects.projects import (
+    _create_project_request, _create_hourly_project_request,
+    _create_local_project_request, _create_hireme_project_request,
+    _created_project, _get_projects_request, _search_projects_request,
+    _place_project_bid_request, _get_bids_request, _bid_action_request,
+    _create_milestone_payment_request, _release_milestone_payment_request,
+    _milestone_action_request, _create_milestone_request_request,
+    _milestone_request_action_request, _post_review_request,
+    _get_jobs_request,
+)
+
+
+@traced_async
+async def create_project(session, title, description,
+                         currency, budget, jobs):
+    """
+    Create a project
+    """
+    response = await _create_project_request(session, title, description,
+                                             currency, budget, jobs)
+    return _created_project(session, response)
+
+
+@traced_async
+async def create_hourly_project(session, title, description,
+                                currency, budget, jobs, hourly_project_info):
+    """
+    Create a fixed project
+    """
+    response = await _create_hourly_project_request(
+        session, title, description, currency, budget, jobs,
+        hourly_project_info)
+    return _created_project(session, response)
+
+
+@traced_async
+async def create_local_project(session, title, description,
+                               currency, budget, jobs, location):
+    """
+    Create a fixed project
+    """
+    response = await _create_local_project_request(
+        session, title, description, currency, budget, jobs, location)
+    return _created_project(session, response)
+
+
+@traced_async
+async def create_hireme_project(session, title, description,
+                                currency, budget, jobs, hireme_initial_bid):
+    """
+    Create a fixed project
+    """
+    response = await _create_hireme_project_request(
+        session, title, description, currency, budget, jobs,
+        hireme_initial_bid)
+    return _created_project(session, response)
+
+
+@traced_async
+async def get_projects(session, query):
+    """
+    Get one or more projects
+    """
+    response = await _get_projects_request(session, query)
+    return parse_result(response, ProjectsNotFoundException, ProjectsResult)
+
+
+@traced_async
+async def search_projects(session, query, project_types, limit, offset,
+                          active_only=None):
+    """
+    Search for all projects
+    """
+    response = await _search_projects_request(session, query, project_types,
+                                              limit, offset, active_only)
+    return parse_result(response, ProjectsNotFoundException, ProjectsResult)
+
+
+@traced_async
+async def place_project_bid(session, project_id, bidder_id, description,
+                            amount, period, milestone_percentage):
+    """
+    Place a bid on a project
+    """
+    response = await _place_project_bid_request(
+        session, project_id, bidder_id, description, amount, period,
+        milestone_percentage)
+    return parse_result(response, BidNotPlacedException, Bid)
+
+
+@traced_async
+async def get_bids(session, project_ids=[], bid_ids=[], limit=10, offset=0):
+    """
+    Get the list of bids
+    """
+    response = await _get_bids_request(session, project_ids, bid_ids, limit,
+                                       offset)
+    return parse_result(response, BidsNotFoundException, BidsResult)
+
+
+@traced_async
+async def award_project_bid(session, bid_id):
+    """
+    Award a bid on a project
+    """
+    response = await _bid_action_request(session, bid_id, 'award')
+    return parse_status(response, BidNotAwardedException)
+
+
+@traced_async
+async def revoke_project_bid(session, bid_id):
+    """
+    Revoke a bid on a project
+    """
+    response = await _bid_action_request(session, bid_id, 'revoke')
+    return parse_status(response, BidNotRevokedException)
+
+
+@traced_async
+async def accept_project_bid(session, bid_id):
+    """
+    Accept a bid on a project
+    """
+    response = await _bid_action_request(session, bid_id, 'accept')
+    return parse_status(response, BidNotAcceptedException)
+
+
+@traced_async
+async def retract_project_bid(session, bid_id):
+    """
+    Retract a bid on a project
+    """
+    response = await _bid_action_request(session, bid_id, 'retract')
+    return parse_status(response, BidNotRetractedException)
+
+
+@traced_async
+async def highlight_project_bid(session, bid_id):
+    """
+    Highlight a bid on a project
+    """
+    response = await _bid_action_request(session, bid_id, 'highlight')
+    return parse_status(response, BidNotHighlightedException)
+
+
+# The functions applying each bid action of apply_bid_actions
+BID_ACTIONS = {
+    'award': award_project_bid,
+    'revoke': revoke_project_bid,
+    'accept': accept_project_bid,
+    'retract': retract_project_bid,
+    'highlight': highlight_project_bid,
+}
+
+
+async def apply_bid_actions(session, actions, max_concurrency=4):
+    """
+    Apply many bid actions, given as (action, bid_id) pairs, with at most
+    `max_concurrency` requests in flight. Returns their Outcomes like
+    projects.apply_bid_actions
+    """
+    actions = list(actions)
+    for action, bid_id in actions:
+        if action not in BID_ACTIONS:
+            raise ValueError('Unknown bid action {!r}'.format(action))
+    return await run_batch_async(
+        lambda pair: BID_ACTIONS[pair[0]](session, pair[1]), actions,
+        max_concurrency=max_concurrency)
+
+
+@traced_async
+async def create_milestone_payment(session, project_id, bidder_id, amount,
+                                   reason, description):
+    """
+    Create a milestone payment
+    """
+    response = await _create_milestone_payment_request(
+        session, project_id, bidder_id, amount, reason, description)
+    return parse_result(response, MilestoneNotCreatedException, Milestone,
+                        with_status_code=True)
+
+
+@traced_async
+async def release_milestone_payment(session, milestone_id, amount):
+    """
+    Release a milestone payment
+    """
+    response = await _release_milestone_payment_request(session,
+                                                        milestone_id, amount)
+    return parse_status(response, MilestoneNotReleasedException,
+                        with_status_code=True)
+
+
+@traced_async
+async def request_release_milestone_payment(session, milestone_id):
+    """
+    Release a milestone payment
+    """
+    response = await _milestone_action_request(session, milestone_id,
+                                               'request_release')
+    return parse_status(response, MilestoneNotRequestedReleaseException)
+
+
+@traced_async
+async def cancel_milestone_payment(session, milestone_id):
+    """
+    Release a milestone payment
+    """
+    response = await _milestone_action_request(session, milestone_id,
+                                               'cancel')
+    return parse_status(response, MilestoneNotCancelledException,
+                        with_status_code=True)
+
+
+@traced_async
+async def create_milestone_request(session, project_id, bid_id, description,
+                                   amount):
+    """
+    Create a milestone request
+    """
+    response = await _create_milestone_request_request(
+        session, project_id, bid_id, description, amount)
+    return parse_result(response, MilestoneRequestNotCreatedException,
+                        MilestoneRequest)
+
+
+@traced_async
+async def accept_milestone_request(session, milestone_request_id):
+    """
+    Accept a milestone request
+    """
+    response = await _milestone_request_action_request(
+        session, milestone_request_id, 'accept')
+    return parse_status(response, MilestoneRequestNotAcceptedException)
+
+
+@traced_async
+async def reject_milestone_request(session, milestone_request_id):
+    """
+    Reject a milestone request
+    """
+    response = await _milestone_request_action_request(
+        session, milestone_request_id, 'reject')
+    return parse_status(response, MilestoneRequestNotRejectedException)
+
+
+@traced_async
+async def delete_milestone_request(session, milestone_request_id):
+    """
+    Delete a milestone request
+    """
+    response = await _milestone_request_action_request(
+        session, milestone_request_id, 'delete')
+    return parse_status(response, MilestoneRequestNotDeletedException)
+
+
+@traced_async
+async def post_review(session, review):
+    """
+    Post a review
+    """
+    response = await _post_review_request(session, review)
+    return parse_status(response, ReviewNotPostedException)
+
+
+@traced_async
+async def get_jobs(session, job_ids, seo_details, lang):
+    """
+    Get a list of jobs
+    """
+    response = await _get_jobs_request(session, job_ids, seo_details, lang)
+    return parse_result(response, JobsNotFoundException)
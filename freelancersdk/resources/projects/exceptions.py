@@ -74,18 +74,20 @@ class MilestoneNotCreatedException(Exception):
     """
     Milestone could not be created
     """
-    def __init__(self, message, error_code):
+    def __init__(self, message, error_code, status_code=None):
         super(MilestoneNotCreatedException, self).__init__(message)
         self.error_code = error_code
+        self.status_code = status_code
 
 
 class MilestoneNotReleasedException(Exception):
     """
     Milestone cout not be released
     """
-    def __init__(self, message, error_code):
+    def __init__(self, message, error_code, status_code=None):
         super(MilestoneNotReleasedException, self).__init__(message)
         self.error_code = error_code
+        self.status_code = status_code
 
 
 class MilestoneNotRequestedReleaseException(Exception):
@@ -101,9 +103,19 @@ class MilestoneNotCancelledException(Exception):
     """
     Milestone cout not be cancelled
     """
-    def __init__(self, message, error_code):
+    def __init__(self, message, error_code, status_code=None):
         super(MilestoneNotCancelledException, self).__init__(message)
         self.error_code = error_code
+        self.status_code = status_code
+
+
+class MilestoneOperationInDoubtException(Exception):
+    """
+    Milestone operation may have been applied by an interrupted run
+    """
+    def __init__(self, message, error_code):
+        super(MilestoneOperationInDoubtException, self).__init__(message)
+        self.error_code = error_code
 
 
 class MilestoneRequestNotCreatedException(Exception):
@@ -2,29 +2,27 @@
 # Reference: https://www.freelancer.com/api/docs/structs/index
 
 from freelancersdk.resources.projects import projects_endpoint
-try:
-    from urlparse import urljoin
-except ImportError:
-    from urllib.parse import urljoin
 
 
 # Make API calls
 # /api/projects/0.1/<specific_endpoint>
-def make_get_request(session, endpoint, params_data):
-    url = urljoin(session.url, '{}/{}/'.format(projects_endpoint, endpoint))
-    return session.session.get(url, params=params_data, verify=True)
+def make_get_request(session, endpoint, params_data=None, stream=False):
+    # Only streamed requests pass the option, to leave the others unchanged
+    options = {'stream': True} if stream else {}
+    return session.request('GET', projects_endpoint, endpoint,
+                           params=params_data, **options)
 
 
 def make_post_request(session, endpoint, json_data):
-    url = urljoin(session.url, '{}/{}/'.format(projects_endpoint, endpoint))
-    return session.session.post(url, json=json_data, verify=True)
+    return session.request('POST', projects_endpoint, endpoint,
+                           json=json_data)
 
 
 def make_put_request(session, endpoint, headers=None, params_data=None,
                      form_data=None, json_data=None):
-    url = urljoin(session.url, '{}/{}/'.format(projects_endpoint, endpoint))
-    return session.session.put(url, headers=headers, params=params_data,
-                               data=form_data, json=json_data, verify=True)
+    return session.request('PUT', projects_endpoint, endpoint,
+                           headers=headers, params=params_data,
+                           data=form_data, json=json_data)
 
 
 # Helper functions for creating various objects
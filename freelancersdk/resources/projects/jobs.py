@@ -0,0 +1,160 @@
+"""
+This module contains an in-memory index of the job catalog
+"""
+
+import threading
+
+from freelancersdk.resources.projects.helpers import create_job_object
+from freelancersdk.resources.projects.projects import get_jobs
+
+
+def _fold(name):
+    return name.strip().lower() if name else name
+
+
+class JobCatalog(object):
+    """
+    The jobs (skills) of the freelancer.com catalog, indexed by id, SEO URL,
+    name and category. Names and category names are matched without regard
+    to case.
+
+    Load it once with `JobCatalog.load(session)` and keep it up to date with
+    `refresh`, or feed it the results of get_jobs with `update`, e.g. from
+    an AsyncSession.
+    """
+
+    def __init__(self, jobs=()):
+        self._jobs = {}
+        self._by_seo_url = {}
+        self._by_name = {}
+        self._by_category = {}
+        self._category_ids = {}
+        self._lock = threading.RLock()
+        self.update(jobs)
+
+    @classmethod
+    def load(cls, session, seo_details=True, lang='en'):
+        """
+        Fetch the whole catalog and return it indexed
+        """
+        catalog = cls()
+        catalog.refresh(session, seo_details=seo_details, lang=lang)
+        return catalog
+
+    def refresh(self, session, job_ids=None, seo_details=True, lang='en'):
+        """
+        Fetch the given jobs, or the whole catalog, and reindex the jobs
+        which changed. Jobs which left the catalog are dropped on a full
+        refresh. Returns the number of jobs added, changed or removed
+        """
+        jobs = get_jobs(session, job_ids or [], seo_details, lang)
+        return self.update(jobs, complete=not job_ids)
+
+    def update(self, jobs, complete=False):
+        """
+        Index a list of jobs as returned by get_jobs. If `complete`, it is
+        the whole catalog and jobs missing from it are removed. Returns the
+        number of jobs added, changed or removed
+        """
+        changed = 0
+        with self._lock:
+            seen = set()
+            for job in jobs:
+                seen.add(job['id'])
+                current = self._jobs.get(job['id'])
+                if current == job:
+                    continue
+                if current is not None:
+                    self._unindex(current)
+                self._index(job)
+                changed += 1
+            if complete:
+                for job_id in [i for i in self._jobs if i not in seen]:
+                    self._unindex(self._jobs[job_id])
+                    changed += 1
+        return changed
+
+    def _index(self, job):
+        self._jobs[job['id']] = job
+        if job.get('seo_url'):
+            self._by_seo_url[job['seo_url']] = job
+        if job.get('name'):
+            self._by_name[_fold(job['name'])] = job
+        category = job.get('category')
+        if category:
+            self._by_category.setdefault(category['id'], {})[job['id']] = job
+            if category.get('name'):
+                self._category_ids[_fold(category['name'])] = category['id']
+
+    def _unindex(self, job):
+        del self._jobs[job['id']]
+        if self._by_seo_url.get(job.get('seo_url')) is job:
+            del self._by_seo_url[job['seo_url']]
+        if self._by_name.get(_fold(job.get('name'))) is job:
+            del self._by_name[_fold(job['name'])]
+        category = job.get('category')
+        if category:
+            jobs = self._by_category.get(category['id'], {})
+            jobs.pop(job['id'], None)
+            if not jobs:
+                self._by_category.pop(category['id'], None)
+                if category.get('name'):
+                    self._category_ids.pop(_fold(category['name']), None)
+
+    def get(self, job_id):
+        return self._jobs.get(job_id)
+
+    def by_seo_url(self, seo_url):
+        return self._by_seo_url.get(seo_url)
+
+    def by_name(self, name):
+        return self._by_name.get(_fold(name))
+
+    def by_category(self, category):
+        """
+        Return the jobs of a category, given by id or name
+        """
+        if not isinstance(category, int):
+            category = self._category_ids.get(_fold(category))
+        return list(self._by_category.get(category, {}).values())
+
+    def find(self, key):
+        """
+        Return the job with the given id, SEO URL or name
+        """
+        if isinstance(key, int):
+            return self.get(key)
+        return self.by_seo_url(key) or self.by_name(key)
+
+    def job_ids(self, keys):
+        """
+        Return the ids of the jobs with the given ids, SEO URLs or names, e.g.
+        for add_user_jobs. Raises KeyError for unknown jobs
+        """
+        ids = []
+        for key in keys:
+            job = self.find(key)
+            if job is None:
+                raise KeyError(key)
+            ids.append(job['id'])
+        return ids
+
+    def job_object(self, key):
+        """
+        Return the job with the given id, SEO URL or name as a job object for
+        create_project. Raises KeyError for unknown jobs
+        """
+        job = self.find(key)
+        if job is None:
+            raise KeyError(key)
+        return create_job_object(id=job['id'], name=job.get('name'),
+                                 seo_url=job.get('seo_url'))
+
+    def __len__(self):
+        return len(self._jobs)
+
+    def __iter__(self):
+        return iter(list(self._jobs.values()))
+
+    def __contains__(self, key):
+        return self.find(key) is not None
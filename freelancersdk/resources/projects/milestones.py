@@ -0,0 +1,339 @@
+"""
+This module contains the batch processing of milestone payments and
+milestone requests
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from freelancersdk.batch import Outcome, run_batch, submit
+from freelancersdk.instrumentation import percentile
+from freelancersdk.resources.projects.exceptions import (
+    MilestoneNotCreatedException, MilestoneNotReleasedException,
+    MilestoneNotCancelledException, MilestoneOperationInDoubtException,
+)
+from freelancersdk.resources.projects.projects import (
+    create_milestone_payment, release_milestone_payment,
+    cancel_milestone_payment, accept_milestone_request,
+    reject_milestone_request, delete_milestone_request,
+)
+from freelancersdk.resources.projects.types import Milestone
+
+_clock = getattr(time, 'perf_counter', time.time)
+
+# The functions applying each milestone operation of a batch
+MILESTONE_OPERATIONS = {
+    'create': create_milestone_payment,
+    'release': release_milestone_payment,
+    'cancel': cancel_milestone_payment,
+}
+
+# The errors of the API on milestone operations. Only those with a 4xx
+# status were rejected and not applied, so they can be retried; a 5xx reply
+# may come after the operation was applied
+_REJECTED = (MilestoneNotCreatedException, MilestoneNotReleasedException,
+             MilestoneNotCancelledException)
+
+
+def _rejected(exception):
+    return isinstance(exception, _REJECTED) and \
+        exception.status_code is not None and \
+        400 <= exception.status_code < 500
+
+
+def milestone_operation_key(action, arguments):
+    """
+    Return the default idempotency key of a milestone operation, a digest
+    of its action and arguments
+    """
+    data = json.dumps([action, arguments], sort_keys=True)
+    return hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+
+def create_milestone_operation(action, key=None, **arguments):
+    """
+    Create an operation of a milestone batch: 'create' with the arguments of
+    create_milestone_payment, 'release' with those of
+    release_milestone_payment or 'cancel' with a milestone_id. Its `key`
+    identifies it across runs of the batch and defaults to a digest of the
+    action and arguments
+    """
+    if action not in MILESTONE_OPERATIONS:
+        raise ValueError('Unknown milestone operation {!r}'.format(action))
+    if key is None:
+        key = milestone_operation_key(action, arguments)
+    return {'action': action, 'key': key, 'arguments': arguments}
+
+
+class Checkpoint(object):
+    """
+    A JSON lines file recording the progress of a batch by operation key:
+    'started' before an operation is sent, then 'done' with its result,
+    'failed' with the error the API rejected it with, or 'in_doubt' with an
+    error after which it may have been applied. Every line is synced
+    to disk before the operation goes on, so that the file can be trusted
+    after a crash
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        self._lock = threading.Lock()
+        lines = []
+        if os.path.exists(path):
+            with open(path) as f:
+                lines = f.read().split('\n')
+            for line in lines:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # An empty line, or the last one cut short by a crash
+                    continue
+                self.entries[entry['key']] = entry
+        self._file = open(path, 'a')
+        if lines and lines[-1]:
+            self._file.write('\n')
+
+    def get(self, key):
+        with self._lock:
+            return self.entries.get(key)
+
+    def record(self, key, state, **values):
+        entry = dict(values, key=key, state=state)
+        line = json.dumps(entry, sort_keys=True)
+        with self._lock:
+            self._file.write(line + '\n')
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self.entries[key] = entry
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def _result_data(result):
+    if isinstance(result, Milestone):
+        return result.to_dict()
+    return result
+
+
+def run_milestone_batch(session, operations, checkpoint=None, max_workers=4,
+                        retry_in_doubt=False):
+    """
+    Apply milestone operations, made with create_milestone_operation, on up
+    to `max_workers` threads and return the Outcome of every operation in
+    order: a Milestone for create, the status for release and cancel, or
+    the exception raised. A failing operation does not stop the others.
+
+    With a `checkpoint`, a Checkpoint or the path of one, a batch can be run
+    again after an interruption: operations already done are not sent again
+    and their recorded results are returned, and operations the API
+    rejected with a 4xx status are retried. An operation interrupted, or
+    answered with a 5xx status or any other error, may have been applied,
+    so it fails with MilestoneOperationInDoubtException rather than risk
+    paying twice, unless `retry_in_doubt` is set after checking it by hand.
+    """
+    operations = list(operations)
+    keys = set()
+    for operation in operations:
+        if operation['key'] in keys:
+            raise ValueError('Duplicate milestone operation key {!r}; give '
+                             'identical operations their own keys'.format(
+                                 operation['key']))
+        keys.add(operation['key'])
+
+    owned = checkpoint is not None and not isinstance(checkpoint, Checkpoint)
+    if owned:
+        checkpoint = Checkpoint(checkpoint)
+
+    def run(operation):
+        key, action = operation['key'], operation['action']
+        if checkpoint is None:
+            return MILESTONE_OPERATIONS[action](session,
+                                                **operation['arguments'])
+        entry = checkpoint.get(key)
+        if entry is not None and entry['state'] == 'done':
+            if action == 'create':
+                return Milestone(entry['result'])
+            return entry['result']
+        if entry is not None and entry['state'] in ('started', 'in_doubt') \
+                and not retry_in_doubt:
+            raise MilestoneOperationInDoubtException(
+                message='Milestone operation {} did not complete and may '
+                        'have been applied'.format(key),
+                error_code='IN_DOUBT')
+        checkpoint.record(key, 'started', action=action)
+        try:
+            result = MILESTONE_OPERATIONS[action](session,
+                                                  **operation['arguments'])
+        except Exception as e:
+            state = 'failed' if _rejected(e) else 'in_doubt'
+            checkpoint.record(key, state, action=action, message=str(e),
+                              error_code=getattr(e, 'error_code', None))
+            raise
+        checkpoint.record(key, 'done', action=action,
+                          result=_result_data(result))
+        return result
+
+    try:
+        return run_batch(run, operations, max_workers=max_workers)
+    finally:
+        if owned:
+            checkpoint.close()
+
+
+# The functions applying each action of process_milestone_requests, and the
+# status of a milestone request the action succeeded on
+MILESTONE_REQUEST_ACTIONS = {
+    'accept': accept_milestone_request,
+    'reject': reject_milestone_request,
+    'delete': delete_milestone_request,
+}
+_DONE = {'accept': 'accepted', 'reject': 'rejected', 'delete': 'deleted'}
+
+
+class MilestoneRequestOutcome(Outcome):
+    """
+    The Outcome of one milestone request of process_milestone_requests,
+    with the `action` decided for it, None if it was skipped, and the
+    `seconds` its call took
+    """
+
+    def __init__(self, item, action, result=None, exception=None,
+                 seconds=0.0):
+        super(MilestoneRequestOutcome, self).__init__(
+            item, result=result, exception=exception)
+        self.action = action
+        self.seconds = seconds
+
+    @property
+    def status(self):
+        """
+        One of accepted, rejected, deleted, failed or skipped
+        """
+        if self.action is None:
+            return 'skipped'
+        return _DONE[self.action] if self.ok else 'failed'
+
+
+class MilestoneRequestReport(object):
+    """
+    The result of process_milestone_requests: the `outcomes` of the
+    milestone requests in order, and the wall time the batch took in
+    `seconds`
+    """
+
+    def __init__(self, outcomes, seconds):
+        self.outcomes = outcomes
+        self.seconds = seconds
+
+    @property
+    def failed(self):
+        return [o for o in self.outcomes if o.status == 'failed']
+
+    def counts(self):
+        """
+        Return the number of milestone requests by status
+        """
+        counts = dict.fromkeys(('accepted', 'rejected', 'deleted', 'failed',
+                                'skipped'), 0)
+        for outcome in self.outcomes:
+            counts[outcome.status] += 1
+        return counts
+
+    def latency(self):
+        """
+        Return the count, mean, p50, p99 and max of the seconds taken by the
+        calls made
+        """
+        ordered = sorted(o.seconds for o in self.outcomes
+                         if o.action in MILESTONE_REQUEST_ACTIONS)
+        if not ordered:
+            return {'count': 0, 'mean': None, 'p50': None, 'p99': None,
+                    'max': None}
+        return {
+            'count': len(ordered),
+            'mean': sum(ordered) / len(ordered),
+            'p50': percentile(ordered, 0.5),
+            'p99': percentile(ordered, 0.99),
+            'max': ordered[-1],
+        }
+
+    def __repr__(self):
+        return '<MilestoneRequestReport {!r} in {:.3f}s>'.format(
+            self.counts(), self.seconds)
+
+
+def process_milestone_requests(session, milestone_requests, decide,
+                               max_workers=4):
+    """
+    Triage a stream of milestone requests, MilestoneRequest objects or their
+    JSON data e.g. from an iterator, with `decide(milestone_request)`
+    returning 'accept', 'reject', 'delete' or None to leave it alone.
+
+    The decisions are made in the calling thread as the milestone requests
+    are read, and their actions applied on up to `max_workers` threads.
+    At most twice as many milestone requests are waiting at a time, so a
+    long iterator is read as the actions complete rather than all at once.
+    A failing action, or an unknown one failing with ValueError, does not
+    stop the others.
+
+    Returns a MilestoneRequestReport with the status, result or exception
+    and latency of every milestone request
+    """
+    def run(milestone_request, action):
+        started = _clock()
+        try:
+            result = MILESTONE_REQUEST_ACTIONS[action](
+                session, milestone_request['id'])
+        except Exception as e:
+            return MilestoneRequestOutcome(milestone_request, action,
+                                           exception=e,
+                                           seconds=_clock() - started)
+        return MilestoneRequestOutcome(milestone_request, action,
+                                       result=result,
+                                       seconds=_clock() - started)
+
+    window = 2 * max(max_workers, 1)
+    # The outcomes of skipped and unknown actions, and the futures of the
+    # others, in the order of the milestone requests
+    pending = deque()
+    outcomes = []
+
+    def collect():
+        outcome = pending.popleft()
+        if isinstance(outcome, Future):
+            outcome = outcome.result()
+        outcomes.append(outcome)
+
+    started = _clock()
+    with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+        for milestone_request in milestone_requests:
+            action = decide(milestone_request)
+            if action is None:
+                pending.append(MilestoneRequestOutcome(milestone_request,
+                                                       None))
+            elif action not in MILESTONE_REQUEST_ACTIONS:
+                pending.append(MilestoneRequestOutcome(
+                    milestone_request, action, exception=ValueError(
+                        'Unknown milestone request action {!r}'.format(
+                            action))))
+            else:
+                pending.append(submit(executor, run, milestone_request,
+                                      action))
+            while len(pending) >= window:
+                collect()
+        while pending:
+            collect()
+    return MilestoneRequestReport(outcomes, _clock() - started)
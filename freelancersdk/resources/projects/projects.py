@@ -2,8 +2,15 @@
 This module contains functions for project operations
 """
 
+from freelancersdk.batch import (
+    MAX_QUERY_LENGTH, chunk_query, merge_results, run_batch,
+)
+from freelancersdk.decoding import STREAM_CHUNK_SIZE, iter_json_array
+from freelancersdk.pagination import Pager, merge_iterators
+from freelancersdk.tracing import traced
+from freelancersdk.resources.results import parse_result, parse_status
 from freelancersdk.resources.projects.types import (
-    Project, Bid, Milestone, MilestoneRequest
+    Project, Bid, Milestone, MilestoneRequest, ProjectsResult, BidsResult
 )
 from freelancersdk.resources.projects.exceptions import (
     ProjectNotCreatedException, ProjectsNotFoundException,
@@ -30,138 +37,134 @@ try:
 except ImportError:
     from urllib.parse import urljoin
 
+# The private _*_request functions below build the payload of a call and
+# send it, returning the response, or an awaitable of it with an
+# AsyncSession. The async_projects module shares them, and the parsing of
+# the replies, with this module
 
-def create_project(session, title, description,
-                   currency, budget, jobs):
-    """
-    Create a project
-    """
+
+def _create_project_request(session, title, description, currency, budget,
+                            jobs, **extra):
     project_data = {'title': title,
                     'description': description,
                     'currency': currency,
                     'budget': budget,
                     'jobs': jobs
                     }
+    project_data.update(extra)
 
     # POST /api/projects/0.1/projects/
-    response = make_post_request(session, 'projects', json_data=project_data)
-    json_data = response.json()
-    if response.status_code == 200:
-        project_data = json_data['result']
-        p = Project(project_data)
-        p.url = urljoin(session.url, 'projects/%s' % p.seo_url)
-        return p
-    else:
-        raise ProjectNotCreatedException(message=json_data['message'],
-                                         error_code=json_data['error_code'],
-                                         )
+    return make_post_request(session, 'projects', json_data=project_data)
+
+
+def _create_hourly_project_request(session, title, description, currency,
+                                   budget, jobs, hourly_project_info):
+    return _create_project_request(session, title, description, currency,
+                                   budget, jobs, type='HOURLY',
+                                   hourly_project_info=hourly_project_info)
+
+
+def _create_local_project_request(session, title, description, currency,
+                                  budget, jobs, location):
+    return _create_project_request(session, title, description, currency,
+                                   budget, jobs, local=True,
+                                   location=location)
+
+
+def _create_hireme_project_request(session, title, description, currency,
+                                   budget, jobs, hireme_initial_bid):
+    jobs.append(create_job_object(id=417))  # Hire Me job, required
+    return _create_project_request(session, title, description, currency,
+                                   budget, jobs, hireme=True,
+                                   hireme_initial_bid=hireme_initial_bid)
+
+
+def _created_project(session, response):
+    p = parse_result(response, ProjectNotCreatedException, Project.lazy)
+    p.url = urljoin(session.url, 'projects/%s' % p.seo_url)
+    return p
+
+
+@traced
+def create_project(session, title, description,
+                   currency, budget, jobs):
+    """
+    Create a project
+    """
+    response = _create_project_request(session, title, description,
+                                       currency, budget, jobs)
+    return _created_project(session, response)
 
 
+@traced
 def create_hourly_project(session, title, description,
                           currency, budget, jobs, hourly_project_info):
     """
     Create a fixed project
     """
-    project_data = {'title': title,
-                    'description': description,
-                    'currency': currency,
-                    'budget': budget,
-                    'jobs': jobs,
-                    'type': 'HOURLY',
-                    'hourly_project_info': hourly_project_info
-                    }
-
-    # POST /api/projects/0.1/projects/
-    response = make_post_request(session, 'projects', json_data=project_data)
-    json_data = response.json()
-    if response.status_code == 200:
-        project_data = json_data['result']
-        p = Project(project_data)
-        p.url = urljoin(session.url, 'projects/%s' % p.seo_url)
-        return p
-    else:
-        raise ProjectNotCreatedException(message=json_data['message'],
-                                         error_code=json_data['error_code'],
-                                         )
+    response = _create_hourly_project_request(session, title, description,
+                                              currency, budget, jobs,
+                                              hourly_project_info)
+    return _created_project(session, response)
 
 
+@traced
 def create_local_project(session, title, description,
                          currency, budget, jobs, location):
     """
     Create a fixed project
     """
-    project_data = {'title': title,
-                    'description': description,
-                    'currency': currency,
-                    'budget': budget,
-                    'jobs': jobs,
-                    'local': True,
-                    'location': location
-                    }
-
-    # POST /api/projects/0.1/projects/
-    response = make_post_request(session, 'projects', json_data=project_data)
-    json_data = response.json()
-    if response.status_code == 200:
-        project_data = json_data['result']
-        p = Project(project_data)
-        p.url = urljoin(session.url, 'projects/%s' % p.seo_url)
-        return p
-    else:
-        raise ProjectNotCreatedException(message=json_data['message'],
-                                         error_code=json_data['error_code'],
-                                         )
+    response = _create_local_project_request(session, title, description,
+                                             currency, budget, jobs, location)
+    return _created_project(session, response)
 
 
+@traced
 def create_hireme_project(session, title, description,
                           currency, budget, jobs, hireme_initial_bid):
     """
     Create a fixed project
     """
-    jobs.append(create_job_object(id=417))  # Hire Me job, required
+    response = _create_hireme_project_request(session, title, description,
+                                              currency, budget, jobs,
+                                              hireme_initial_bid)
+    return _created_project(session, response)
 
-    project_data = {'title': title,
-                    'description': description,
-                    'currency': currency,
-                    'budget': budget,
-                    'jobs': jobs,
-                    'hireme': True,
-                    'hireme_initial_bid': hireme_initial_bid
-                    }
 
-    # POST /api/projects/0.1/projects/
-    response = make_post_request(session, 'projects', json_data=project_data)
-    json_data = response.json()
-    if response.status_code == 200:
-        project_data = json_data['result']
-        p = Project(project_data)
-        p.url = urljoin(session.url, 'projects/%s' % p.seo_url)
-        return p
-    else:
-        raise ProjectNotCreatedException(message=json_data['message'],
-                                         error_code=json_data['error_code'],
-                                         )
+def _get_projects_request(session, query):
+    # GET /api/projects/0.1/projects
+    return make_get_request(session, 'projects', params_data=query)
 
 
+@traced
 def get_projects(session, query):
     """
     Get one or more projects
     """
-    # GET /api/projects/0.1/projects
-    response = make_get_request(session, 'projects', params_data=query)
-    json_data = response.json()
-    if response.status_code == 200:
-        return json_data['result']
-    else:
-        raise ProjectsNotFoundException(
-            message=json_data['message'], error_code=json_data['error_code'])
+    response = _get_projects_request(session, query)
+    return parse_result(response, ProjectsNotFoundException, ProjectsResult)
 
 
-def search_projects(session, query, project_types, limit, offset,
-                    active_only=None):
+@traced
+def get_projects_bulk(session, query, max_workers=4,
+                      max_query_length=MAX_QUERY_LENGTH):
     """
-    Search for all projects
+    Get any number of projects. The project ids of the query are split into
+    chunks that keep the URL short enough, and the chunks are fetched on up
+    to `max_workers` threads. The results are merged into one, whose
+    'failed' list holds the Outcome of every chunk that could not be fetched
     """
+    queries = chunk_query(query, 'projects[]', max_length=max_query_length)
+    outcomes = run_batch(lambda q: get_projects(session, q), queries,
+                         max_workers=max_workers)
+    result = merge_results(o.result for o in outcomes if o.ok)
+    result.setdefault('projects', [])
+    result['failed'] = [o for o in outcomes if not o.ok]
+    return ProjectsResult(result)
+
+
+def _search_projects_request(session, query, project_types, limit, offset,
+                             active_only, stream=False):
     search_data = {
         'query': query,
         'project_types': project_types,
@@ -171,20 +174,69 @@ def search_projects(session, query, project_types, limit, offset,
     # GET /api/projects/0.1/projects/all/
     # GET /api/projects/0.1/projects/active/
     endpoint = 'projects/{}'.format('active' if active_only else 'all')
-    response = make_get_request(session, endpoint, params_data=search_data)
-    json_data = response.json()
-    if response.status_code == 200:
-        return json_data['result']
-    else:
-        raise ProjectsNotFoundException(
-            message=json_data['message'], error_code=json_data['error_code'])
+    return make_get_request(session, endpoint, params_data=search_data,
+                            stream=stream)
 
 
-def place_project_bid(session, project_id, bidder_id, description, amount,
-                      period, milestone_percentage):
+def _stream_items(response, key, model, exception):
+    # Yield the items of a streamed list response as they are decoded
+    try:
+        if response.status_code != 200:
+            json_data = response.json()
+            raise exception(message=json_data['message'],
+                            error_code=json_data['error_code'])
+        chunks = response.iter_content(STREAM_CHUNK_SIZE)
+        for item in iter_json_array(chunks, ('result', key)):
+            yield model.lazy(item)
+    finally:
+        response.close()
+
+
+@traced
+def search_projects(session, query, project_types, limit, offset,
+                    active_only=None):
     """
-    Place a bid on a project
+    Search for all projects
     """
+    response = _search_projects_request(session, query, project_types, limit,
+                                        offset, active_only)
+    return parse_result(response, ProjectsNotFoundException, ProjectsResult)
+
+
+def stream_search_projects(session, query, project_types, limit, offset,
+                           active_only=None):
+    """
+    Search for projects like search_projects, but yield the projects as
+    Project objects while the response is read, without holding the whole
+    page in memory
+    """
+    response = _search_projects_request(session, query, project_types, limit,
+                                        offset, active_only, stream=True)
+    for project in _stream_items(response, 'projects', Project,
+                                 ProjectsNotFoundException):
+        yield project
+
+
+def iter_search_projects(session, query, project_types=None, page_size=100,
+                         offset=0, active_only=None, read_ahead=0,
+                         max_results=None):
+    """
+    Iterate over the results of a project search as Project objects,
+    fetching the pages as they are needed. With read_ahead > 0, the next
+    pages are fetched in the background
+    """
+    def fetch_page(page_offset, limit):
+        return search_projects(session, query, project_types, limit,
+                               page_offset, active_only=active_only)
+
+    pager = Pager(fetch_page, 'projects', page_size, offset=offset,
+                  read_ahead=read_ahead, max_items=max_results)
+    for project_data in pager:
+        yield Project.lazy(project_data)
+
+
+def _place_project_bid_request(session, project_id, bidder_id, description,
+                               amount, period, milestone_percentage):
     bid_data = {
         'project_id': project_id,
         'bidder_id': bidder_id,
@@ -194,20 +246,23 @@ def place_project_bid(session, project_id, bidder_id, description, amount,
         'milestone_percentage': milestone_percentage,
     }
     # POST /api/projects/0.1/bids/
-    response = make_post_request(session, 'bids', json_data=bid_data)
-    json_data = response.json()
-    if response.status_code == 200:
-        bid_data = json_data['result']
-        return Bid(bid_data)
-    else:
-        raise BidNotPlacedException(message=json_data['message'],
-                                    error_code=json_data['error_code'])
+    return make_post_request(session, 'bids', json_data=bid_data)
 
 
-def get_bids(session, project_ids=[], bid_ids=[], limit=10, offset=0):
+@traced
+def place_project_bid(session, project_id, bidder_id, description, amount,
+                      period, milestone_percentage):
     """
-    Get the list of bids
+    Place a bid on a project
     """
+    response = _place_project_bid_request(session, project_id, bidder_id,
+                                          description, amount, period,
+                                          milestone_percentage)
+    return parse_result(response, BidNotPlacedException, Bid)
+
+
+def _get_bids_request(session, project_ids, bid_ids, limit, offset,
+                      stream=False):
     get_bids_data = {}
     if bid_ids:
         get_bids_data['bids[]'] = bid_ids
@@ -216,135 +271,142 @@ def get_bids(session, project_ids=[], bid_ids=[], limit=10, offset=0):
     get_bids_data['limit'] = limit
     get_bids_data['offset'] = offset
     # GET /api/projects/0.1/bids/
-    response = make_get_request(session, 'bids', params_data=get_bids_data)
-    json_data = response.json()
-    if response.status_code == 200:
-        return json_data['result']
-    else:
-        raise BidsNotFoundException(
-            message=json_data['message'], error_code=json_data['error_code'])
+    return make_get_request(session, 'bids', params_data=get_bids_data,
+                            stream=stream)
 
 
-def award_project_bid(session, bid_id):
+@traced
+def get_bids(session, project_ids=[], bid_ids=[], limit=10, offset=0):
     """
-    Award a bid on a project
+    Get the list of bids
     """
+    response = _get_bids_request(session, project_ids, bid_ids, limit, offset)
+    return parse_result(response, BidsNotFoundException, BidsResult)
+
+
+def stream_bids(session, project_ids=[], bid_ids=[], limit=10, offset=0):
+    """
+    Get the list of bids like get_bids, but yield the bids as Bid objects
+    while the response is read, without holding the whole page in memory
+    """
+    response = _get_bids_request(session, project_ids, bid_ids, limit, offset,
+                                 stream=True)
+    for bid in _stream_items(response, 'bids', Bid, BidsNotFoundException):
+        yield bid
+
+
+def iter_bids(session, project_ids=[], bid_ids=[], page_size=100,
+              read_ahead=0, projects_per_request=20, max_workers=1):
+    """
+    Iterate over bids as Bid objects, fetching the pages as they are needed.
+    With read_ahead > 0, the next pages are fetched in the background.
+
+    Bids are requested for `projects_per_request` projects at a time. With
+    max_workers > 1 these groups of projects are paged through in parallel,
+    and bids are yielded in the order their pages arrive
+    """
+    def pages(group):
+        def fetch_page(page_offset, limit):
+            return get_bids(session, project_ids=group, bid_ids=bid_ids,
+                            limit=limit, offset=page_offset)
+        return Pager(fetch_page, 'bids', page_size, read_ahead=read_ahead)
+
+    project_ids = list(project_ids)
+    groups = [project_ids[i:i + projects_per_request]
+              for i in range(0, len(project_ids), projects_per_request)]
+    pagers = [pages(group) for group in groups or [[]]]
+    for bid_data in merge_iterators(pagers, max_workers,
+                                    buffer_size=page_size * max_workers):
+        yield Bid.lazy(bid_data)
+
+
+def _bid_action_request(session, bid_id, action):
     headers = {
         'Content-Type': 'application/x-www-form-urlencoded'
     }
     bid_data = {
-        'action': 'award'
+        'action': action
     }
-    # POST /api/projects/0.1/bids/{bid_id}/?action=award
+    # PUT /api/projects/0.1/bids/{bid_id}/?action={action}
     endpoint = 'bids/{}'.format(bid_id)
-    response = make_put_request(session, endpoint, headers=headers,
-                                params_data=bid_data)
-    json_data = response.json()
-    if response.status_code == 200:
-        return json_data['status']
-    else:
-        json_data = response.json()
-        raise BidNotAwardedException(message=json_data['message'],
-                                    error_code=json_data['error_code'])
+    return make_put_request(session, endpoint, headers=headers,
+                            params_data=bid_data)
 
 
+@traced
+def award_project_bid(session, bid_id):
+    """
+    Award a bid on a project
+    """
+    response = _bid_action_request(session, bid_id, 'award')
+    return parse_status(response, BidNotAwardedException)
+
+
+@traced
 def revoke_project_bid(session, bid_id):
     """
     Revoke a bid on a project
     """
-    headers = {
-        'Content-Type': 'application/x-www-form-urlencoded'
-    }
-    bid_data = {
-        'action': 'revoke'
-    }
-    # POST /api/projects/0.1/bids/{bid_id}/?action=revoke
-    endpoint = 'bids/{}'.format(bid_id)
-    response = make_put_request(session, endpoint, headers=headers,
-                                params_data=bid_data)
-    json_data = response.json()
-    if response.status_code == 200:
-        return json_data['status']
-    else:
-        json_data = response.json()
-        raise BidNotRevokedException(message=json_data['message'],
-                                     error_code=json_data['error_code'])
+    response = _bid_action_request(session, bid_id, 'revoke')
+    return parse_status(response, BidNotRevokedException)
 
 
+@traced
 def accept_project_bid(session, bid_id):
     """
     Accept a bid on a project
     """
-    headers = {
-        'Content-Type': 'application/x-www-form-urlencoded'
-    }
-    bid_data = {
-        'action': 'accept'
-    }
-    # POST /api/projects/0.1/bids/{bid_id}/?action=revoke
-    endpoint = 'bids/{}'.format(bid_id)
-    response = make_put_request(session, endpoint, headers=headers,
-                                params_data=bid_data)
-    json_data = response.json()
-    if response.status_code == 200:
-        return json_data['status']
-    else:
-        json_data = response.json()
-        raise BidNotAcceptedException(message=json_data['message'],
-                                      error_code=json_data['error_code'])
+    response = _bid_action_request(session, bid_id, 'accept')
+    return parse_status(response, BidNotAcceptedException)
 
 
+@traced
 def retract_project_bid(session, bid_id):
     """
     Retract a bid on a project
     """
-    headers = {
-        'Content-Type': 'application/x-www-form-urlencoded'
-    }
-    bid_data = {
-        'action': 'retract'
-    }
-    # POST /api/projects/0.1/bids/{bid_id}/?action=revoke
-    endpoint = 'bids/{}'.format(bid_id)
-    response = make_put_request(session, endpoint, headers=headers,
-                                params_data=bid_data)
-    json_data = response.json()
-    if response.status_code == 200:
-        return json_data['status']
-    else:
-        json_data = response.json()
-        raise BidNotRetractedException(message=json_data['message'],
-                                       error_code=json_data['error_code'])
+    response = _bid_action_request(session, bid_id, 'retract')
+    return parse_status(response, BidNotRetractedException)
 
 
+@traced
 def highlight_project_bid(session, bid_id):
     """
     Highlight a bid on a project
     """
-    headers = {
-        'Content-Type': 'application/x-www-form-urlencoded'
-    }
-    bid_data = {
-        'action': 'highlight'
-    }
-    # POST /api/projects/0.1/bids/{bid_id}/?action=revoke
-    endpoint = 'bids/{}'.format(bid_id)
-    response = make_put_request(session, endpoint, headers=headers,
-                                params_data=bid_data)
-    json_data = response.json()
-    if response.status_code == 200:
-        return json_data['status']
-    else:
-        json_data = response.json()
-        raise BidNotHighlightedException(message=json_data['message'],
-                                         error_code=json_data['error_code'])
+    response = _bid_action_request(session, bid_id, 'highlight')
+    return parse_status(response, BidNotHighlightedException)
 
 
-def create_milestone_payment(session, project_id, bidder_id, amount,
-                             reason, description):
+# The functions applying each bid action of apply_bid_actions
+BID_ACTIONS = {
+    'award': award_project_bid,
+    'revoke': revoke_project_bid,
+    'accept': accept_project_bid,
+    'retract': retract_project_bid,
+    'highlight': highlight_project_bid,
+}
+
+
+def apply_bid_actions(session, actions, max_workers=4):
     """
-    Create a milestone payment
+    Apply many bid actions, given as (action, bid_id) pairs where action is
+    one of award, revoke, accept, retract or highlight, on up to
+    `max_workers` threads. Returns the Outcome of every pair in order: its
+    result is the status of the call, or its exception e.g. the
+    BidNotRevokedException of a failed revoke. A failing action does not
+    stop the others
     """
+    actions = list(actions)
+    for action, bid_id in actions:
+        if action not in BID_ACTIONS:
+            raise ValueError('Unknown bid action {!r}'.format(action))
+    return run_batch(lambda pair: BID_ACTIONS[pair[0]](session, pair[1]),
+                     actions, max_workers=max_workers)
+
+
+def _create_milestone_payment_request(session, project_id, bidder_id, amount,
+                                      reason, description):
     milestone_data = {
         'project_id': project_id,
         'bidder_id': bidder_id,
@@ -353,21 +415,23 @@ def create_milestone_payment(session, project_id, bidder_id, amount,
         'description': description
     }
     # POST /api/projects/0.1/milestones/
-    response = make_post_request(session, 'milestones',
-                                 json_data=milestone_data)
-    json_data = response.json()
-    if response.status_code == 200:
-        milestone_data = json_data['result']
-        return Milestone(milestone_data)
-    else:
-        raise MilestoneNotCreatedException(message=json_data['message'],
-                                           error_code=json_data['error_code'])
+    return make_post_request(session, 'milestones', json_data=milestone_data)
 
 
-def release_milestone_payment(session, milestone_id, amount):
+@traced
+def create_milestone_payment(session, project_id, bidder_id, amount,
+                             reason, description):
     """
-    Release a milestone payment
+    Create a milestone payment
     """
+    response = _create_milestone_payment_request(session, project_id,
+                                                 bidder_id, amount, reason,
+                                                 description)
+    return parse_result(response, MilestoneNotCreatedException, Milestone,
+                        with_status_code=True)
+
+
+def _release_milestone_payment_request(session, milestone_id, amount):
     params_data = {
         'action': 'release',
     }
@@ -376,56 +440,52 @@ def release_milestone_payment(session, milestone_id, amount):
     }
     # PUT /api/projects/0.1/milestones/{milestone_id}/?action=release
     endpoint = 'milestones/{}'.format(milestone_id)
-    response = make_put_request(session, endpoint, params_data=params_data,
-                                json_data=milestone_data)
-    json_data = response.json()
-    if response.status_code == 200:
-        return json_data['status']
-    else:
-        raise MilestoneNotReleasedException(message=json_data['message'],
-                                            error_code=json_data['error_code'])
+    return make_put_request(session, endpoint, params_data=params_data,
+                            json_data=milestone_data)
 
 
-def request_release_milestone_payment(session, milestone_id):
+@traced
+def release_milestone_payment(session, milestone_id, amount):
     """
     Release a milestone payment
     """
+    response = _release_milestone_payment_request(session, milestone_id,
+                                                  amount)
+    return parse_status(response, MilestoneNotReleasedException,
+                        with_status_code=True)
+
+
+def _milestone_action_request(session, milestone_id, action):
     params_data = {
-        'action': 'request_release',
+        'action': action,
     }
-    # PUT /api/projects/0.1/milestones/{milestone_id}/?action=release
+    # PUT /api/projects/0.1/milestones/{milestone_id}/?action={action}
     endpoint = 'milestones/{}'.format(milestone_id)
-    response = make_put_request(session, endpoint, params_data=params_data)
-    json_data = response.json()
-    if response.status_code == 200:
-        return json_data['status']
-    else:
-        raise MilestoneNotRequestedReleaseException(
-            message=json_data['message'], error_code=json_data['error_code'])
+    return make_put_request(session, endpoint, params_data=params_data)
 
 
-def cancel_milestone_payment(session, milestone_id):
+@traced
+def request_release_milestone_payment(session, milestone_id):
     """
     Release a milestone payment
     """
-    params_data = {
-        'action': 'cancel',
-    }
-    # PUT /api/projects/0.1/milestones/{milestone_id}/?action=release
-    endpoint = 'milestones/{}'.format(milestone_id)
-    response = make_put_request(session, endpoint, params_data=params_data)
-    json_data = response.json()
-    if response.status_code == 200:
-        return json_data['status']
-    else:
-        raise MilestoneNotCancelledException(
-            message=json_data['message'], error_code=json_data['error_code'])
+    response = _milestone_action_request(session, milestone_id,
+                                         'request_release')
+    return parse_status(response, MilestoneNotRequestedReleaseException)
 
 
-def create_milestone_request(session, project_id, bid_id, description, amount):
+@traced
+def cancel_milestone_payment(session, milestone_id):
     """
-    Create a milestone request
+    Release a milestone payment
     """
+    response = _milestone_action_request(session, milestone_id, 'cancel')
+    return parse_status(response, MilestoneNotCancelledException,
+                        with_status_code=True)
+
+
+def _create_milestone_request_request(session, project_id, bid_id,
+                                      description, amount):
     milestone_request_data = {
         'project_id': project_id,
         'bid_id': bid_id,
@@ -433,102 +493,92 @@ def create_milestone_request(session, project_id, bid_id, description, amount):
         'amount': amount,
     }
     # POST /api/projects/0.1/milestone_requests/
-    response = make_post_request(session, 'milestone_requests',
-                                 json_data=milestone_request_data)
-    json_data = response.json()
-    if response.status_code == 200:
-        milestone_request_data = json_data['result']
-        return MilestoneRequest(milestone_request_data)
-    else:
-        raise MilestoneRequestNotCreatedException(
-            message=json_data['message'], error_code=json_data['error_code'])
+    return make_post_request(session, 'milestone_requests',
+                             json_data=milestone_request_data)
 
 
-def accept_milestone_request(session, milestone_request_id):
+@traced
+def create_milestone_request(session, project_id, bid_id, description, amount):
     """
-    Accept a milestone request
+    Create a milestone request
     """
+    response = _create_milestone_request_request(session, project_id, bid_id,
+                                                 description, amount)
+    return parse_result(response, MilestoneRequestNotCreatedException,
+                        MilestoneRequest)
+
+
+def _milestone_request_action_request(session, milestone_request_id, action):
     params_data = {
-        'action': 'accept',
+        'action': action,
     }
-    # POST /api/projects/0.1/milestone_requests/{milestone_request_id}/?action=
-    # accept
+    # PUT /api/projects/0.1/milestone_requests/{milestone_request_id}/?action=
+    # {action}
     endpoint = 'milestone_requests/{}'.format(milestone_request_id)
-    response = make_put_request(session, endpoint, params_data=params_data)
-    json_data = response.json()
-    if response.status_code == 200:
-        return json_data['status']
-    else:
-        raise MilestoneRequestNotAcceptedException(
-            message=json_data['message'], error_code=json_data['error_code'])
+    return make_put_request(session, endpoint, params_data=params_data)
+
+
+@traced
+def accept_milestone_request(session, milestone_request_id):
+    """
+    Accept a milestone request
+    """
+    response = _milestone_request_action_request(session,
+                                                 milestone_request_id,
+                                                 'accept')
+    return parse_status(response, MilestoneRequestNotAcceptedException)
 
 
+@traced
 def reject_milestone_request(session, milestone_request_id):
     """
     Reject a milestone request
     """
-    params_data = {
-        'action': 'reject',
-    }
-    # POST /api/projects/0.1/milestone_requests/{milestone_request_id}/?action=
-    # reject
-    endpoint = 'milestone_requests/{}'.format(milestone_request_id)
-    response = make_put_request(session, endpoint, params_data=params_data)
-    json_data = response.json()
-    if response.status_code == 200:
-        return json_data['status']
-    else:
-        raise MilestoneRequestNotRejectedException(
-            message=json_data['message'], error_code=json_data['error_code'])
+    response = _milestone_request_action_request(session,
+                                                 milestone_request_id,
+                                                 'reject')
+    return parse_status(response, MilestoneRequestNotRejectedException)
 
 
+@traced
 def delete_milestone_request(session, milestone_request_id):
     """
     Delete a milestone request
     """
-    params_data = {
-        'action': 'delete',
-    }
-    # POST /api/projects/0.1/milestone_requests/{milestone_request_id}/?action=
-    # delete
-    endpoint = 'milestone_requests/{}'.format(milestone_request_id)
-    response = make_put_request(session, endpoint, params_data=params_data)
-    json_data = response.json()
-    if response.status_code == 200:
-        return json_data['status']
-    else:
-        raise MilestoneRequestNotDeletedException(
-            message=json_data['message'], error_code=json_data['error_code'])
+    response = _milestone_request_action_request(session,
+                                                 milestone_request_id,
+                                                 'delete')
+    return parse_status(response, MilestoneRequestNotDeletedException)
+
+
+def _post_review_request(session, review):
+    # POST /api/projects/0.1/reviews/
+    return make_post_request(session, 'reviews', json_data=review)
 
 
+@traced
 def post_review(session, review):
     """
     Post a review
     """
-    # POST /api/projects/0.1/reviews/
-    response = make_post_request(session, 'reviews', json_data=review)
-    json_data = response.json()
-    if response.status_code == 200:
-        return json_data['status']
-    else:
-        raise ReviewNotPostedException(
-            message=json_data['message'], error_code=json_data['error_code'])
+    response = _post_review_request(session, review)
+    return parse_status(response, ReviewNotPostedException)
 
 
-def get_jobs(session, job_ids, seo_details, lang):
-    """
-    Get a list of jobs
-    """
+def _get_jobs_request(session, job_ids, seo_details, lang):
     get_jobs_data = {
         'jobs[]': job_ids,
         'seo_details': seo_details,
         'lang': lang,
     }
     # GET /api/projects/0.1/jobs/
-    response = make_get_request(session, 'jobs', params_data=get_jobs_data)
-    json_data = response.json()
-    if response.status_code == 200:
-        return json_data['result']
-    else:
-        raise JobsNotFoundException(
-            message=json_data['message'], error_code=json_data['error_code'])
+    return make_get_request(session, 'jobs', params_data=get_jobs_data)
+
+
+@traced
+def get_jobs(session, job_ids, seo_details, lang):
+    """
+    Get a list of jobs
+    """
+    response = _get_jobs_request(session, job_ids, seo_details, lang)
+    return parse_result(response, JobsNotFoundException)
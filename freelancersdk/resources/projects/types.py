@@ -2,45 +2,147 @@
 
 from enum import IntEnum
 
+from freelancersdk.models import Model, Result, index, lazy_property
+from freelancersdk.resources.users.types import User
 
-class Project:
+
+class Currency(Model):
+    """
+    A currency, as found in projects, bids and milestones
+    """
+    fields = ('id', 'code', 'sign', 'name', 'exchange_rate', 'country',
+              'is_external', 'is_escrowcom_supported')
+
+
+class Budget(Model):
+    """
+    The budget of a project
+    """
+    fields = ('minimum', 'maximum', 'name', 'project_type', 'currency_id')
+
+
+class Project(Model):
     """
     Create a Project object from the JSON data
     retrieved from the API
     """
-    def __init__(self, project_data):
-        for k in iter(project_data):
-            setattr(self, k, project_data[k])
+    fields = ('id', 'owner_id', 'title', 'status', 'sub_status', 'seo_url',
+              'currency', 'description', 'jobs', 'submitdate',
+              'preview_description', 'deleted', 'nonpublic', 'hidereferrer',
+              'type', 'bidperiod', 'budget', 'hourly_project_info',
+              'featured', 'urgent', 'bid_stats', 'time_submitted',
+              'time_updated', 'upgrades', 'qualifications', 'language',
+              'attachments', 'hireme', 'hireme_initial_bid',
+              'frontend_project_status', 'location', 'local', 'negotiated',
+              'time_free_bids_expire', 'files', 'pool_ids', 'enterprise_ids',
+              'is_escrow_project', 'is_seller_kyc_required',
+              'is_buyer_kyc_required', 'url')
+    nested = {'currency': Currency, 'budget': Budget}
 
 
-class Bid:
+class Bid(Model):
     """
     Create a Bid object from the JSON data
     retrieved from the API
     """
-    def __init__(self, project_data):
-        for k in iter(project_data):
-            setattr(self, k, project_data[k])
+    fields = ('id', 'bidder_id', 'project_id', 'retracted', 'amount',
+              'period', 'description', 'project_owner_id', 'submitdate',
+              'buyer_project_fee', 'time_submitted', 'highlighted',
+              'sponsored', 'milestone_percentage', 'award_status',
+              'paid_status', 'complete_status', 'reputation', 'time_awarded',
+              'frontend_bid_status', 'hireme_counter_offer', 'shortlisted',
+              'score', 'distance', 'negotiated_offer', 'hidden',
+              'hidden_reason', 'time_accepted', 'paid_amount', 'hourly_rate',
+              'sealed', 'complete_status_changed_time',
+              'award_status_possible_actions', 'is_location_tracked',
+              'rating', 'quotations')
 
 
-class Milestone:
+class Milestone(Model):
     """
     Create a Milestone object from the JSON data
     retrieved from the API
     """
-    def __init__(self, project_data):
-        for k in iter(project_data):
-            setattr(self, k, project_data[k])
+    fields = ('transaction_id', 'project_id', 'bidder_id',
+              'project_owner_id', 'amount', 'description', 'reason',
+              'other_reason', 'status', 'time_created', 'currency',
+              'bid_id', 'milestone_request_id', 'time_updated')
+    nested = {'currency': Currency}
 
 
-class MilestoneRequest:
+class MilestoneRequest(Model):
     """
     Create a Milestone Request object from the JSON data
     retrieved from the API
     """
-    def __init__(self, milestone_request_data):
-        for k in iter(milestone_request_data):
-            setattr(self, k, milestone_request_data[k])
+    fields = ('id', 'project_id', 'bid_id', 'amount', 'description',
+              'status', 'time_created', 'time_updated', 'milestone_id')
+
+
+class ProjectsResult(Result):
+    """
+    The result of get_projects and search_projects. `projects` is the list
+    of Project objects, `users` and `selected_bids` map the ids of the users
+    and bids sent along to User and Bid objects
+    """
+
+    @lazy_property
+    def projects(self):
+        return [Project.lazy(p) for p in self.get('projects') or ()]
+
+    @lazy_property
+    def projects_by_id(self):
+        return dict((p.id, p) for p in self.projects)
+
+    @lazy_property
+    def users(self):
+        return index(self.get('users'), User)
+
+    @lazy_property
+    def selected_bids(self):
+        return index(self.get('selected_bids'), Bid)
+
+    def owner(self, project):
+        """
+        Return the owner of a project, if their details were requested
+        """
+        return self.users.get(project.owner_id)
+
+
+class BidsResult(Result):
+    """
+    The result of get_bids. `bids` is the list of Bid objects, `users` and
+    `projects` map the ids of the users and projects sent along to User and
+    Project objects
+    """
+
+    @lazy_property
+    def bids(self):
+        return [Bid.lazy(b) for b in self.get('bids') or ()]
+
+    @lazy_property
+    def bids_by_id(self):
+        return dict((b.id, b) for b in self.bids)
+
+    @lazy_property
+    def users(self):
+        return index(self.get('users'), User)
+
+    @lazy_property
+    def projects(self):
+        return index(self.get('projects'), Project)
+
+    def bidder(self, bid):
+        """
+        Return the user who placed a bid, if their details were requested
+        """
+        return self.users.get(bid.bidder_id)
+
+    def project(self, bid):
+        """
+        Return the project of a bid, if its details were requested
+        """
+        return self.projects.get(bid.project_id)
 
 
 # Enumerations
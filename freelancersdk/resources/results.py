@@ -0,0 +1,37 @@
+"""
+This module contains the handling of the API's replies, shared by the
+functions of the resource modules and their async mirrors
+"""
+
+
+def _error(response, json_data, exception, with_status_code):
+    if with_status_code:
+        return exception(message=json_data['message'],
+                         error_code=json_data['error_code'],
+                         status_code=response.status_code)
+    return exception(message=json_data['message'],
+                     error_code=json_data['error_code'])
+
+
+def parse_result(response, exception, model=None, with_status_code=False):
+    """
+    Return the result of a reply, built with `model` if given, or raise
+    `exception` with the error the API replied with. With
+    `with_status_code` the exception also gets the HTTP status code
+    """
+    json_data = response.json()
+    if response.status_code == 200:
+        result = json_data['result']
+        return result if model is None else model(result)
+    raise _error(response, json_data, exception, with_status_code)
+
+
+def parse_status(response, exception, with_status_code=False):
+    """
+    Return the status of a reply to an action, e.g. 'success', or raise
+    `exception` like parse_result
+    """
+    json_data = response.json()
+    if response.status_code == 200:
+        return json_data['status']
+    raise _error(response, json_data, exception, with_status_code)
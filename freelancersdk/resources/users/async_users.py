@@ -0,0 +1,81 @@
+"""
+This module contains awaitable functions for user operations. They take an
+AsyncSession and mirror the functions in the users module, sharing their
+requests and the parsing of the replies
+"""
+
+from freelancersdk.async_session import run_batch_async, traced_async
+from freelancersdk.batch import MAX_QUERY_LENGTH
+from freelancersdk.resources.results import parse_result, parse_status
+from freelancersdk.resources.users import (
+    make_post_request, make_put_request, make_delete_request,
+    create_get_users_bulk_queries)
+from freelancersdk.resources.users.types import UsersResult
+from freelancersdk.resources.users.exceptions import (
+    UserJobsNotAddedException, UserJobsNotSetException,
+    UserJobsNotDeletedException, UsersNotFoundException,
+)
+from freelancersdk.resources.users.users import (
+    _get_self_request, _self_user_id, _user_jobs_request, _get_users_request,
+    _merged_users,
+)
+
+
+@traced_async
+async def get_self_user_id(session):
+    """
+    Get the currently authenticated user ID
+    """
+    return _self_user_id(await _get_self_request(session))
+
+
+@traced_async
+async def add_user_jobs(session, job_ids):
+    """
+    Add a list of jobs to the currently authenticated user
+    """
+    response = await _user_jobs_request(make_post_request, session, job_ids)
+    return parse_status(response, UserJobsNotAddedException)
+
+
+@traced_async
+async def set_user_jobs(session, job_ids):
+    """
+    Replace the currently authenticated user's list of jobs with a new list of
+    jobs
+    """
+    response = await _user_jobs_request(make_put_request, session, job_ids)
+    return parse_status(response, UserJobsNotSetException)
+
+
+@traced_async
+async def delete_user_jobs(session, job_ids):
+    """
+    Remove a list of jobs from the currently authenticated user
+    """
+    response = await _user_jobs_request(make_delete_request, session, job_ids)
+    return parse_status(response, UserJobsNotDeletedException)
+
+
+@traced_async
+async def get_users(session, query):
+    """
+    Get one or more users
+    """
+    response = await _get_users_request(session, query)
+    return parse_result(response, UsersNotFoundException, UsersResult)
+
+
+@traced_async
+async def get_users_bulk(session, query, max_concurrency=4, max_users=100,
+                         max_query_length=MAX_QUERY_LENGTH):
+    """
+    Get any number of users, with at most `max_concurrency` requests in
+    flight. The result is the same as for the get_users_bulk function of the
+    users module
+    """
+    queries = create_get_users_bulk_queries(
+        query, max_query_length=max_query_length, max_users=max_users)
+    outcomes = await run_batch_async(lambda q: get_users(session, q), queries,
+                                     max_concurrency=max_concurrency)
+    return _merged_users(outcomes)
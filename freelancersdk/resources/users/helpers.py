@@ -1,49 +1,33 @@
 # This module will contain helper functions/classes for users
 # Reference: https://www.freelancer.com/api/docs/structs/index
 
+from freelancersdk.batch import MAX_QUERY_LENGTH, chunk_query, unique
 from freelancersdk.resources.users import users_endpoint
 
-try:
-    from urlparse import urljoin
-except ImportError:
-    from urllib.parse import urljoin
-
 
 # Make API calls
 # /api/users/0.1/<specific_endpoint>
 def make_post_request(session, endpoint, json_data):
-    return session.session.post(urljoin(session.url,
-                                        '%s/%s/' % (users_endpoint, endpoint)),
-                                json=json_data,
-                                verify=True)
+    return session.request('POST', users_endpoint, endpoint, json=json_data)
 
 
-def make_get_request(session, endpoint, params_data):
-    url = urljoin(session.url, '{}/{}/'.format(users_endpoint, endpoint))
-    return session.session.get(url, params=params_data, verify=True)
+def make_get_request(session, endpoint, params_data=None):
+    return session.request('GET', users_endpoint, endpoint,
+                           params=params_data)
 
 
 def make_put_request(session, endpoint, headers=None, params_data=None,
                      form_data=None, json_data=None):
-    return session.session.put(urljoin(session.url,
-                                       '%s/%s/' % (users_endpoint, endpoint)),
-                               headers=headers,
-                               params=params_data,
-                               data=form_data,
-                               json=json_data,
-                               verify=True)
+    return session.request('PUT', users_endpoint, endpoint, headers=headers,
+                           params=params_data, data=form_data,
+                           json=json_data)
 
 
 def make_delete_request(session, endpoint, headers=None, params_data=None,
                         form_data=None, json_data=None):
-    return session.session.delete(urljoin(session.url,
-                                          '%s/%s/' % (users_endpoint,
-                                                      endpoint)),
-                                  headers=headers,
-                                  params=params_data,
-                                  data=form_data,
-                                  json=json_data,
-                                  verify=True)
+    return session.request('DELETE', users_endpoint, endpoint,
+                           headers=headers, params=params_data,
+                           data=form_data, json=json_data)
 
 
 def create_get_users_object(user_ids=None, usernames=None, user_details=None):
@@ -57,6 +41,24 @@ def create_get_users_object(user_ids=None, usernames=None, user_details=None):
     return u
 
 
+def create_get_users_bulk_queries(query, max_query_length=MAX_QUERY_LENGTH,
+                                  max_users=100):
+    """
+    Split a get_users query into queries for at most `max_users` unique user
+    ids or usernames each, whose query strings stay within max_query_length
+    """
+    id_keys = ('users[]', 'usernames[]')
+    details = dict((k, v) for k, v in query.items() if k not in id_keys)
+    queries = []
+    for key in id_keys:
+        if query.get(key):
+            q = dict(details)
+            q[key] = unique(query[key])
+            queries.extend(chunk_query(q, key, max_length=max_query_length,
+                                       max_values=max_users))
+    return queries
+
+
 def create_get_users_details_object(basic=None, avatar=None,
                                             country=None,
                                             profile_description=None,
@@ -0,0 +1,27 @@
+from freelancersdk.models import Model, Result, index, lazy_property
+
+
+class User(Model):
+    """
+    Create a User object from the JSON data retrieved from the API
+    """
+    fields = ('id', 'username', 'display_name', 'public_name', 'closed',
+              'avatar', 'avatar_large', 'avatar_cdn', 'avatar_large_cdn',
+              'email', 'role', 'chosen_role', 'status', 'reputation',
+              'employer_reputation', 'location', 'registration_date',
+              'limited_account', 'primary_currency', 'primary_language',
+              'jobs', 'tagline', 'hourly_rate', 'profile_description',
+              'badges', 'qualifications', 'portfolio_count',
+              'preferred_freelancer', 'membership_package', 'timezone',
+              'true_location', 'spam_profile', 'is_active', 'cover_image',
+              'responsiveness', 'corporate', 'force_verify')
+
+
+class UsersResult(Result):
+    """
+    The result of get_users. `users` maps the user ids to User objects
+    """
+
+    @lazy_property
+    def users(self):
+        return index(self.get('users'), User)
@@ -1,17 +1,26 @@
+from freelancersdk.batch import MAX_QUERY_LENGTH, merge_results, run_batch
+from freelancersdk.tracing import traced
+from freelancersdk.resources.results import parse_result, parse_status
 from freelancersdk.resources.users import (
-    make_get_request, make_post_request, make_put_request, make_delete_request)
+    make_get_request, make_post_request, make_put_request, make_delete_request,
+    create_get_users_bulk_queries)
+from freelancersdk.resources.users.types import UsersResult
 from freelancersdk.resources.users.exceptions import (
     UserIdNotRetrievedException,
     UserJobsNotAddedException, UserJobsNotSetException,
     UserJobsNotDeletedException, UsersNotFoundException,
 )
 
+# The private _*_request functions below send a call and return the
+# response, or an awaitable of it with an AsyncSession. The async_users
+# module shares them, and the parsing of the replies, with this module
 
-def get_self_user_id(session):
-    """
-    Get the currently authenticated user ID
-    """
-    response = make_get_request(session, 'self')
+
+def _get_self_request(session):
+    return make_get_request(session, 'self')
+
+
+def _self_user_id(response):
     if response.status_code == 200:
         return response.json()['result']['id']
     else:
@@ -19,63 +28,83 @@ def get_self_user_id(session):
             'Error retrieving user id: %s' % response.text, response.text)
 
 
-def add_user_jobs(session, job_ids):
+@traced
+def get_self_user_id(session):
     """
-    Add a list of jobs to the currently authenticated user
+    Get the currently authenticated user ID
     """
+    return _self_user_id(_get_self_request(session))
+
+
+def _user_jobs_request(make_request, session, job_ids):
     jobs_data = {
         'jobs[]': job_ids
     }
-    response = make_post_request(session, 'self/jobs', json_data=jobs_data)
-    json_data = response.json()
-    if response.status_code == 200:
-        return json_data['status']
-    else:
-        raise UserJobsNotAddedException(
-            message=json_data['message'], error_code=json_data['error_code'])
+    return make_request(session, 'self/jobs', json_data=jobs_data)
 
 
+@traced
+def add_user_jobs(session, job_ids):
+    """
+    Add a list of jobs to the currently authenticated user
+    """
+    response = _user_jobs_request(make_post_request, session, job_ids)
+    return parse_status(response, UserJobsNotAddedException)
+
+
+@traced
 def set_user_jobs(session, job_ids):
     """
     Replace the currently authenticated user's list of jobs with a new list of
     jobs
     """
-    jobs_data = {
-        'jobs[]': job_ids
-    }
-    response = make_put_request(session, 'self/jobs', json_data=jobs_data)
-    json_data = response.json()
-    if response.status_code == 200:
-        return json_data['status']
-    else:
-        raise UserJobsNotSetException(
-            message=json_data['message'], error_code=json_data['error_code'])
+    response = _user_jobs_request(make_put_request, session, job_ids)
+    return parse_status(response, UserJobsNotSetException)
 
 
+@traced
 def delete_user_jobs(session, job_ids):
     """
     Remove a list of jobs from the currently authenticated user
     """
-    jobs_data = {
-        'jobs[]': job_ids
-    }
-    response = make_delete_request(session, 'self/jobs', json_data=jobs_data)
-    json_data = response.json()
-    if response.status_code == 200:
-        return json_data['status']
-    else:
-        raise UserJobsNotDeletedException(
-            message=json_data['message'], error_code=json_data['error_code'])
+    response = _user_jobs_request(make_delete_request, session, job_ids)
+    return parse_status(response, UserJobsNotDeletedException)
+
+
+def _get_users_request(session, query):
+    # GET /api/users/0.1/users
+    return make_get_request(session, 'users', params_data=query)
+
 
+@traced
 def get_users(session, query):
     """
     Get one or more users
     """
-    # GET /api/users/0.1/users
-    response = make_get_request(session, 'users', params_data=query)
-    json_data = response.json()
-    if response.status_code == 200:
-        return json_data['result']
-    else:
-        raise UsersNotFoundException(
-            message=json_data['message'], error_code=json_data['error_code'])
+    response = _get_users_request(session, query)
+    return parse_result(response, UsersNotFoundException, UsersResult)
+
+
+def _merged_users(outcomes):
+    # Merge the results of the chunks of get_users_bulk into one
+    result = merge_results(o.result for o in outcomes if o.ok)
+    result.setdefault('users', {})
+    result['failed'] = [o for o in outcomes if not o.ok]
+    return UsersResult(result)
+
+
+@traced
+def get_users_bulk(session, query, max_workers=4, max_users=100,
+                   max_query_length=MAX_QUERY_LENGTH):
+    """
+    Get any number of users. The user ids and usernames of the query are
+    deduplicated, split into chunks of at most `max_users` and fetched on up
+    to `max_workers` threads. The result's 'users' map holds every user by
+    id, and its 'failed' list the Outcome of every chunk that could not be
+    fetched
+    """
+    queries = create_get_users_bulk_queries(
+        query, max_query_length=max_query_length, max_users=max_users)
+    outcomes = run_batch(lambda q: get_users(session, q), queries,
+                         max_workers=max_workers)
+    return _merged_users(outcomes)
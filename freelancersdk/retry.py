@@ -0,0 +1,136 @@
+"""
+This module contains the retry middleware for Session
+"""
+
+import fnmatch
+import random
+import time
+from email.utils import mktime_tz, parsedate_tz
+
+from requests.exceptions import ConnectionError, ConnectTimeout, Timeout
+
+
+# Methods which can be repeated without changing the result
+IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS'])
+
+# Other requests which are safe to repeat, as (method, namespace, endpoint).
+# Endpoints may contain shell-style wildcards, e.g. 'bids/*'
+IDEMPOTENT_ENDPOINTS = frozenset([
+    # Replacing and removing the user's jobs gives the same result twice
+    ('PUT', 'users', 'self/jobs'),
+    ('DELETE', 'users', 'self/jobs'),
+])
+
+# Responses which tell us the request was not processed at all
+REJECTED_STATUSES = frozenset([429])
+
+
+def parse_retry_after(value, now=None):
+    """
+    Return the number of seconds to wait from a Retry-After header, which
+    holds either a number of seconds or a HTTP date
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    date = parsedate_tz(value)
+    if date is None:
+        return None
+    if now is None:
+        now = time.time()
+    return max(mktime_tz(date) - now, 0.0)
+
+
+class RetryPolicy(object):
+    """
+    Middleware which retries failed requests with jittered exponential
+    backoff: the n-th retry waits a random time between 0 and
+    `backoff_factor * 2 ** n` seconds, at most `max_backoff`. A Retry-After
+    header from the server takes precedence, up to `max_retry_after`.
+
+    Idempotent requests (GETs and `idempotent_endpoints`) are retried on any
+    of `retry_statuses` and on connection errors and timeouts. Other
+    requests, such as placing a bid or creating a milestone payment, are
+    only retried when the server has certainly not processed them: on a 429
+    response or when the connection could not be established.
+    """
+
+    def __init__(self, max_retries=3, backoff_factor=0.5, max_backoff=30,
+                 retry_statuses=(429, 500, 502, 503, 504),
+                 respect_retry_after=True, max_retry_after=300,
+                 idempotent_endpoints=IDEMPOTENT_ENDPOINTS,
+                 sleep=time.sleep):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.idempotent_endpoints = frozenset(idempotent_endpoints)
+        self.sleep = sleep
+
+    def is_idempotent(self, request):
+        """
+        Whether the request can safely be sent more than once. Set
+        request.context['idempotent'] to override the classification
+        """
+        idempotent = request.context.get('idempotent')
+        if idempotent is not None:
+            return idempotent
+        if request.method in IDEMPOTENT_METHODS:
+            return True
+        for method, namespace, endpoint in self.idempotent_endpoints:
+            if method == request.method and \
+                    namespace == request.namespace and \
+                    fnmatch.fnmatchcase(request.endpoint, endpoint):
+                return True
+        return False
+
+    def should_retry_status(self, request, status_code):
+        if status_code not in self.retry_statuses:
+            return False
+        return status_code in REJECTED_STATUSES or self.is_idempotent(request)
+
+    def should_retry_error(self, request, error):
+        if isinstance(error, ConnectTimeout):
+            return True
+        if isinstance(error, (ConnectionError, Timeout)):
+            return self.is_idempotent(request)
+        return False
+
+    def backoff(self, retry, response=None):
+        """
+        Return the number of seconds to wait before the given retry
+        """
+        if response is not None and self.respect_retry_after:
+            retry_after = parse_retry_after(
+                response.headers.get('Retry-After'))
+            if retry_after is not None:
+                return min(retry_after, self.max_retry_after)
+        ceiling = min(self.backoff_factor * (2 ** retry), self.max_backoff)
+        return random.uniform(0, ceiling)
+
+    def __call__(self, request, send):
+        retry = 0
+        while True:
+            try:
+                response = send(request)
+            except Exception as e:
+                if retry >= self.max_retries or \
+                        not self.should_retry_error(request, e):
+                    raise
+                delay = self.backoff(retry)
+            else:
+                if retry >= self.max_retries or \
+                        not self.should_retry_status(request,
+                                                     response.status_code):
+                    return response
+                delay = self.backoff(retry, response)
+                close = getattr(response, 'close', None)
+                if close is not None:
+                    close()
+            retry += 1
+            request.context['retries'] = retry
+            self.sleep(delay)
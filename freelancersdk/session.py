@@ -1,25 +1,218 @@
+import functools
+import json
+
 import requests
+from requests.structures import CaseInsensitiveDict
 
+from freelancersdk.decoding import decode_json
 from freelancersdk.exceptions import AuthTokenNotSuppliedException
+from freelancersdk.pooling import PoolingAdapter, keep_alive_socket_options
+from freelancersdk.tracing import trace_decode, trace_send
+
+try:
+    from urlparse import urljoin
+except ImportError:
+    from urllib.parse import urljoin
+
+
+class Request(object):
+    """
+    A request to the API, as seen by middleware. `api` is the versioned API
+    path, e.g. api/projects/0.1, `namespace` its name, e.g. projects, and
+    `options` the keyword arguments for the HTTP client (params, json, data,
+    headers and files). Middleware may use `context` to pass values along
+    """
+
+    def __init__(self, method, api, namespace, endpoint, url, options):
+        self.method = method
+        self.api = api
+        self.namespace = namespace
+        self.endpoint = endpoint
+        self.url = url
+        self.options = options
+        self.context = {}
+
+
+def _chain(middleware, send):
+    def handler(request):
+        return middleware(request, send)
+    return handler
+
 
+class BaseSession(object):
+    """
+    Request dispatch shared by Session and AsyncSession. Every resource
+    function goes through `request`, which runs the session's middleware and
+    finally `send`.
+
+    A middleware is a callable taking the request and the next handler,
+    `middleware(request, send)`, and returning the response of `send(request)`
+    or one of its own. Middleware added first runs outermost. `middlewares`
+    is a read-only tuple: use add_middleware and remove_middleware to change
+    it.
+
+    `json_loads` replaces the standard library decoder of response bodies,
+    e.g. with decoding.fastest_loads(). It is given the raw bytes.
 
-class Session():
+    `tracer`, a tracing.Tracer, records spans of the calls made through the
+    session.
+    """
+
+    def __init__(self, url, middlewares=None, json_loads=None, tracer=None):
+        self.url = url or 'https://www.freelancer.com'
+        self._middlewares = tuple(middlewares or ())
+        self.json_loads = json_loads
+        self.tracer = tracer
+        self._handler = None
+
+    @property
+    def url(self):
+        return self._url
+
+    @url.setter
+    def url(self, url):
+        self._url = url
+        self._base_urls = {}
+
+    def base_url(self, api):
+        """
+        Return the base URL and namespace name of an API path, e.g.
+        api/projects/0.1. They are computed once per session
+        """
+        try:
+            return self._base_urls[api]
+        except KeyError:
+            base = (urljoin(self._url, api + '/'), api.split('/')[1])
+            self._base_urls[api] = base
+            return base
+
+    @property
+    def middlewares(self):
+        return self._middlewares
+
+    def add_middleware(self, middleware):
+        self._middlewares += (middleware,)
+        self._handler = None
+
+    def remove_middleware(self, middleware):
+        middlewares = list(self._middlewares)
+        middlewares.remove(middleware)
+        self._middlewares = tuple(middlewares)
+        self._handler = None
+
+    def request(self, method, api, endpoint, **options):
+        """
+        Make a request to /<api>/<endpoint>/ through the middleware
+        """
+        base, namespace = self.base_url(api)
+        request = Request(method, api, namespace, endpoint,
+                          '{}{}/'.format(base, endpoint), options)
+        handler = self._handler
+        if handler is None:
+            handler = self.send
+            for middleware in reversed(self._middlewares):
+                handler = _chain(middleware, handler)
+            self._handler = handler
+        return handler(request)
+
+    def send(self, request):
+        raise NotImplementedError
+
+
+class Session(BaseSession):
     """
     This class will manage a HTTP session to the freelancer.com API
+
+    Connections are pooled per host: `pool_connections` is the number of
+    hosts to keep pools for, `pool_maxsize` the number of connections kept
+    open to each host and `pool_block` makes requests wait for a free
+    connection instead of opening a throwaway one. TCP keep-alive is enabled
+    unless `keep_alive` is False; `socket_options` overrides the socket
+    options entirely.
     """
 
-    def __init__(self, oauth_token=None, url='https://www.freelancer.com'):
+    def __init__(self, oauth_token=None, url='https://www.freelancer.com',
+                 pool_connections=10, pool_maxsize=10, pool_block=False,
+                 keep_alive=True, socket_options=None, middlewares=None,
+                 json_loads=None, tracer=None):
         if not oauth_token:
             raise AuthTokenNotSuppliedException('OAuth token not supplied')
+        super(Session, self).__init__(url, middlewares=middlewares,
+                                      json_loads=json_loads, tracer=tracer)
 
         self.session = requests.Session()
-        if url:
-            self.url = url
-        else:
-            self.url = 'https://www.freelancer.com'
+        if socket_options is None and keep_alive:
+            socket_options = keep_alive_socket_options()
+        self.adapter = PoolingAdapter(pool_connections=pool_connections,
+                                      pool_maxsize=pool_maxsize,
+                                      pool_block=pool_block,
+                                      socket_options=socket_options)
+        self.session.mount('https://', self.adapter)
+        self.session.mount('http://', self.adapter)
 
         # Set default headers
         default_headers = {'Freelancer-OAuth-V1': oauth_token,
                            'User-Agent': 'Freelancer.com SDK',
                            }
         self.session.headers.update(default_headers)
+
+    def request(self, method, api, endpoint, **options):
+        response = super(Session, self).request(method, api, endpoint,
+                                                **options)
+        if self.json_loads is not None:
+            if isinstance(response, BufferedResponse):
+                response.loads = response.loads or self.json_loads
+            else:
+                response.json = functools.partial(decode_json, response,
+                                                  self.json_loads)
+        if self.tracer is not None and not options.get('stream'):
+            trace_decode(self.tracer, response)
+        return response
+
+    def send(self, request):
+        if self.tracer is not None:
+            return trace_send(self.tracer, request, self._send)
+        return self._send(request)
+
+    def _send(self, request):
+        send = getattr(self.session, request.method.lower())
+        return send(url=request.url, verify=True, **request.options)
+
+    def connection_stats(self):
+        """
+        Return the number of requests sent, connections opened and
+        connections reused, in total and per host
+        """
+        return self.adapter.stats.snapshot()
+
+
+class BufferedResponse(object):
+    """
+    A HTTP response whose body has already been read in full. It exposes the
+    subset of the requests Response interface used by the resource functions
+    """
+
+    def __init__(self, status_code, content, headers=None, url=None,
+                 encoding=None, loads=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = CaseInsensitiveDict(headers or {})
+        self.url = url
+        self.encoding = encoding or 'utf-8'
+        self.loads = loads
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding, 'replace')
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+
+    def close(self):
+        pass
+
+    def json(self):
+        if self.loads is not None:
+            return decode_json(self, self.loads)
+        return json.loads(self.text)
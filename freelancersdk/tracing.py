@@ -0,0 +1,285 @@
+"""
+This module contains the tracing of SDK calls: spans for each resource
+function and the phases of its HTTP requests
+"""
+
+import datetime
+import functools
+import random
+import threading
+import time
+
+try:
+    import contextvars
+except ImportError:
+    contextvars = None
+
+
+if contextvars is not None:
+    _current = contextvars.ContextVar('freelancersdk_span', default=None)
+
+    def current_span():
+        """
+        Return the span in progress in this thread or task, if any
+        """
+        return _current.get()
+
+    def _activate(span):
+        return _current.set(span)
+
+    def _deactivate(token):
+        _current.reset(token)
+else:
+    _local = threading.local()
+
+    def current_span():
+        """
+        Return the span in progress in this thread, if any
+        """
+        return getattr(_local, 'span', None)
+
+    def _activate(span):
+        previous = current_span()
+        _local.span = span
+        return previous
+
+    def _deactivate(previous):
+        _local.span = previous
+
+
+def _new_id(bits):
+    return '{:0{}x}'.format(random.getrandbits(bits), bits // 4)
+
+
+class Span(object):
+    """
+    A timed operation of a trace. Use it as a context manager to make it
+    the parent of the spans started inside, and to end it on exit. An
+    exception raised inside marks it as failed
+    """
+
+    def __init__(self, tracer, name, trace_id, parent_id=None,
+                 attributes=None, start_time=None):
+        self.tracer = tracer
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = _new_id(64)
+        self.parent_id = parent_id
+        self.attributes = dict(attributes or {})
+        self.start_time = tracer.clock() if start_time is None \
+            else start_time
+        self.end_time = None
+        self.status = 'ok'
+        self.error = None
+        self._token = None
+
+    @property
+    def duration(self):
+        if self.end_time is None:
+            return None
+        return self.end_time - self.start_time
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def record_exception(self, exception):
+        self.status = 'error'
+        self.error = exception
+        self.attributes['error.type'] = type(exception).__name__
+
+    def end(self, end_time=None):
+        if self.end_time is not None:
+            return
+        self.end_time = self.tracer.clock() if end_time is None \
+            else end_time
+        self.tracer.exporter.export(self)
+
+    def __enter__(self):
+        self._token = _activate(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _deactivate(self._token)
+        if exc is not None:
+            self.record_exception(exc)
+        self.end()
+
+    def __repr__(self):
+        return '<Span {} {}>'.format(self.name, self.span_id)
+
+
+class InMemoryExporter(object):
+    """
+    Exporter which keeps ended spans in a list, for tests and debugging
+    """
+
+    def __init__(self):
+        self.spans = []
+        self._lock = threading.Lock()
+
+    def export(self, span):
+        with self._lock:
+            self.spans.append(span)
+
+    def find(self, name):
+        """
+        Return the ended spans with the given name
+        """
+        with self._lock:
+            return [span for span in self.spans if span.name == name]
+
+    def clear(self):
+        with self._lock:
+            del self.spans[:]
+
+
+class Tracer(object):
+    """
+    Creates spans and hands them to an exporter when they end. Any object
+    with an `export(span)` method can be the exporter, e.g. an adapter to
+    OpenTelemetry; the default is an InMemoryExporter.
+
+    Set it as the `tracer` of a session to trace its calls: every resource
+    function gets a span, e.g. projects.create_milestone_payment, with its
+    ids as attributes, and each HTTP attempt a send span with connect,
+    wait and decode spans inside.
+    """
+
+    def __init__(self, exporter=None, clock=time.time):
+        self.exporter = exporter if exporter is not None \
+            else InMemoryExporter()
+        self.clock = clock
+
+    def start_span(self, name, attributes=None, parent=None,
+                   start_time=None):
+        """
+        Start a span, by default as a child of the span in progress
+        """
+        if parent is None:
+            parent = current_span()
+        if parent is None:
+            return Span(self, name, _new_id(128), attributes=attributes,
+                        start_time=start_time)
+        return Span(self, name, parent.trace_id, parent.span_id,
+                    attributes=attributes, start_time=start_time)
+
+
+def span_name(func):
+    """
+    Return the span name of a resource function, e.g. projects.get_bids
+    """
+    parts = func.__module__.split('.')
+    return '{}.{}'.format(parts[-2] if len(parts) > 1 else parts[0],
+                          func.__name__)
+
+
+def function_span(func):
+    """
+    Return a function starting the span of a call to a resource function,
+    given the tracer and the arguments after the session. The ids it is
+    called with, e.g. bid_id or project_ids, are set as attributes
+    """
+    code = func.__code__
+    names = code.co_varnames[1:code.co_argcount]
+    name = span_name(func)
+
+    def start(tracer, args, kwargs):
+        attributes = {'sdk.function': func.__name__}
+        values = dict(zip(names, args))
+        values.update(kwargs)
+        for key, value in values.items():
+            if key.endswith('_id') or key.endswith('_ids'):
+                if isinstance(value, list):
+                    value = tuple(value)
+                attributes['sdk.' + key] = value
+        return tracer.start_span(name, attributes)
+
+    return start
+
+
+def traced(func):
+    """
+    Decorator giving a resource function a span when its session has a
+    tracer. Without one it adds a single attribute lookup to the call
+    """
+    start = function_span(func)
+
+    @functools.wraps(func)
+    def wrapper(session, *args, **kwargs):
+        tracer = getattr(session, 'tracer', None)
+        if tracer is None:
+            return func(session, *args, **kwargs)
+        with start(tracer, args, kwargs):
+            return func(session, *args, **kwargs)
+
+    return wrapper
+
+
+def send_span(tracer, request):
+    """
+    Start the span of an HTTP attempt, noting the retries so far on the
+    span of the resource function too
+    """
+    retries = request.context.get('retries', 0)
+    parent = current_span()
+    if parent is not None:
+        parent.set_attribute('sdk.retries', retries)
+    return tracer.start_span('send', {
+        'http.method': request.method,
+        'http.url': request.url,
+        'sdk.namespace': request.namespace,
+        'sdk.endpoint': request.endpoint,
+        'sdk.retries': retries,
+    }, parent=parent)
+
+
+def trace_send(tracer, request, send):
+    """
+    Send a request inside a send span, with a wait span for the time until
+    the response headers arrived, connecting included, when the HTTP client
+    reports it
+    """
+    with send_span(tracer, request) as span:
+        response = send(request)
+        span.set_attribute('http.status_code', response.status_code)
+        elapsed = getattr(response, 'elapsed', None)
+        if isinstance(elapsed, datetime.timedelta):
+            wait = tracer.start_span('wait', parent=span,
+                                     start_time=span.start_time)
+            wait.end(span.start_time + elapsed.total_seconds())
+    return response
+
+
+def trace_decode(tracer, response):
+    """
+    Make the response's json() record a decode span, once per response
+    """
+    decode = response.json
+    if getattr(decode, 'traced', False):
+        return
+
+    def json():
+        with tracer.start_span('decode',
+                               {'http.response_bytes': len(response.content)}):
+            return decode()
+
+    json.traced = True
+    response.json = json
+
+
+def traced_connection(connection_class):
+    """
+    Return a subclass of a urllib3 connection class which records a
+    connect span when a span is in progress
+    """
+
+    def connect(self):
+        span = current_span()
+        if span is None:
+            return connection_class.connect(self)
+        with span.tracer.start_span('connect', {'net.peer.name': self.host,
+                                                'net.peer.port': self.port}):
+            return connection_class.connect(self)
+
+    return type('Traced' + connection_class.__name__, (connection_class,),
+                {'connect': connect})
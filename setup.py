@@ -11,6 +11,9 @@ dependencies = [
 if sys.version_info < (3, 4):
     dependencies.append('enum34')
 
+if sys.version_info < (3, 2):
+    dependencies.append('futures')
+
 with open('PYPI_DESCRIPTION.rst') as file:
     long_description = file.read()
 
@@ -34,4 +37,7 @@ setuptools.setup(
     ],
     packages=setuptools.find_packages(),
     install_requires=dependencies,
+    extras_require={
+        'async': ['aiohttp >= 3.0.0'],
+    },
 )
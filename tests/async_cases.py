@@ -0,0 +1,216 @@
+"""
+The tests of the asyncio session, which are Python 3 only syntax and are
+imported by test_async when aiohttp is installed
+"""
+
+import asyncio
+import json
+import unittest
+
+from freelancersdk.async_session import AsyncSession, AsyncRetryPolicy
+from freelancersdk.resources.projects.async_projects import (
+    create_project, get_projects, get_bids, award_project_bid,
+    apply_bid_actions,
+)
+from freelancersdk.resources.projects.exceptions import (
+    ProjectsNotFoundException, BidNotRetractedException,
+)
+from freelancersdk.resources.users.async_users import (
+    get_self_user_id, delete_user_jobs, get_users_bulk,
+)
+from freelancersdk.resources.messages.async_messages import (
+    create_project_thread,
+)
+from freelancersdk.resources.contests.async_contests import create_contest
+from freelancersdk.tracing import InMemoryExporter, Tracer
+from freelancersdk.resources.users.helpers import create_get_users_object
+from freelancersdk.resources.projects.helpers import (
+    create_budget_object, create_currency_object, create_job_object,
+    create_get_projects_object,
+)
+
+
+class FakeClientResponse:
+
+    def __init__(self, status, body):
+        self.status = status
+        self.headers = {'Content-Type': 'application/json'}
+        self.url = 'https://fake-fln.com'
+        self.charset = 'utf-8'
+        self._body = json.dumps(body).encode('utf-8')
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
+
+    async def read(self):
+        return self._body
+
+
+class FakeClientSession:
+
+    def __init__(self, status, body):
+        self.status = status
+        self.body = body
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        status = self.status
+        if isinstance(status, list):
+            status = status.pop(0)
+        return FakeClientResponse(status, self.body)
+
+    async def close(self):
+        pass
+
+
+class TestAsyncSession(unittest.TestCase):
+    def setUp(self):
+        self.session = AsyncSession(oauth_token='$sometoken',
+                                    url='https://fake-fln.com')
+
+    def tearDown(self):
+        pass
+
+    def fake(self, body, status=200):
+        self.session.session = FakeClientSession(status, body)
+        return self.session.session
+
+    def test_create_project(self):
+        client = self.fake({'result': {'title': 'My New Project',
+                                       'seo_url': 'java/foo'}})
+        project_data = {
+            'title': 'My new project',
+            'description': 'description',
+            'currency': create_currency_object(id=1),
+            'budget': create_budget_object(minimum=10),
+            'jobs': [create_job_object(id=7)],
+        }
+        p = asyncio.run(create_project(self.session, **project_data))
+        method, url, kwargs = client.calls[0]
+        self.assertEqual(method, 'POST')
+        self.assertEqual(url,
+                         'https://fake-fln.com/api/projects/0.1/projects/')
+        self.assertEqual(kwargs['json'], project_data)
+        self.assertEqual(p.url, 'https://fake-fln.com/projects/java/foo')
+
+    def test_get_projects_flattens_list_params(self):
+        client = self.fake({'status': 'success', 'result': {'projects': []}})
+        query = create_get_projects_object(project_ids=[201, 202])
+        query.update(full_description=True)
+        result = asyncio.run(get_projects(self.session, query))
+        self.assertEqual(result, {'projects': []})
+        params = client.calls[0][2]['params']
+        self.assertEqual(params, [('projects[]', '201'),
+                                  ('projects[]', '202'),
+                                  ('full_description', 'True')])
+
+    def test_get_projects_error(self):
+        self.fake({'message': 'Not found', 'error_code': 'NOT_FOUND'},
+                  status=404)
+        with self.assertRaises(ProjectsNotFoundException):
+            asyncio.run(get_projects(self.session, {}))
+
+    def test_get_bids(self):
+        client = self.fake({'status': 'success', 'result': {'bids': []}})
+        asyncio.run(get_bids(self.session, project_ids=[101], limit=20))
+        self.assertIn(('project_ids[]', '101'), client.calls[0][2]['params'])
+        self.assertIn(('limit', '20'), client.calls[0][2]['params'])
+
+    def test_award_project_bid(self):
+        client = self.fake({'status': 'success'})
+        status = asyncio.run(award_project_bid(self.session, bid_id=1))
+        method, url, kwargs = client.calls[0]
+        self.assertEqual(method, 'PUT')
+        self.assertEqual(url, 'https://fake-fln.com/api/projects/0.1/bids/1/')
+        self.assertEqual(kwargs['params'], [('action', 'award')])
+        self.assertEqual(status, 'success')
+
+    def test_get_self_user_id(self):
+        client = self.fake({'status': 'success', 'result': {'id': 100}})
+        user_id = asyncio.run(get_self_user_id(self.session))
+        self.assertEqual(client.calls[0][1],
+                         'https://fake-fln.com/api/users/0.1/self/')
+        self.assertEqual(user_id, 100)
+
+    def test_delete_user_jobs(self):
+        client = self.fake({'status': 'success'})
+        asyncio.run(delete_user_jobs(self.session, job_ids=[1, 2]))
+        method, url, kwargs = client.calls[0]
+        self.assertEqual(method, 'DELETE')
+        self.assertEqual(kwargs['json'], {'jobs[]': [1, 2]})
+
+    def test_create_project_thread(self):
+        client = self.fake({'status': 'success', 'result': {'id': 301}})
+        t = asyncio.run(create_project_thread(self.session, [101, 102], 201,
+                                              'Hello'))
+        kwargs = client.calls[0][2]
+        self.assertIn(('members[]', '101'), kwargs['data'])
+        self.assertIn(('members[]', '102'), kwargs['data'])
+        self.assertEqual(t.id, 301)
+
+    def test_create_contest(self):
+        client = self.fake({'status': 'success',
+                            'result': {'title': 'Design a logo'}})
+        c = asyncio.run(create_contest(self.session, 'Design a logo', 'logo',
+                                       'freemium', 7, [1], 1, 100))
+        self.assertEqual(client.calls[0][1],
+                         'https://fake-fln.com/api/contests/0.1/contests/')
+        self.assertEqual(c.title, 'Design a logo')
+
+    def test_retry_policy(self):
+        delays = []
+
+        async def sleep(delay):
+            delays.append(delay)
+
+        self.session.add_middleware(AsyncRetryPolicy(sleep=sleep))
+        client = self.fake({'status': 'success', 'result': {'bids': []}},
+                           status=[503, 200])
+        result = asyncio.run(get_bids(self.session, project_ids=[101]))
+        self.assertEqual(result, {'bids': []})
+        self.assertEqual(len(client.calls), 2)
+        self.assertEqual(len(delays), 1)
+
+    def test_get_users_bulk(self):
+        client = self.fake({'status': 'success',
+                            'result': {'users': {'1': {'id': 1}}}})
+        query = create_get_users_object(user_ids=[1, 2, 3, 2, 1])
+        result = asyncio.run(get_users_bulk(self.session, query,
+                                            max_users=2))
+        self.assertEqual(len(client.calls), 2)
+        self.assertEqual(
+            sorted(c[2]['params'] for c in client.calls),
+            [[('users[]', '1'), ('users[]', '2')], [('users[]', '3')]])
+        self.assertEqual(result['users'], {'1': {'id': 1}})
+        self.assertEqual(result['failed'], [])
+
+    def test_tracing(self):
+        exporter = InMemoryExporter()
+        self.session.tracer = Tracer(exporter)
+        self.fake({'status': 'success', 'result': {'bids': []}})
+        asyncio.run(get_bids(self.session, project_ids=[101]))
+        [call] = exporter.find('projects.get_bids')
+        self.assertEqual(call.attributes['sdk.project_ids'], (101,))
+        [send] = exporter.find('send')
+        self.assertEqual(send.parent_id, call.span_id)
+        self.assertEqual(send.attributes['http.status_code'], 200)
+        [wait] = exporter.find('wait')
+        self.assertEqual(wait.parent_id, send.span_id)
+        [decode] = exporter.find('decode')
+        self.assertEqual(decode.parent_id, call.span_id)
+
+    def test_apply_bid_actions(self):
+        client = self.fake({'status': 'success', 'message': 'Bid is awarded',
+                            'error_code': 'BID_INVALID_STATE'},
+                           status=[200, 409])
+        outcomes = asyncio.run(apply_bid_actions(
+            self.session, [('award', 1), ('retract', 2)], max_concurrency=1))
+        self.assertEqual([c[2]['params'] for c in client.calls],
+                         [[('action', 'award')], [('action', 'retract')]])
+        self.assertEqual(outcomes[0].result, 'success')
+        self.assertIsInstance(outcomes[1].exception,
+                              BidNotRetractedException)
@@ -0,0 +1,10 @@
+try:
+    import asyncio  # noqa: F401
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# The tests use async def, which is a syntax error before Python 3.5, so
+# they are only imported when aiohttp, which needs Python 3, is installed
+if aiohttp:
+    from async_cases import TestAsyncSession  # noqa: F401
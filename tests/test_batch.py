@@ -0,0 +1,60 @@
+from freelancersdk.batch import chunk_query, merge_results, run_batch
+
+try:
+    from urllib import urlencode
+except ImportError:
+    from urllib.parse import urlencode
+
+import unittest
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def test_chunk_query_keeps_query_short(self):
+        query = {'projects[]': list(range(1000, 2000)), 'compact': True}
+        queries = chunk_query(query, 'projects[]', max_length=500)
+        self.assertTrue(len(queries) > 1)
+        ids = []
+        for q in queries:
+            self.assertTrue(len(urlencode(q, doseq=True)) <= 500)
+            self.assertEqual(q['compact'], True)
+            ids.extend(q['projects[]'])
+        self.assertEqual(ids, list(range(1000, 2000)))
+
+    def test_chunk_query_max_values(self):
+        queries = chunk_query({'users[]': [1, 2, 3, 4, 5]}, 'users[]',
+                              max_values=2)
+        self.assertEqual([q['users[]'] for q in queries],
+                         [[1, 2], [3, 4], [5]])
+
+    def test_merge_results(self):
+        merged = merge_results([
+            {'projects': [{'id': 1}], 'users': None, 'total_count': 1},
+            {'projects': [{'id': 2}], 'users': {'5': {'id': 5}}},
+            {'projects': [], 'users': {'6': {'id': 6}}},
+        ])
+        self.assertEqual(merged, {
+            'projects': [{'id': 1}, {'id': 2}],
+            'users': {'5': {'id': 5}, '6': {'id': 6}},
+            'total_count': 1,
+        })
+        merged = merge_results([{'projects': [{'id': 1}], 'total_count': 1},
+                                {'projects': [{'id': 2}], 'total_count': 1}])
+        self.assertEqual(merged['total_count'], 2)
+
+    def test_run_batch_reports_failures(self):
+        def call(item):
+            if item == 3:
+                raise ValueError('bad item')
+            return item * 2
+
+        outcomes = run_batch(call, range(5), max_workers=3)
+        self.assertEqual([o.item for o in outcomes], [0, 1, 2, 3, 4])
+        self.assertEqual([o.result for o in outcomes if o.ok], [0, 2, 4, 8])
+        self.assertFalse(outcomes[3].ok)
+        self.assertIsInstance(outcomes[3].exception, ValueError)
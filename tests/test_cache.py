@@ -0,0 +1,200 @@
+from freelancersdk.session import Session
+from freelancersdk.cache import ResponseCache, SQLiteCache
+from freelancersdk.resources.projects import get_jobs, get_projects
+from freelancersdk.resources.users import get_self_user_id
+from freelancersdk.resources.projects.exceptions import (
+    ProjectsNotFoundException,
+)
+try:
+    from unittest.mock import Mock
+except ImportError:
+    from mock import Mock
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeResponse:
+
+    def __init__(self, result, status_code=200):
+        self.status_code = status_code
+        self.headers = {'Content-Type': 'application/json'}
+        self.url = 'https://fake-fln.com'
+        self.encoding = 'utf-8'
+        self.content = json.dumps({
+            'status': 'success' if status_code == 200 else 'error',
+            'result': result,
+            'message': 'Error',
+            'error_code': 'ERROR',
+        }).encode('utf-8')
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8')
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = ResponseCache(ttl=10, clock=self.clock)
+        self.session = Session(oauth_token='$sometoken',
+                               url='https://fake-fln.com',
+                               middlewares=[self.cache])
+        self.session.session.get = Mock()
+
+    def tearDown(self):
+        pass
+
+    def test_caches_identical_requests(self):
+        self.session.session.get.return_value = FakeResponse({'id': 100})
+        self.assertEqual(get_self_user_id(self.session), 100)
+        self.assertEqual(get_self_user_id(self.session), 100)
+        self.assertEqual(self.session.session.get.call_count, 1)
+        stats = self.cache.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+
+    def test_params_are_normalized(self):
+        self.session.session.get.return_value = FakeResponse({'projects': []})
+        get_projects(self.session, {'projects[]': [1, 2], 'full': True})
+        get_projects(self.session, {'full': True, 'projects[]': [1, 2]})
+        get_projects(self.session, {'full': True, 'projects[]': [1, 3]})
+        self.assertEqual(self.session.session.get.call_count, 2)
+
+    def test_per_endpoint_ttl(self):
+        self.session.session.get.return_value = FakeResponse([])
+        get_projects(self.session, {})
+        get_jobs(self.session, [1], True, 'en')
+        self.clock.now += 11
+        get_projects(self.session, {})
+        get_jobs(self.session, [1], True, 'en')
+        self.assertEqual(self.session.session.get.call_count, 3)
+
+    def test_errors_are_not_cached(self):
+        self.session.session.get.return_value = FakeResponse(None, 500)
+        with self.assertRaises(ProjectsNotFoundException):
+            get_projects(self.session, {})
+        self.assertEqual(self.cache.stats()['entries'], 0)
+
+    def test_lru_eviction_under_memory_cap(self):
+        size = len(FakeResponse({'projects': []}).content)
+        self.cache.max_bytes = size * 2
+        self.session.session.get.return_value = FakeResponse({'projects': []})
+        get_projects(self.session, {'projects[]': [1]})
+        get_projects(self.session, {'projects[]': [2]})
+        get_projects(self.session, {'projects[]': [1]})
+        get_projects(self.session, {'projects[]': [3]})
+        stats = self.cache.stats()
+        self.assertEqual((stats['entries'], stats['evictions']), (2, 1))
+        self.assertEqual(stats['bytes'], size * 2)
+        get_projects(self.session, {'projects[]': [1]})
+        self.assertEqual(self.session.session.get.call_count, 3)
+
+    def test_invalidate(self):
+        self.session.session.get.return_value = FakeResponse({'id': 100})
+        get_self_user_id(self.session)
+        get_projects(self.session, {})
+        self.cache.invalidate('users', 'self')
+        self.assertEqual(self.cache.stats()['entries'], 1)
+        get_self_user_id(self.session)
+        self.assertEqual(self.session.session.get.call_count, 3)
+        self.cache.clear()
+        self.assertEqual(self.cache.stats()['entries'], 0)
+
+
+class TestSQLiteCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'responses.db')
+        self.clock = FakeClock()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def session(self, disk):
+        cache = ResponseCache(ttl=10, disk=disk, clock=self.clock)
+        session = Session(oauth_token='$sometoken', url='https://fake-fln.com',
+                          middlewares=[cache])
+        session.session.get = Mock()
+        session.session.get.return_value = FakeResponse({'id': 100})
+        return session, cache
+
+    def test_survives_restart(self):
+        first, _ = self.session(SQLiteCache(self.path, clock=self.clock))
+        self.assertEqual(get_self_user_id(first), 100)
+
+        second, cache = self.session(SQLiteCache(self.path, clock=self.clock))
+        self.assertEqual(get_self_user_id(second), 100)
+        self.assertEqual(get_self_user_id(second), 100)
+        self.assertFalse(second.session.get.called)
+        stats = cache.stats()
+        self.assertEqual((stats['hits'], stats['disk_hits']), (2, 1))
+
+    def test_expired_responses_are_refetched(self):
+        first, _ = self.session(SQLiteCache(self.path, clock=self.clock))
+        get_projects(first, {})
+        self.clock.now += 11
+        second, _ = self.session(SQLiteCache(self.path, clock=self.clock))
+        get_projects(second, {})
+        self.assertTrue(second.session.get.called)
+
+    def test_size_bounded_eviction(self):
+        response = FakeResponse({'projects': []})
+        disk = SQLiteCache(self.path, max_bytes=len(response.content) * 2,
+                           clock=self.clock)
+        for i in range(3):
+            self.clock.now += 1
+            disk.set(str(i), 'projects', 'projects', self.clock.now + 60,
+                     response)
+        self.clock.now += 1
+        disk.get('1')
+        disk.set('3', 'projects', 'projects', self.clock.now + 60, response)
+        self.assertEqual([k for k in '0123' if disk.get(k) is not None],
+                         ['1', '3'])
+
+    def test_invalidate(self):
+        session, cache = self.session(SQLiteCache(self.path,
+                                                  clock=self.clock))
+        get_self_user_id(session)
+        get_projects(session, {})
+        cache.invalidate('users')
+        session, cache = self.session(SQLiteCache(self.path,
+                                                  clock=self.clock))
+        get_self_user_id(session)
+        get_projects(session, {})
+        self.assertEqual(session.session.get.call_count, 1)
+
+    def test_concurrent_writers(self):
+        disk = SQLiteCache(self.path, clock=self.clock)
+        response = FakeResponse({'projects': []})
+
+        def write(n):
+            other = SQLiteCache(self.path, clock=self.clock)
+            for i in range(20):
+                other.set('{}-{}'.format(n, i), 'projects', 'projects',
+                          self.clock.now + 60, response)
+            other.close()
+
+        threads = [threading.Thread(target=write, args=(n,))
+                   for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertTrue(all(disk.get('{}-{}'.format(n, i)) is not None
+                            for n in range(4) for i in range(20)))
@@ -0,0 +1,121 @@
+from freelancersdk.session import Session
+from freelancersdk.compression import Compression, accept_encoding
+from freelancersdk.resources.projects import create_project, get_projects
+from freelancersdk.resources.projects.helpers import (
+    create_budget_object, create_currency_object, create_job_object,
+)
+try:
+    from unittest.mock import Mock
+except ImportError:
+    from mock import Mock
+
+import json
+import unittest
+import zlib
+
+
+class FakeRaw:
+
+    def __init__(self, size):
+        self.size = size
+
+    def tell(self):
+        return self.size
+
+
+class FakeResponse:
+
+    def __init__(self, result, wire_bytes=None, headers=None):
+        self.status_code = 200
+        self.headers = headers or {}
+        self.url = 'https://fake-fln.com'
+        self.encoding = 'utf-8'
+        self.content = json.dumps({
+            'status': 'success', 'result': result,
+        }).encode('utf-8')
+        self.raw = FakeRaw(wire_bytes) if wire_bytes is not None else None
+
+    def json(self):
+        return json.loads(self.content.decode('utf-8'))
+
+
+class TestCompression(unittest.TestCase):
+    def setUp(self):
+        self.compression = Compression()
+        self.session = Session(oauth_token='$sometoken',
+                               url='https://fake-fln.com',
+                               middlewares=[self.compression])
+        self.session.session.get = Mock()
+        self.session.session.post = Mock()
+
+    def tearDown(self):
+        pass
+
+    def test_accept_encoding_prefers_compressed_encodings(self):
+        encodings = accept_encoding().split(', ')
+        self.assertIn('gzip', encodings)
+        self.assertLess(encodings.index('gzip'), encodings.index('deflate'))
+
+    def test_counts_compressed_and_uncompressed_bytes(self):
+        response = FakeResponse({'projects': [{'id': 1}]}, wire_bytes=40,
+                                headers={'Content-Encoding': 'gzip'})
+        self.session.session.get.return_value = response
+        get_projects(self.session, {'projects[]': [1]})
+        get_projects(self.session, {'projects[]': [1]})
+
+        headers = self.session.session.get.call_args[1]['headers']
+        self.assertEqual(headers['Accept-Encoding'], accept_encoding())
+        stats = self.compression.stats()
+        self.assertEqual(stats['responses'], 2)
+        self.assertEqual(stats['compressed_bytes'], 80)
+        self.assertEqual(stats['uncompressed_bytes'],
+                         2 * len(response.content))
+        self.assertEqual(stats['families']['projects']['responses'], 2)
+
+    def test_falls_back_to_content_length(self):
+        response = FakeResponse({'projects': []},
+                                headers={'Content-Length': '25'})
+        self.session.session.get.return_value = response
+        get_projects(self.session, {'projects[]': [1]})
+        self.assertEqual(self.compression.stats()['compressed_bytes'], 25)
+
+    def test_request_bodies_are_not_compressed_by_default(self):
+        self.session.session.post.return_value = FakeResponse(
+            {'id': 1, 'seo_url': 'logo/title'})
+        create_project(self.session, 'Title', 'x' * 4096,
+                       create_currency_object(id=1),
+                       create_budget_object(minimum=10),
+                       [create_job_object(id=7)])
+        options = self.session.session.post.call_args[1]
+        self.assertIn('json', options)
+        self.assertNotIn('Content-Encoding', options['headers'])
+
+    def test_large_request_bodies_are_gzipped(self):
+        self.compression.compress_requests = True
+        self.session.session.post.return_value = FakeResponse(
+            {'id': 1, 'seo_url': 'logo/title'})
+        create_project(self.session, 'Title', 'x' * 4096,
+                       create_currency_object(id=1),
+                       create_budget_object(minimum=10),
+                       [create_job_object(id=7)])
+        options = self.session.session.post.call_args[1]
+        self.assertNotIn('json', options)
+        self.assertEqual(options['headers']['Content-Encoding'], 'gzip')
+        self.assertEqual(options['headers']['Content-Type'],
+                         'application/json')
+        body = json.loads(zlib.decompress(options['data'],
+                                          16 + zlib.MAX_WBITS))
+        self.assertEqual(body['description'], 'x' * 4096)
+        self.assertLess(len(options['data']), 4096)
+
+    def test_small_request_bodies_are_sent_as_is(self):
+        self.compression.compress_requests = True
+        self.session.session.post.return_value = FakeResponse(
+            {'id': 1, 'seo_url': 'logo/title'})
+        create_project(self.session, 'Title', 'Short',
+                       create_currency_object(id=1),
+                       create_budget_object(minimum=10),
+                       [create_job_object(id=7)])
+        options = self.session.session.post.call_args[1]
+        self.assertEqual(options['json']['description'], 'Short')
+        self.assertNotIn('Content-Encoding', options['headers'])
@@ -0,0 +1,79 @@
+from freelancersdk.session import Session
+from freelancersdk.conditional import ConditionalRequests, not_modified
+from freelancersdk.resources.projects import get_bids, get_projects
+try:
+    from unittest.mock import Mock
+except ImportError:
+    from mock import Mock
+
+import json
+import unittest
+
+
+class FakeResponse:
+
+    def __init__(self, status_code, result=None, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.url = 'https://fake-fln.com'
+        self.encoding = 'utf-8'
+        self.content = b''
+        if status_code == 200:
+            self.content = json.dumps({
+                'status': 'success', 'result': result,
+            }).encode('utf-8')
+
+    def json(self):
+        return json.loads(self.content.decode('utf-8'))
+
+
+class TestConditionalRequests(unittest.TestCase):
+    def setUp(self):
+        self.conditional = ConditionalRequests()
+        self.session = Session(oauth_token='$sometoken',
+                               url='https://fake-fln.com',
+                               middlewares=[self.conditional])
+        self.session.session.get = Mock()
+
+    def tearDown(self):
+        pass
+
+    def test_not_modified_returns_previous_result(self):
+        self.session.session.get.side_effect = [
+            FakeResponse(200, {'bids': [{'id': 1}]}, {'ETag': '"v1"'}),
+            FakeResponse(304),
+        ]
+        first = get_bids(self.session, project_ids=[101])
+        self.assertFalse(not_modified(first))
+        self.assertNotIn('headers', self.session.session.get.call_args[1])
+
+        second = get_bids(self.session, project_ids=[101])
+        self.assertTrue(not_modified(second))
+        self.assertEqual(second, first)
+        headers = self.session.session.get.call_args[1]['headers']
+        self.assertEqual(headers, {'If-None-Match': '"v1"'})
+
+    def test_modified_response_replaces_validators(self):
+        last_modified = 'Wed, 21 Oct 2015 07:28:00 GMT'
+        self.session.session.get.side_effect = [
+            FakeResponse(200, {'projects': []}, {'ETag': '"v1"'}),
+            FakeResponse(200, {'projects': [{'id': 2}]},
+                         {'Last-Modified': last_modified}),
+            FakeResponse(304),
+        ]
+        query = {'projects[]': [2]}
+        get_projects(self.session, query)
+        changed = get_projects(self.session, query)
+        self.assertFalse(not_modified(changed))
+        unchanged = get_projects(self.session, query)
+        self.assertTrue(not_modified(unchanged))
+        self.assertEqual(unchanged['projects'], [{'id': 2}])
+        headers = self.session.session.get.call_args[1]['headers']
+        self.assertEqual(headers, {'If-Modified-Since': last_modified})
+
+    def test_validators_are_kept_per_request(self):
+        self.session.session.get.return_value = FakeResponse(
+            200, {'bids': []}, {'ETag': '"v1"'})
+        get_bids(self.session, project_ids=[101])
+        get_bids(self.session, project_ids=[102])
+        self.assertNotIn('headers', self.session.session.get.call_args[1])
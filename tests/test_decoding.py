@@ -0,0 +1,111 @@
+from freelancersdk.session import Session
+from freelancersdk.decoding import fastest_loads, iter_json_array
+from freelancersdk.resources.projects import (
+    get_bids, stream_bids, stream_search_projects,
+)
+from freelancersdk.resources.projects.exceptions import BidsNotFoundException
+from freelancersdk.resources.projects.types import Project
+try:
+    from unittest.mock import Mock
+except ImportError:
+    from mock import Mock
+
+import json
+import unittest
+
+
+class FakeStreamedResponse:
+
+    def __init__(self, body, status_code=200, chunk_size=7):
+        self.status_code = status_code
+        self.content = json.dumps(body).encode('utf-8')
+        self.chunk_size = chunk_size
+        self.closed = False
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.content), self.chunk_size):
+            yield self.content[start:start + self.chunk_size]
+
+    def json(self):
+        return json.loads(self.content.decode('utf-8'))
+
+    def close(self):
+        self.closed = True
+
+
+class TestDecoding(unittest.TestCase):
+    def setUp(self):
+        self.session = Session(oauth_token='$sometoken',
+                               url='https://fake-fln.com')
+
+    def tearDown(self):
+        pass
+
+    def test_iter_json_array(self):
+        document = {
+            'status': 'success',
+            'result': {
+                'users': {'1': {'id': 1, 'name': u'Jürgen ' * 50}},
+                'projects': [{'id': i, 'title': u'é' * i}
+                             for i in range(20)] + [12345678, None],
+                'total_count': 22,
+            },
+        }
+        data = json.dumps(document).encode('utf-8')
+        for size in (1, 5, 64, len(data)):
+            chunks = [data[i:i + size] for i in range(0, len(data), size)]
+            self.assertEqual(
+                list(iter_json_array(chunks, ('result', 'projects'))),
+                document['result']['projects'])
+
+    def test_iter_json_array_missing_path(self):
+        self.assertEqual(list(iter_json_array(
+            [b'{"result": {"bids": null}}'], ('result', 'bids'))), [])
+        self.assertEqual(list(iter_json_array(
+            [b'{"status": "success"}'], ('result', 'bids'))), [])
+
+    def test_stream_search_projects(self):
+        response = FakeStreamedResponse({
+            'status': 'success',
+            'result': {'projects': [{'id': 1}, {'id': 2}], 'users': None},
+        })
+        self.session.session.get = Mock(return_value=response)
+        projects = stream_search_projects(self.session, 'logo', None, 2, 0)
+        projects = list(projects)
+        self.assertEqual([p.id for p in projects], [1, 2])
+        self.assertIsInstance(projects[0], Project)
+        self.session.session.get.assert_called_once_with(
+            url='https://fake-fln.com/api/projects/0.1/projects/all/',
+            params={'query': 'logo', 'project_types': None, 'limit': 2,
+                    'offset': 0},
+            stream=True,
+            verify=True)
+        self.assertTrue(response.closed)
+
+    def test_stream_bids_error(self):
+        response = FakeStreamedResponse({
+            'status': 'error', 'message': 'Not found',
+            'error_code': 'NOT_FOUND',
+        }, status_code=404)
+        self.session.session.get = Mock(return_value=response)
+        with self.assertRaises(BidsNotFoundException):
+            list(stream_bids(self.session, project_ids=[101]))
+        self.assertTrue(response.closed)
+
+    def test_session_json_loads(self):
+        calls = []
+
+        def loads(data):
+            calls.append(data)
+            return json.loads(data.decode('utf-8'))
+
+        session = Session(oauth_token='$sometoken', url='https://fake-fln.com',
+                          json_loads=loads)
+        response = FakeStreamedResponse({'status': 'success',
+                                         'result': {'bids': []}})
+        session.session.get = Mock(return_value=response)
+        self.assertEqual(get_bids(session, project_ids=[101]), {'bids': []})
+        self.assertEqual(calls, [response.content])
+
+    def test_fastest_loads(self):
+        self.assertEqual(fastest_loads()(b'{"id": 1}'), {'id': 1})
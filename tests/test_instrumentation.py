@@ -0,0 +1,164 @@
+from freelancersdk.session import Session
+from freelancersdk.instrumentation import (
+    Histogram, Instrumentation, endpoint_label, percentile,
+)
+from freelancersdk.resources.messages.messages import post_message
+from freelancersdk.resources.projects import (
+    award_project_bid, get_bids, place_project_bid,
+)
+from freelancersdk.resources.projects.exceptions import (
+    BidNotAwardedException,
+)
+from requests.exceptions import ConnectionError
+try:
+    from unittest.mock import Mock
+except ImportError:
+    from mock import Mock
+
+import json
+import unittest
+
+
+class FakeResponse:
+
+    def __init__(self, status_code, result=None):
+        self.status_code = status_code
+        self.headers = {}
+        self.url = 'https://fake-fln.com'
+        self.encoding = 'utf-8'
+        body = {'status': 'success', 'result': result}
+        if status_code != 200:
+            body = {'status': 'error', 'message': 'failed',
+                    'error_code': 'ProjectExceptionCodes.NOT_FOUND'}
+        self.content = json.dumps(body).encode('utf-8')
+
+    def json(self):
+        return json.loads(self.content.decode('utf-8'))
+
+
+class FakeClock:
+
+    def __init__(self, step):
+        self.now = 0.0
+        self.step = step
+
+    def __call__(self):
+        self.now += self.step
+        return self.now
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        self.instrumentation = Instrumentation(clock=FakeClock(0.02))
+        self.session = Session(oauth_token='$sometoken',
+                               url='https://fake-fln.com',
+                               middlewares=[self.instrumentation])
+        self.session.session.get = Mock()
+        self.session.session.put = Mock()
+
+    def tearDown(self):
+        pass
+
+    def test_endpoint_label(self):
+        self.assertEqual(endpoint_label('threads/123/messages/'),
+                         'threads/{id}/messages')
+        self.assertEqual(endpoint_label('bids/5/'), 'bids/{id}')
+        self.assertEqual(endpoint_label('projects'), 'projects')
+
+    def test_histogram_quantiles(self):
+        histogram = Histogram(buckets=(0.1, 1.0))
+        for value in [0.05] * 98 + [0.5, 3.0]:
+            histogram.observe(value)
+        self.assertEqual(histogram.quantile(0.5), 0.1)
+        self.assertEqual(histogram.quantile(0.99), 1.0)
+        self.assertEqual(histogram.quantile(1.0), float('inf'))
+        self.assertEqual(histogram.cumulative()[-1], (float('inf'), 100))
+
+    def test_percentile(self):
+        self.assertEqual(percentile([2, 1], 0.5), 1)
+        self.assertEqual(percentile([6, 5, 4, 3, 2, 1], 0.5), 3)
+        self.assertEqual(percentile(range(1, 5), 0.5), 2)
+        self.assertEqual(percentile(range(1, 101), 0.99), 99)
+        self.assertEqual(percentile(range(1, 101), 0.07), 7)
+        self.assertEqual(percentile([4], 0.99), 4)
+
+    def test_records_latency_status_and_sizes_per_endpoint(self):
+        self.session.session.get.return_value = FakeResponse(
+            200, {'bids': []})
+        self.session.session.put.side_effect = [
+            FakeResponse(200, {}), FakeResponse(404)]
+        get_bids(self.session, project_ids=[101])
+        award_project_bid(self.session, 1)
+        with self.assertRaises(BidNotAwardedException):
+            award_project_bid(self.session, 2)
+
+        stats = self.instrumentation.stats()
+        bids = stats[('GET', 'projects', 'bids')]
+        self.assertEqual(bids['count'], 1)
+        self.assertAlmostEqual(bids['seconds'], 0.02)
+        self.assertEqual(bids['p50'], 0.025)
+        self.assertEqual(bids['statuses'], {'200': 1})
+        self.assertGreater(bids['response_bytes'], 0)
+        award = stats[('PUT', 'projects', 'bids/{id}')]
+        self.assertEqual(award['statuses'], {'200': 1, '404': 1})
+
+    def test_request_body_sizes(self):
+        self.session.session.post = Mock(return_value=FakeResponse(
+            200, {'id': 1}))
+        place_project_bid(self.session, 101, 202, 'x' * 1024, 250, 7, 50)
+        post_message(self.session, 301, "Let's talk")
+
+        stats = self.instrumentation.stats()
+        [bid, message] = self.session.session.post.call_args_list
+        self.assertEqual(stats[('POST', 'projects', 'bids')]['request_bytes'],
+                         len(json.dumps(bid[1]['json'])))
+        self.assertGreater(len(json.dumps(bid[1]['json'])), 1024)
+        self.assertEqual(
+            stats[('POST', 'messages', 'threads/{id}/messages')]
+            ['request_bytes'], len('message=Let%27s+talk'))
+
+    def test_hooks_and_errors(self):
+        seen = []
+        self.instrumentation.before_request(
+            lambda request: seen.append(('before', request.endpoint)))
+
+        @self.instrumentation.after_request
+        def after(request, response, seconds):
+            seen.append(('after', response, seconds))
+
+        self.session.session.get.side_effect = ConnectionError()
+        with self.assertRaises(ConnectionError):
+            get_bids(self.session, project_ids=[101])
+        self.assertEqual(seen[0], ('before', 'bids'))
+        self.assertEqual(seen[1][:2], ('after', None))
+        self.assertAlmostEqual(seen[1][2], 0.02)
+        stats = self.instrumentation.stats()
+        self.assertEqual(stats[('GET', 'projects', 'bids')]['statuses'],
+                         {'error': 1})
+
+    def test_disabled(self):
+        self.instrumentation.enabled = False
+        self.session.session.get.return_value = FakeResponse(
+            200, {'bids': []})
+        get_bids(self.session, project_ids=[101])
+        self.assertEqual(self.instrumentation.stats(), {})
+
+    def test_prometheus_export(self):
+        self.session.session.get.return_value = FakeResponse(
+            200, {'bids': []})
+        get_bids(self.session, project_ids=[101])
+        text = self.instrumentation.export()
+        labels = 'method="GET",namespace="projects",endpoint="bids"'
+        self.assertIn('# TYPE freelancersdk_request_duration_seconds '
+                      'histogram\n', text)
+        self.assertIn('freelancersdk_request_duration_seconds_bucket{'
+                      + labels + ',le="0.01"} 0\n', text)
+        self.assertIn('freelancersdk_request_duration_seconds_bucket{'
+                      + labels + ',le="0.025"} 1\n', text)
+        self.assertIn('freelancersdk_request_duration_seconds_bucket{'
+                      + labels + ',le="+Inf"} 1\n', text)
+        self.assertIn('freelancersdk_request_duration_seconds_count{'
+                      + labels + '} 1\n', text)
+        self.assertIn('freelancersdk_responses_total{' + labels
+                      + ',status="200"} 1\n', text)
+        self.assertTrue(text.endswith('\n'))
@@ -0,0 +1,96 @@
+from freelancersdk.session import Session
+from freelancersdk.resources.projects import JobCatalog
+try:
+    from unittest.mock import Mock
+except ImportError:
+    from mock import Mock
+
+import unittest
+
+
+def job(id, name, category_id, category_name, seo_url=None):
+    return {
+        'id': id,
+        'name': name,
+        'category': {'id': category_id, 'name': category_name},
+        'seo_url': seo_url or name.lower().replace(' ', '_'),
+    }
+
+
+CATALOG = [
+    job(3, 'PHP', 1, 'Websites, IT & Software'),
+    job(17, 'Graphic Design', 3, 'Design, Media & Architecture'),
+    job(20, 'Logo Design', 3, 'Design, Media & Architecture'),
+    job(32, 'Python', 1, 'Websites, IT & Software'),
+]
+
+
+class FakeGetJobsGetResponse:
+
+    def __init__(self, jobs):
+        self.status_code = 200
+        self.jobs = jobs
+
+    def json(self):
+        return {'status': 'success', 'result': self.jobs}
+
+
+class TestJobCatalog(unittest.TestCase):
+    def setUp(self):
+        self.session = Session(oauth_token='$sometoken',
+                               url='https://fake-fln.com')
+        self.session.session.get = Mock()
+        self.session.session.get.return_value = \
+            FakeGetJobsGetResponse(CATALOG)
+
+    def tearDown(self):
+        pass
+
+    def test_load_and_lookups(self):
+        catalog = JobCatalog.load(self.session)
+        self.session.session.get.assert_called_once_with(
+            url='https://fake-fln.com/api/projects/0.1/jobs/',
+            params={'jobs[]': [], 'seo_details': True, 'lang': 'en'},
+            verify=True)
+        self.assertEqual(len(catalog), 4)
+        self.assertEqual(catalog.get(32)['name'], 'Python')
+        self.assertEqual(catalog.by_seo_url('logo_design')['id'], 20)
+        self.assertEqual(catalog.by_name('graphic design')['id'], 17)
+        self.assertEqual(sorted(j['id'] for j in catalog.by_category(3)),
+                         [17, 20])
+        self.assertEqual(
+            sorted(j['id'] for j in
+                   catalog.by_category('websites, it & software')),
+            [3, 32])
+        self.assertIn('PHP', catalog)
+        self.assertNotIn('Cobol', catalog)
+
+    def test_job_ids_and_job_object(self):
+        catalog = JobCatalog(CATALOG)
+        self.assertEqual(catalog.job_ids(['php', 'logo_design', 32]),
+                         [3, 20, 32])
+        self.assertEqual(catalog.job_object('Python'),
+                         {'id': 32, 'name': 'Python', 'seo_url': 'python'})
+        with self.assertRaises(KeyError):
+            catalog.job_ids(['Cobol'])
+
+    def test_incremental_refresh(self):
+        catalog = JobCatalog(CATALOG)
+        renamed = job(32, 'Python 3', 1, 'Websites, IT & Software',
+                      seo_url='python')
+        self.session.session.get.return_value = \
+            FakeGetJobsGetResponse([renamed])
+        changed = catalog.refresh(self.session, job_ids=[32, 3])
+        self.assertEqual(changed, 1)
+        self.assertEqual(catalog.by_name('python 3')['id'], 32)
+        self.assertIsNone(catalog.by_name('python'))
+        self.assertEqual(len(catalog), 4)
+
+    def test_full_refresh_drops_removed_jobs(self):
+        catalog = JobCatalog(CATALOG)
+        self.session.session.get.return_value = \
+            FakeGetJobsGetResponse(CATALOG[:2])
+        self.assertEqual(catalog.refresh(self.session), 2)
+        self.assertEqual(len(catalog), 2)
+        self.assertIsNone(catalog.by_seo_url('python'))
+        self.assertEqual(catalog.by_category(1), [catalog.get(3)])
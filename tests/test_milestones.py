@@ -0,0 +1,281 @@
+from freelancersdk.session import Session
+from freelancersdk.resources.projects import (
+    Checkpoint, create_milestone_operation, process_milestone_requests,
+    run_milestone_batch,
+)
+from freelancersdk.resources.projects.exceptions import (
+    MilestoneNotCreatedException, MilestoneNotReleasedException,
+    MilestoneOperationInDoubtException, MilestoneRequestNotRejectedException,
+)
+from freelancersdk.resources.projects.types import (
+    Milestone, MilestoneReason, MilestoneRequest,
+)
+from requests.exceptions import ReadTimeout
+try:
+    from unittest.mock import Mock
+except ImportError:
+    from mock import Mock
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+
+class FakeMilestoneAPI:
+
+    def __init__(self, failing=(), timing_out=(), server_errors=()):
+        self.failing = set(failing)
+        self.timing_out = set(timing_out)
+        self.server_errors = set(server_errors)
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def response(self, key, result):
+        with self.lock:
+            self.calls.append(key)
+        if key in self.timing_out:
+            raise ReadTimeout()
+        response = Mock()
+        if key in self.failing:
+            response.status_code = 400
+            response.json.return_value = {
+                'status': 'error', 'message': 'Insufficient funds',
+                'error_code': 'ProjectExceptionCodes.INSUFFICIENT_FUNDS',
+            }
+            return response
+        if key in self.server_errors:
+            response.status_code = 504
+            response.json.return_value = {
+                'status': 'error', 'message': 'Gateway timeout',
+                'error_code': 'GatewayTimeout',
+            }
+            return response
+        response.status_code = 200
+        response.json.return_value = {'status': 'success', 'result': result}
+        return response
+
+    def post(self, url, **kwargs):
+        milestone = kwargs['json']
+        key = ('create', milestone['bidder_id'])
+        return self.response(key, dict(milestone,
+                                       transaction_id=milestone['bidder_id']))
+
+    def put(self, url, **kwargs):
+        milestone_id = int(url.rstrip('/').rsplit('/', 1)[1])
+        return self.response((kwargs['params']['action'], milestone_id), None)
+
+
+class TestMilestoneBatch(unittest.TestCase):
+    def setUp(self):
+        self.session = Session(oauth_token='$sometoken',
+                               url='https://fake-fln.com')
+        self.directory = tempfile.mkdtemp()
+        self.checkpoint = os.path.join(self.directory, 'payroll.jsonl')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def fake(self, **kwargs):
+        api = FakeMilestoneAPI(**kwargs)
+        self.session.session.post = Mock(side_effect=api.post)
+        self.session.session.put = Mock(side_effect=api.put)
+        return api
+
+    def operations(self):
+        return [
+            create_milestone_operation(
+                'create', project_id=101, bidder_id=bidder_id, amount=100,
+                reason=MilestoneReason.FULL_PAYMENT.value,
+                description='March')
+            for bidder_id in range(1, 6)
+        ] + [
+            create_milestone_operation('release', milestone_id=7,
+                                       amount=50),
+            create_milestone_operation('cancel', milestone_id=8),
+        ]
+
+    def test_run_milestone_batch(self):
+        api = self.fake(failing=[('create', 3)])
+        outcomes = run_milestone_batch(self.session, self.operations(),
+                                       max_workers=3)
+        self.assertEqual(len(api.calls), 7)
+        self.assertEqual([o.ok for o in outcomes],
+                         [True, True, False, True, True, True, True])
+        self.assertIsInstance(outcomes[0].result, Milestone)
+        self.assertEqual(outcomes[0].result.bidder_id, 1)
+        self.assertIsInstance(outcomes[2].exception,
+                              MilestoneNotCreatedException)
+        self.assertEqual(outcomes[5].result, 'success')
+
+    def test_keys(self):
+        first = self.operations()
+        self.assertEqual([o['key'] for o in first],
+                         [o['key'] for o in self.operations()])
+        self.assertEqual(len(set(o['key'] for o in first)), len(first))
+        keyed = create_milestone_operation('cancel', key='march-8',
+                                           milestone_id=8)
+        self.assertEqual(keyed['key'], 'march-8')
+        with self.assertRaises(ValueError):
+            run_milestone_batch(self.session, first + [first[0]])
+        with self.assertRaises(ValueError):
+            create_milestone_operation('refund', milestone_id=8)
+
+    def test_resume_from_checkpoint(self):
+        api = self.fake(failing=[('create', 3)],
+                        timing_out=[('release', 7)])
+        run_milestone_batch(self.session, self.operations(),
+                            checkpoint=self.checkpoint)
+
+        api = self.fake()
+        outcomes = run_milestone_batch(self.session, self.operations(),
+                                       checkpoint=self.checkpoint)
+        # Only the rejected create is sent again
+        self.assertEqual(api.calls, [('create', 3)])
+        self.assertTrue(outcomes[2].ok)
+        self.assertEqual(outcomes[0].result.bidder_id, 1)
+        self.assertEqual(outcomes[6].result, 'success')
+        # The timed out release may have been applied
+        self.assertIsInstance(outcomes[5].exception,
+                              MilestoneOperationInDoubtException)
+
+        outcomes = run_milestone_batch(self.session, self.operations(),
+                                       checkpoint=self.checkpoint,
+                                       retry_in_doubt=True)
+        self.assertEqual(api.calls, [('create', 3), ('release', 7)])
+        self.assertTrue(all(o.ok for o in outcomes))
+
+    def test_server_error_is_in_doubt(self):
+        api = self.fake(server_errors=[('create', 2)])
+        outcomes = run_milestone_batch(self.session, self.operations(),
+                                       checkpoint=self.checkpoint)
+        self.assertIsInstance(outcomes[1].exception,
+                              MilestoneNotCreatedException)
+        self.assertEqual(outcomes[1].exception.status_code, 504)
+
+        api = self.fake()
+        outcomes = run_milestone_batch(self.session, self.operations(),
+                                       checkpoint=self.checkpoint)
+        # The create may have been applied before the gateway timed out
+        self.assertEqual(api.calls, [])
+        self.assertIsInstance(outcomes[1].exception,
+                              MilestoneOperationInDoubtException)
+        with Checkpoint(self.checkpoint) as checkpoint:
+            entry = checkpoint.get(self.operations()[1]['key'])
+            self.assertEqual(entry['state'], 'in_doubt')
+            self.assertEqual(entry['error_code'], 'GatewayTimeout')
+
+    def test_checkpoint_survives_a_cut_short_line(self):
+        operation = create_milestone_operation('release', milestone_id=7,
+                                               amount=50)
+        with open(self.checkpoint, 'w') as f:
+            f.write(json.dumps({'key': 'other', 'state': 'done',
+                                'result': 'success'}) + '\n')
+            f.write('{"key": "' + operation['key'] + '", "sta')
+        api = self.fake(failing=[('release', 7)])
+        outcomes = run_milestone_batch(self.session, [operation],
+                                       checkpoint=self.checkpoint)
+        self.assertIsInstance(outcomes[0].exception,
+                              MilestoneNotReleasedException)
+        with Checkpoint(self.checkpoint) as checkpoint:
+            self.assertEqual(checkpoint.get('other')['state'], 'done')
+            entry = checkpoint.get(operation['key'])
+            self.assertEqual(entry['state'], 'failed')
+            self.assertEqual(entry['error_code'],
+                             'ProjectExceptionCodes.INSUFFICIENT_FUNDS')
+        self.assertEqual(api.calls, [('release', 7)])
+
+
+class TestProcessMilestoneRequests(unittest.TestCase):
+    def setUp(self):
+        self.session = Session(oauth_token='$sometoken',
+                               url='https://fake-fln.com')
+        self.api = FakeMilestoneAPI(failing=[('reject', 4)])
+        self.session.session.put = Mock(side_effect=self.api.put)
+
+    def decide(self, milestone_request):
+        if milestone_request['amount'] > 500:
+            return 'reject'
+        if milestone_request['status'] == 'stale':
+            return 'delete'
+        if milestone_request['amount'] > 0:
+            return 'accept'
+        return None
+
+    def milestone_requests(self):
+        yield MilestoneRequest({'id': 1, 'amount': 100, 'status': 'pending'})
+        yield {'id': 2, 'amount': 50, 'status': 'stale'}
+        yield {'id': 3, 'amount': 0, 'status': 'pending'}
+        yield {'id': 4, 'amount': 900, 'status': 'pending'}
+        yield {'id': 5, 'amount': 800, 'status': 'pending'}
+
+    def test_process_milestone_requests(self):
+        report = process_milestone_requests(
+            self.session, self.milestone_requests(), self.decide,
+            max_workers=3)
+        self.assertEqual(sorted(self.api.calls), [
+            ('accept', 1), ('delete', 2), ('reject', 4), ('reject', 5)])
+        self.assertEqual([o.item['id'] for o in report.outcomes],
+                         [1, 2, 3, 4, 5])
+        self.assertEqual([o.status for o in report.outcomes],
+                         ['accepted', 'deleted', 'skipped', 'failed',
+                          'rejected'])
+        self.assertEqual(report.outcomes[0].result, 'success')
+        self.assertIsInstance(report.failed[0].exception,
+                              MilestoneRequestNotRejectedException)
+        self.assertEqual(report.counts(), {
+            'accepted': 1, 'rejected': 1, 'deleted': 1, 'failed': 1,
+            'skipped': 1})
+
+        latency = report.latency()
+        self.assertEqual(latency['count'], 4)
+        self.assertTrue(0 <= latency['p50'] <= latency['p99'] <=
+                        latency['max'] <= report.seconds)
+        self.assertEqual(report.outcomes[2].seconds, 0.0)
+
+    def test_unknown_decision(self):
+        def decide(milestone_request):
+            if milestone_request['id'] == 2:
+                return 'approve'
+            return self.decide(milestone_request)
+
+        report = process_milestone_requests(
+            self.session, self.milestone_requests(), decide)
+        self.assertNotIn(2, [milestone_id for _, milestone_id
+                             in self.api.calls])
+        self.assertEqual(len(self.api.calls), 3)
+        [unknown, rejected] = report.failed
+        self.assertEqual(unknown.item['id'], 2)
+        self.assertIsInstance(unknown.exception, ValueError)
+        self.assertEqual(report.latency()['count'], 3)
+
+        report = process_milestone_requests(self.session, [], self.decide)
+        self.assertEqual(report.outcomes, [])
+        self.assertIsNone(report.latency()['p99'])
+
+    def test_stream(self):
+        read = []
+
+        def milestone_requests():
+            for milestone_request_id in range(1, 101):
+                read.append(milestone_request_id)
+                yield {'id': milestone_request_id, 'amount': 10,
+                       'status': 'pending'}
+
+        read_when_sent = []
+
+        def put(url, **kwargs):
+            read_when_sent.append(len(read))
+            return self.api.put(url, **kwargs)
+
+        self.session.session.put = Mock(side_effect=put)
+        report = process_milestone_requests(
+            self.session, milestone_requests(), self.decide, max_workers=2)
+        self.assertEqual(report.counts()['accepted'], 100)
+        self.assertEqual([o.item['id'] for o in report.outcomes],
+                         list(range(1, 101)))
+        # Milestone requests are read a few at a time as they are sent
+        self.assertLessEqual(max(sent - i for i, sent
+                                 in enumerate(read_when_sent)), 5)
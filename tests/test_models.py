@@ -0,0 +1,122 @@
+from freelancersdk.models import Model
+from freelancersdk.resources.projects.types import Project, Bid, Currency
+from freelancersdk.resources.messages.types import Thread
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+import json
+import pickle
+import unittest
+
+
+class TestModels(unittest.TestCase):
+    def setUp(self):
+        self.project_data = {
+            'id': 201,
+            'title': 'Build a website',
+            'currency': {'id': 1, 'code': 'USD', 'sign': '$'},
+            'budget': {'minimum': 10, 'maximum': 100},
+            'new_field': 'kept',
+        }
+
+    def tearDown(self):
+        pass
+
+    def test_fields_are_slots(self):
+        p = Project(self.project_data)
+        self.assertFalse(hasattr(p, '__dict__'))
+        self.assertEqual(p.id, 201)
+        self.assertEqual(p.title, 'Build a website')
+        with self.assertRaises(AttributeError):
+            p.description
+        p.url = 'https://fake-fln.com/projects/201'
+        self.assertEqual(p['url'], 'https://fake-fln.com/projects/201')
+
+    def test_unknown_keys_overflow(self):
+        p = Project(self.project_data)
+        self.assertEqual(p.new_field, 'kept')
+        self.assertEqual(p['new_field'], 'kept')
+        self.assertIsNone(Bid({'id': 1})._extra)
+
+    def test_nested_objects_are_built_lazily(self):
+        p = Project(self.project_data)
+        self.assertIs(type(p._currency), dict)
+        self.assertIsInstance(p.currency, Currency)
+        self.assertIs(p.currency, p.currency)
+        self.assertEqual(p.currency.code, 'USD')
+        self.assertEqual(p.budget['maximum'], 100)
+
+    def test_dict_access(self):
+        t = Thread({'id': 301, 'thread': {'context': {'id': 201,
+                                                      'type': 'project'}}})
+        self.assertEqual(t.thread['context']['id'], 201)
+        self.assertEqual(t.thread.context.type, 'project')
+        self.assertIn('context', t.thread)
+        self.assertNotIn('owner', t.thread)
+        self.assertIsNone(t.thread.get('owner'))
+        with self.assertRaises(KeyError):
+            t['owner']
+
+    def test_mapping(self):
+        p = Project(self.project_data)
+        self.assertIsInstance(p.currency, Mapping)
+        self.assertEqual(p.currency, {'id': 1, 'code': 'USD', 'sign': '$'})
+        self.assertNotEqual(p.currency, {'id': 1, 'code': 'USD'})
+        self.assertEqual(dict(p.currency),
+                         {'id': 1, 'code': 'USD', 'sign': '$'})
+        self.assertEqual(len(p.currency), 3)
+        self.assertEqual(sorted(p.budget.values()), [10, 100])
+        self.assertEqual(p, Project(self.project_data))
+        self.assertEqual(p, Project.lazy(self.project_data))
+        self.assertEqual(p, self.project_data)
+        self.assertNotEqual(p, Bid({'id': 1}))
+        self.assertNotEqual(p.currency, 'USD')
+        with self.assertRaises(TypeError):
+            json.dumps(p.currency)
+        self.assertEqual(json.loads(json.dumps(p.currency.to_dict())),
+                         self.project_data['currency'])
+
+    def test_to_dict_and_pickle(self):
+        p = Project(self.project_data)
+        p.currency
+        self.assertEqual(p.to_dict(), self.project_data)
+        copy = pickle.loads(pickle.dumps(p))
+        self.assertEqual(copy.to_dict(), self.project_data)
+
+    def test_base_model_keeps_everything(self):
+        m = Model({'a': 1})
+        self.assertEqual(m.a, 1)
+        self.assertEqual(dict(m.items()), {'a': 1})
+
+    def test_lazy_view(self):
+        p = Project.lazy(self.project_data)
+        self.assertIsInstance(p, Project)
+        self.assertFalse(hasattr(p, '__dict__'))
+        self.assertEqual(p.id, 201)
+        self.assertEqual(p.new_field, 'kept')
+        self.assertEqual(p.currency.code, 'USD')
+        self.assertIs(p.currency, p.currency)
+        with self.assertRaises(AttributeError):
+            p.description
+        p.url = 'https://fake-fln.com/projects/201'
+        self.assertEqual(p.url, 'https://fake-fln.com/projects/201')
+        expected = dict(self.project_data,
+                        url='https://fake-fln.com/projects/201')
+        self.assertEqual(p.to_dict(), expected)
+        self.assertEqual(sorted(p.keys()), sorted(expected))
+        self.assertEqual(p['budget']['minimum'], 10)
+        self.assertIn('new_field', p)
+        self.assertNotIn('description', p)
+
+    def test_lazy_view_resolves_fields_once(self):
+        data = {'id': 1, 'amount': 10}
+        b = Bid.lazy(data)
+        self.assertEqual(b.amount, 10)
+        data['amount'] = 20
+        self.assertEqual(b.amount, 10)
+        copy = pickle.loads(pickle.dumps(b))
+        self.assertIs(type(copy), Bid)
+        self.assertEqual(copy.to_dict(), {'id': 1, 'amount': 10})
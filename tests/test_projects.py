@@ -2,7 +2,9 @@ from freelancersdk.session import Session
 from freelancersdk.resources.projects import (
     create_project, create_hourly_project, create_hireme_project,
     create_local_project,
-    get_projects, search_projects,
+    get_projects, get_projects_bulk, search_projects, iter_search_projects,
+    iter_bids,
+    apply_bid_actions,
     place_project_bid, get_bids, award_project_bid, revoke_project_bid,
     accept_project_bid, retract_project_bid, highlight_project_bid,
     create_milestone_payment, release_milestone_payment,
@@ -18,7 +20,13 @@ from freelancersdk.resources.projects.helpers import (
     create_get_projects_project_details_object,
     create_get_projects_user_details_object
 )
-from freelancersdk.resources.projects.types import MilestoneReason
+from freelancersdk.resources.projects.types import (
+    MilestoneReason, Project, Bid, ProjectsResult, BidsResult,
+)
+from freelancersdk.resources.projects.exceptions import (
+    ProjectsNotFoundException, BidNotRevokedException,
+    BidNotHighlightedException,
+)
 try:
     from unittest.mock import Mock
 except ImportError:
@@ -331,6 +339,111 @@ class FakeGetJobsGetResponse:
         }
 
 
+class FakeSearchProjectsPages:
+
+    def __init__(self, total_count, max_limit=None):
+        self.total_count = total_count
+        self.max_limit = max_limit
+        self.offsets = []
+
+    def __call__(self, url, params, verify):
+        self.offsets.append((params['offset'], params['limit']))
+        limit = min(params['limit'], self.max_limit or params['limit'])
+        end = min(params['offset'] + limit, self.total_count)
+        projects = [{'id': i, 'title': 'Project {}'.format(i)}
+                    for i in range(params['offset'], end)]
+        response = Mock()
+        response.status_code = 200
+        response.json.return_value = {
+            'status': 'success',
+            'result': {
+                'total_count': self.total_count,
+                'projects': projects,
+                'users': None,
+            },
+        }
+        return response
+
+
+class FakeGetBidsPages:
+
+    def __init__(self, bids_per_project):
+        self.bids_per_project = bids_per_project
+        self.requests = []
+
+    def __call__(self, url, params, verify):
+        project_ids = params['project_ids[]']
+        self.requests.append((tuple(project_ids), params['offset']))
+        bids = [{'id': project_id * 100 + i, 'project_id': project_id}
+                for project_id in project_ids
+                for i in range(self.bids_per_project)]
+        response = Mock()
+        response.status_code = 200
+        response.json.return_value = {
+            'status': 'success',
+            'result': {
+                'bids': bids[params['offset']:
+                             params['offset'] + params['limit']],
+                'total_count': len(bids),
+            },
+        }
+        return response
+
+
+class FakeGetProjectsChunks:
+
+    def __init__(self, failing_id=None):
+        self.failing_id = failing_id
+        self.chunks = []
+
+    def __call__(self, url, params, verify):
+        ids = params['projects[]']
+        self.chunks.append(ids)
+        response = Mock()
+        if self.failing_id in ids:
+            response.status_code = 500
+            response.json.return_value = {
+                'status': 'error',
+                'message': 'Internal error',
+                'error_code': 'INTERNAL_ERROR',
+            }
+            return response
+        response.status_code = 200
+        response.json.return_value = {
+            'status': 'success',
+            'result': {
+                'projects': [{'id': i, 'owner_id': i + 1000} for i in ids],
+                'users': dict((str(i + 1000), {'id': i + 1000})
+                              for i in ids),
+                'total_count': len(ids),
+            },
+        }
+        return response
+
+
+class FakeBidActions:
+
+    def __init__(self, failing_ids=()):
+        self.failing_ids = failing_ids
+        self.calls = []
+
+    def __call__(self, url, headers, params, data, json, verify):
+        bid_id = int(url.rstrip('/').rsplit('/', 1)[1])
+        self.calls.append((params['action'], bid_id))
+        response = Mock()
+        if bid_id in self.failing_ids:
+            response.status_code = 409
+            response.json.return_value = {
+                'status': 'error',
+                'message': 'Bid cannot be changed',
+                'error_code': 'ProjectExceptionCodes.BID_INVALID_STATE',
+            }
+            return response
+        response.status_code = 200
+        response.json.return_value = {'status': 'success'}
+        return response
+
+
 class TestProjects(unittest.TestCase):
     def setUp(self):
         self.session = Session(oauth_token='$sometoken', url='https://fake-fln.com')
@@ -351,7 +464,7 @@ class TestProjects(unittest.TestCase):
         self.session.session.post.return_value = FakeProjectPostResponse()
         p = create_project(self.session, **project_data)
         self.session.session.post.assert_called_once_with(
-            'https://fake-fln.com/api/projects/0.1/projects/',
+            url='https://fake-fln.com/api/projects/0.1/projects/',
             json=project_data,
             verify=True)
         self.assertEquals(p.url, 'https://fake-fln.com/projects/java/foo')
@@ -373,7 +486,7 @@ class TestProjects(unittest.TestCase):
         p = create_hourly_project(self.session, **project_data)
         project_data.update(type='HOURLY')
         self.session.session.post.assert_called_once_with(
-            'https://fake-fln.com/api/projects/0.1/projects/',
+            url='https://fake-fln.com/api/projects/0.1/projects/',
             json=project_data,
             verify=True)
         self.assertEquals(p.url, 'https://fake-fln.com/projects/java/foo')
@@ -398,7 +511,7 @@ class TestProjects(unittest.TestCase):
         p = create_hireme_project(self.session, **project_data)
         project_data.update(hireme=True)
         self.session.session.post.assert_called_once_with(
-            'https://fake-fln.com/api/projects/0.1/projects/',
+            url='https://fake-fln.com/api/projects/0.1/projects/',
             json=project_data,
             verify=True)
         self.assertEquals(p.url, 'https://fake-fln.com/projects/java/foo')
@@ -420,7 +533,7 @@ class TestProjects(unittest.TestCase):
         p = create_local_project(self.session, **project_data)
         project_data.update(local=True)
         self.session.session.post.assert_called_once_with(
-            'https://fake-fln.com/api/projects/0.1/projects/',
+            url='https://fake-fln.com/api/projects/0.1/projects/',
             json=project_data,
             verify=True)
         self.assertEquals(p.url, 'https://fake-fln.com/projects/java/foo')
@@ -444,7 +557,7 @@ class TestProjects(unittest.TestCase):
         self.session.session.get.return_value = FakeGetProjectsGetResponse()
         get_projects(self.session, query)
         self.session.session.get.assert_called_once_with(
-            'https://fake-fln.com/api/projects/0.1/projects/',
+            url='https://fake-fln.com/api/projects/0.1/projects/',
             params=query,
             verify=True)
 
@@ -462,7 +575,7 @@ class TestProjects(unittest.TestCase):
         p = search_projects(self.session, **query_data)
         del(query_data['active_only'])
         self.session.session.get.assert_called_once_with(
-            'https://fake-fln.com/api/projects/0.1/projects/active/',
+            url='https://fake-fln.com/api/projects/0.1/projects/active/',
             params=query_data,
             verify=True)
         self.assertEquals(len(p['projects']), query_data['limit'])
@@ -481,7 +594,7 @@ class TestProjects(unittest.TestCase):
         self.session.session.post.return_value = FakePlaceBidPostResponse()
         b = place_project_bid(self.session, **bid_data)
         self.session.session.post.assert_called_once_with(
-            'https://fake-fln.com/api/projects/0.1/bids/',
+            url='https://fake-fln.com/api/projects/0.1/bids/',
             json=bid_data,
             verify=True)
         self.assertTrue(getattr(b, 'bidder_id'))
@@ -516,7 +629,7 @@ class TestProjects(unittest.TestCase):
         self.session.session.put.return_value = FakeAwardBidPutResponse()
         award_project_bid(self.session, **bid_data)
         self.session.session.put.assert_called_once_with(
-            'https://fake-fln.com/api/projects/0.1/bids/1/',
+            url='https://fake-fln.com/api/projects/0.1/bids/1/',
             headers={'Content-Type': 'application/x-www-form-urlencoded'},
             params={'action': 'award'},
             data=None,
@@ -532,7 +645,7 @@ class TestProjects(unittest.TestCase):
         self.session.session.put.return_value = FakeRevokeBidPutResponse()
         revoke_project_bid(self.session, **bid_data)
         self.session.session.put.assert_called_once_with(
-            'https://fake-fln.com/api/projects/0.1/bids/1/',
+            url='https://fake-fln.com/api/projects/0.1/bids/1/',
             headers={'Content-Type': 'application/x-www-form-urlencoded'},
             params={'action': 'revoke'},
             data=None,
@@ -548,7 +661,7 @@ class TestProjects(unittest.TestCase):
         self.session.session.put.return_value = FakeAcceptBidPutResponse()
         accept_project_bid(self.session, **bid_data)
         self.session.session.put.assert_called_once_with(
-            'https://fake-fln.com/api/projects/0.1/bids/1/',
+            url='https://fake-fln.com/api/projects/0.1/bids/1/',
             headers={'Content-Type': 'application/x-www-form-urlencoded'},
             params={'action': 'accept'},
             data=None,
@@ -564,7 +677,7 @@ class TestProjects(unittest.TestCase):
         self.session.session.put.return_value = FakeRetractBidPutResponse()
         retract_project_bid(self.session, **bid_data)
         self.session.session.put.assert_called_once_with(
-            'https://fake-fln.com/api/projects/0.1/bids/1/',
+            url='https://fake-fln.com/api/projects/0.1/bids/1/',
             headers={'Content-Type': 'application/x-www-form-urlencoded'},
             params={'action': 'retract'},
             data=None,
@@ -580,7 +693,7 @@ class TestProjects(unittest.TestCase):
         self.session.session.put.return_value = FakeHighlightBidPutResponse()
         highlight_project_bid(self.session, **bid_data)
         self.session.session.put.assert_called_once_with(
-            'https://fake-fln.com/api/projects/0.1/bids/1/',
+            url='https://fake-fln.com/api/projects/0.1/bids/1/',
             headers={'Content-Type': 'application/x-www-form-urlencoded'},
             params={'action': 'highlight'},
             data=None,
@@ -600,7 +713,7 @@ class TestProjects(unittest.TestCase):
         self.session.session.post.return_value = FakeMilestonePaymentCreatePostResponse()
         m = create_milestone_payment(self.session, **milestone_data)
         self.session.session.post.assert_called_once_with(
-            'https://fake-fln.com/api/projects/0.1/milestones/',
+            url='https://fake-fln.com/api/projects/0.1/milestones/',
             json=milestone_data,
             verify=True)
         self.assertTrue(getattr(m, 'bidder_id'))
@@ -617,7 +730,7 @@ class TestProjects(unittest.TestCase):
         self.session.session.put.return_value = FakeMilestonePaymentReleasePutResponse()
         release_milestone_payment(self.session, **milestone_data)
         self.session.session.put.assert_called_once_with(
-            'https://fake-fln.com/api/projects/0.1/milestones/1/',
+            url='https://fake-fln.com/api/projects/0.1/milestones/1/',
             headers=None,
             params={'action': 'release'},
             data=None,
@@ -633,7 +746,7 @@ class TestProjects(unittest.TestCase):
         self.session.session.put.return_value = FakeMilestonePaymentReleasePutResponse()
         request_release_milestone_payment(self.session, **milestone_data)
         self.session.session.put.assert_called_once_with(
-            'https://fake-fln.com/api/projects/0.1/milestones/1/',
+            url='https://fake-fln.com/api/projects/0.1/milestones/1/',
             headers=None,
             params={'action': 'request_release'},
             data=None,
@@ -649,7 +762,7 @@ class TestProjects(unittest.TestCase):
         self.session.session.put.return_value = FakeMilestonePaymentReleasePutResponse()
         cancel_milestone_payment(self.session, **milestone_data)
         self.session.session.put.assert_called_once_with(
-            'https://fake-fln.com/api/projects/0.1/milestones/1/',
+            url='https://fake-fln.com/api/projects/0.1/milestones/1/',
             headers=None,
             params={'action': 'cancel'},
             data=None,
@@ -668,7 +781,7 @@ class TestProjects(unittest.TestCase):
         self.session.session.post.return_value = FakeCreateMilestoneRequestPostResponse()
         m = create_milestone_request(self.session, **milestone_request_data)
         self.session.session.post.assert_called_once_with(
-            'https://fake-fln.com/api/projects/0.1/milestone_requests/',
+            url='https://fake-fln.com/api/projects/0.1/milestone_requests/',
             json=milestone_request_data,
             verify=True)
         self.assertTrue(getattr(m, 'project_id'))
@@ -685,7 +798,7 @@ class TestProjects(unittest.TestCase):
         self.session.session.put.return_value = FakeAcceptMilestoneRequestPutResponse()
         accept_milestone_request(self.session, **milestone_request_data)
         self.session.session.put.assert_called_once_with(
-            'https://fake-fln.com/api/projects/0.1/milestone_requests/1/',
+            url='https://fake-fln.com/api/projects/0.1/milestone_requests/1/',
             headers=None,
             params={'action': 'accept'},
             data=None,
@@ -701,7 +814,7 @@ class TestProjects(unittest.TestCase):
         self.session.session.put.return_value = FakeRejectMilestoneRequestPutResponse()
         reject_milestone_request(self.session, **milestone_request_data)
         self.session.session.put.assert_called_once_with(
-            'https://fake-fln.com/api/projects/0.1/milestone_requests/1/',
+            url='https://fake-fln.com/api/projects/0.1/milestone_requests/1/',
             headers=None,
             params={'action': 'reject'},
             data=None,
@@ -717,7 +830,7 @@ class TestProjects(unittest.TestCase):
         self.session.session.put.return_value = FakeDeleteMilestoneRequestPutResponse()
         delete_milestone_request(self.session, **milestone_request_data)
         self.session.session.put.assert_called_once_with(
-            'https://fake-fln.com/api/projects/0.1/milestone_requests/1/',
+            url='https://fake-fln.com/api/projects/0.1/milestone_requests/1/',
             headers=None,
             params={'action': 'delete'},
             data=None,
@@ -740,7 +853,159 @@ class TestProjects(unittest.TestCase):
         get_jobs_data.update({'jobs[]': get_jobs_data['job_ids']})
         del(get_jobs_data['job_ids'])
         self.session.session.get.assert_called_once_with(
-            'https://fake-fln.com/api/projects/0.1/jobs/',
+            url='https://fake-fln.com/api/projects/0.1/jobs/',
             params=get_jobs_data,
             verify=True)
         self.assertEquals(len(j), len(get_jobs_data['jobs[]']))
+
+    def test_iter_search_projects(self):
+        pages = FakeSearchProjectsPages(total_count=25)
+        self.session.session.get = Mock(side_effect=pages)
+        projects = list(iter_search_projects(self.session, 'logo',
+                                             page_size=10))
+        self.assertEqual([p.id for p in projects], list(range(25)))
+        self.assertEqual(pages.offsets, [(0, 10), (10, 10), (20, 5)])
+        self.assertEqual(self.session.session.get.call_args[1]['url'],
+                         'https://fake-fln.com/api/projects/0.1/projects/all/')
+
+    def test_iter_search_projects_stops_at_total_count(self):
+        pages = FakeSearchProjectsPages(total_count=20)
+        self.session.session.get = Mock(side_effect=pages)
+        projects = list(iter_search_projects(self.session, 'logo',
+                                             page_size=10, read_ahead=3))
+        self.assertEqual([p.id for p in projects], list(range(20)))
+        self.assertIn((10, 10), pages.offsets)
+
+    def test_iter_search_projects_capped_pages(self):
+        pages = FakeSearchProjectsPages(total_count=230, max_limit=50)
+        self.session.session.get = Mock(side_effect=pages)
+        projects = list(iter_search_projects(self.session, 'logo',
+                                             page_size=100))
+        self.assertEqual([p.id for p in projects], list(range(230)))
+        self.assertEqual(pages.offsets, [(0, 100), (50, 50), (100, 50),
+                                         (150, 50), (200, 30)])
+
+        pages = FakeSearchProjectsPages(total_count=230, max_limit=50)
+        self.session.session.get = Mock(side_effect=pages)
+        projects = list(iter_search_projects(self.session, 'logo',
+                                             page_size=100, read_ahead=2))
+        self.assertEqual([p.id for p in projects], list(range(230)))
+
+    def test_iter_search_projects_max_results(self):
+        pages = FakeSearchProjectsPages(total_count=1000)
+        self.session.session.get = Mock(side_effect=pages)
+        projects = list(iter_search_projects(self.session, 'logo',
+                                             page_size=10, offset=5,
+                                             max_results=15))
+        self.assertEqual([p.id for p in projects], list(range(5, 20)))
+        self.assertEqual(pages.offsets, [(5, 10), (15, 5)])
+
+    def test_iter_bids(self):
+        pages = FakeGetBidsPages(bids_per_project=3)
+        self.session.session.get = Mock(side_effect=pages)
+        bids = list(iter_bids(self.session, project_ids=[1, 2, 3],
+                              page_size=4))
+        self.assertEqual([b.id for b in bids],
+                         [100, 101, 102, 200, 201, 202, 300, 301, 302])
+        self.assertEqual(pages.requests,
+                         [((1, 2, 3), 0), ((1, 2, 3), 4), ((1, 2, 3), 8)])
+
+    def test_iter_bids_parallel_project_groups(self):
+        pages = FakeGetBidsPages(bids_per_project=5)
+        self.session.session.get = Mock(side_effect=pages)
+        bids = list(iter_bids(self.session, project_ids=range(1, 8),
+                              page_size=2, read_ahead=1,
+                              projects_per_request=2, max_workers=3))
+        self.assertEqual(sorted(b.id for b in bids),
+                         [p * 100 + i for p in range(1, 8) for i in range(5)])
+        groups = set(ids for ids, _ in pages.requests)
+        self.assertEqual(groups, set([(1, 2), (3, 4), (5, 6), (7,)]))
+        for project_id in range(1, 8):
+            ids = [b.id for b in bids if b.project_id == project_id]
+            self.assertEqual(ids, sorted(ids))
+
+    def test_get_projects_bulk(self):
+        chunks = FakeGetProjectsChunks()
+        self.session.session.get = Mock(side_effect=chunks)
+        query = create_get_projects_object(project_ids=list(range(500)),
+                                           user_details={'user_avatar': True})
+        result = get_projects_bulk(self.session, query, max_workers=4,
+                                   max_query_length=1000)
+        self.assertTrue(len(chunks.chunks) > 1)
+        self.assertEqual(sorted(sum(chunks.chunks, [])), list(range(500)))
+        for params in self.session.session.get.call_args_list:
+            self.assertEqual(params[1]['params']['user_avatar'], True)
+        self.assertEqual(sorted(p['id'] for p in result['projects']),
+                         list(range(500)))
+        self.assertEqual(len(result['users']), 500)
+        self.assertEqual(result['total_count'], 500)
+        self.assertEqual(result['failed'], [])
+
+    def test_get_projects_bulk_reports_failed_chunks(self):
+        chunks = FakeGetProjectsChunks(failing_id=7)
+        self.session.session.get = Mock(side_effect=chunks)
+        query = create_get_projects_object(project_ids=list(range(20)))
+        result = get_projects_bulk(self.session, query,
+                                   max_query_length=100)
+        self.assertEqual(len(result['failed']), 1)
+        failed = result['failed'][0]
+        self.assertIn(7, failed.item['projects[]'])
+        self.assertIsInstance(failed.exception, ProjectsNotFoundException)
+        fetched = set(p['id'] for p in result['projects'])
+        self.assertEqual(fetched | set(failed.item['projects[]']),
+                         set(range(20)))
+
+    def test_apply_bid_actions(self):
+        fake = FakeBidActions(failing_ids=(3, 5))
+        self.session.session.put = Mock(side_effect=fake)
+        actions = [('award', 1), ('revoke', 2), ('revoke', 3),
+                   ('accept', 4), ('highlight', 5), ('retract', 6)]
+        outcomes = apply_bid_actions(self.session, actions, max_workers=3)
+        self.assertEqual(sorted(fake.calls), sorted(actions))
+        self.assertEqual([o.item for o in outcomes], actions)
+        self.assertEqual([o.ok for o in outcomes],
+                         [True, True, False, True, False, True])
+        self.assertEqual(outcomes[0].result, 'success')
+        self.assertIsInstance(outcomes[2].exception, BidNotRevokedException)
+        self.assertIsInstance(outcomes[4].exception,
+                              BidNotHighlightedException)
+        self.assertEqual(outcomes[4].exception.error_code,
+                         'ProjectExceptionCodes.BID_INVALID_STATE')
+
+    def test_apply_bid_actions_rejects_unknown_actions(self):
+        self.session.session.put = Mock()
+        with self.assertRaises(ValueError):
+            apply_bid_actions(self.session, [('award', 1), ('delete', 2)])
+        self.session.session.put.assert_not_called()
+
+    def test_get_projects_result(self):
+        self.session.session.get = Mock()
+        self.session.session.get.return_value = FakeGetProjectsGetResponse()
+        result = get_projects(self.session, {})
+        self.assertIsInstance(result, ProjectsResult)
+        self.assertEqual(result['total_count'], 3)
+        self.assertEqual(result.total_count, 3)
+        self.assertEqual([p.id for p in result.projects],
+                         ['201', '202', '203'])
+        self.assertIsInstance(result.projects[0], Project)
+        self.assertIs(result.projects_by_id['202'], result.projects[1])
+        self.assertEqual(sorted(result.users), [101, 102, 103])
+        self.assertEqual(result.users[102].username, 'user2')
+        self.assertEqual(result.selected_bids, {})
+
+    def test_get_bids_result(self):
+        self.session.session.get = Mock()
+        response = FakeGetBidsGetResponse()
+        body = response.json()
+        body['result']['users'] = {'101': {'id': 101, 'username': 'user1'}}
+        body['result']['projects'] = {'201': {'id': 201, 'title': 'Logo'}}
+        response.json = Mock(return_value=body)
+        self.session.session.get.return_value = response
+        result = get_bids(self.session, project_ids=[201, 202])
+        self.assertIsInstance(result, BidsResult)
+        self.assertEqual(len(result['bids']), 5)
+        self.assertIsInstance(result.bids[0], Bid)
+        first = result.bids_by_id[301]
+        self.assertEqual(result.bidder(first).username, 'user1')
+        self.assertEqual(result.project(first).title, 'Logo')
+        self.assertIsNone(result.bidder(result.bids_by_id[302]))
@@ -0,0 +1,137 @@
+from freelancersdk.session import Session
+from freelancersdk.ratelimit import TokenBucket, FileTokenBucket, RateLimiter
+from freelancersdk.resources.projects import get_bids
+from freelancersdk.resources.projects.exceptions import BidsNotFoundException
+from freelancersdk.resources.users import get_users
+try:
+    from unittest.mock import Mock
+except ImportError:
+    from mock import Mock
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeResponse:
+
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def json(self):
+        if self.status_code != 200:
+            return {'status': 'error', 'message': 'Too many requests',
+                    'error_code': 'RATE_LIMITED'}
+        return {'status': 'success', 'result': {}}
+
+
+class TestTokenBucket(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def tearDown(self):
+        pass
+
+    def test_burst_then_spaced_waits(self):
+        bucket = TokenBucket(rate=10, capacity=2, clock=self.clock)
+        waits = [bucket.reserve() for _ in range(5)]
+        self.assertEqual(waits[:2], [0.0, 0.0])
+        for expected, wait in zip([0.1, 0.2, 0.3], waits[2:]):
+            self.assertAlmostEqual(wait, expected)
+
+    def test_refills_over_time(self):
+        bucket = TokenBucket(rate=10, capacity=1, clock=self.clock)
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.clock.now += 0.1
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.clock.now += 60
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertAlmostEqual(bucket.reserve(), 0.1)
+
+    def test_pause(self):
+        bucket = TokenBucket(rate=10, capacity=10, clock=self.clock)
+        bucket.pause(5)
+        self.assertAlmostEqual(bucket.reserve(), 5.1)
+
+    def test_concurrent_reservations_are_evenly_spaced(self):
+        bucket = TokenBucket(rate=100, capacity=1, clock=self.clock)
+        waits = []
+
+        def reserve():
+            waits.append(bucket.reserve())
+
+        threads = [threading.Thread(target=reserve) for _ in range(50)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        waits.sort()
+        for i, wait in enumerate(waits):
+            self.assertAlmostEqual(wait, i * 0.01)
+
+
+class TestFileTokenBucket(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.clock = FakeClock()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_buckets_share_state(self):
+        path = os.path.join(self.directory, 'projects.bucket')
+        first = FileTokenBucket(path, rate=10, capacity=1, clock=self.clock)
+        second = FileTokenBucket(path, rate=10, capacity=1, clock=self.clock)
+        self.assertEqual(first.reserve(), 0.0)
+        self.assertAlmostEqual(second.reserve(), 0.1)
+        self.assertAlmostEqual(first.reserve(), 0.2)
+        second.pause(3)
+        self.assertAlmostEqual(first.reserve(), 3.1)
+
+
+class TestRateLimiter(unittest.TestCase):
+    def setUp(self):
+        self.delays = []
+        self.limiter = RateLimiter(rate=10, rates={'users': 1}, capacity=1,
+                                   sleep=self.delays.append)
+        self.session = Session(oauth_token='$sometoken',
+                               url='https://fake-fln.com',
+                               middlewares=[self.limiter])
+        self.session.session.get = Mock()
+        self.session.session.get.return_value = FakeResponse(200)
+
+    def tearDown(self):
+        pass
+
+    def test_bucket_per_endpoint_family(self):
+        get_bids(self.session, project_ids=[101])
+        get_users(self.session, {})
+        self.assertEqual(self.delays, [])
+        self.assertEqual(sorted(self.limiter.buckets), ['projects', 'users'])
+        self.assertEqual(self.limiter.buckets['projects'].rate, 10)
+        self.assertEqual(self.limiter.buckets['users'].rate, 1)
+
+        get_users(self.session, {})
+        self.assertEqual(len(self.delays), 1)
+        self.assertTrue(0.9 < self.delays[0] <= 1.0)
+
+    def test_rate_limited_response_pauses_family(self):
+        self.session.session.get.return_value = FakeResponse(
+            429, {'Retry-After': '30'})
+        with self.assertRaises(BidsNotFoundException):
+            get_bids(self.session, project_ids=[101])
+        self.session.session.get.return_value = FakeResponse(200)
+        get_bids(self.session, project_ids=[101])
+        self.assertTrue(29 < self.delays[0] <= 30.1)
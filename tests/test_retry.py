@@ -0,0 +1,115 @@
+from freelancersdk.session import Session
+from freelancersdk.retry import RetryPolicy, parse_retry_after
+from freelancersdk.resources.projects import (
+    get_bids, place_project_bid, get_projects,
+)
+from freelancersdk.resources.projects.exceptions import (
+    BidNotPlacedException, ProjectsNotFoundException,
+)
+from freelancersdk.resources.users import set_user_jobs
+from requests.exceptions import ConnectionError, ConnectTimeout
+try:
+    from unittest.mock import Mock
+except ImportError:
+    from mock import Mock
+
+import unittest
+
+
+class FakeResponse:
+
+    def __init__(self, status_code, body, headers=None):
+        self.status_code = status_code
+        self.body = body
+        self.headers = headers or {}
+
+    def json(self):
+        return self.body
+
+
+def success(result=None):
+    return FakeResponse(200, {'status': 'success', 'result': result or {}})
+
+
+def failure(status_code, headers=None):
+    return FakeResponse(status_code, {'status': 'error', 'message': 'Error',
+                                      'error_code': 'ERROR'}, headers)
+
+
+class TestRetry(unittest.TestCase):
+    def setUp(self):
+        self.delays = []
+        self.policy = RetryPolicy(max_retries=3, sleep=self.delays.append)
+        self.session = Session(oauth_token='$sometoken',
+                               url='https://fake-fln.com',
+                               middlewares=[self.policy])
+
+    def tearDown(self):
+        pass
+
+    def test_get_retries_server_errors(self):
+        self.session.session.get = Mock()
+        self.session.session.get.side_effect = [
+            failure(503), failure(502), success({'bids': []})]
+        result = get_bids(self.session, project_ids=[101])
+        self.assertEqual(result, {'bids': []})
+        self.assertEqual(self.session.session.get.call_count, 3)
+        self.assertEqual(len(self.delays), 2)
+        self.assertTrue(0 <= self.delays[0] <= 0.5)
+        self.assertTrue(0 <= self.delays[1] <= 1.0)
+
+    def test_get_gives_up_after_max_retries(self):
+        self.session.session.get = Mock()
+        self.session.session.get.return_value = failure(500)
+        with self.assertRaises(ProjectsNotFoundException):
+            get_projects(self.session, {})
+        self.assertEqual(self.session.session.get.call_count, 4)
+
+    def test_get_retries_connection_errors(self):
+        self.session.session.get = Mock()
+        self.session.session.get.side_effect = [
+            ConnectionError('reset'), success({'bids': []})]
+        get_bids(self.session, project_ids=[101])
+        self.assertEqual(self.session.session.get.call_count, 2)
+
+    def test_honours_retry_after(self):
+        self.session.session.get = Mock()
+        self.session.session.get.side_effect = [
+            failure(429, {'Retry-After': '7'}), success()]
+        get_bids(self.session, project_ids=[101])
+        self.assertEqual(self.delays, [7.0])
+
+    def test_post_is_not_retried_on_server_errors(self):
+        self.session.session.post = Mock()
+        self.session.session.post.return_value = failure(503)
+        with self.assertRaises(BidNotPlacedException):
+            place_project_bid(self.session, 1, 2, 'A bid', 10, 2, 100)
+        self.assertEqual(self.session.session.post.call_count, 1)
+
+    def test_post_is_not_retried_on_connection_reset(self):
+        self.session.session.post = Mock()
+        self.session.session.post.side_effect = ConnectionError('reset')
+        with self.assertRaises(ConnectionError):
+            place_project_bid(self.session, 1, 2, 'A bid', 10, 2, 100)
+        self.assertEqual(self.session.session.post.call_count, 1)
+
+    def test_post_is_retried_when_rejected(self):
+        self.session.session.post = Mock()
+        self.session.session.post.side_effect = [
+            ConnectTimeout('timeout'), failure(429), success({'id': 1})]
+        bid = place_project_bid(self.session, 1, 2, 'A bid', 10, 2, 100)
+        self.assertEqual(bid.id, 1)
+        self.assertEqual(self.session.session.post.call_count, 3)
+
+    def test_idempotent_endpoint_is_retried(self):
+        self.session.session.put = Mock()
+        self.session.session.put.side_effect = [failure(503), success()]
+        self.assertEqual(set_user_jobs(self.session, [1, 2]), 'success')
+        self.assertEqual(self.session.session.put.call_count, 2)
+
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after('120'), 120.0)
+        self.assertEqual(parse_retry_after('Wed, 21 Oct 2015 07:28:30 GMT',
+                                           now=1445412480), 30.0)
+        self.assertIsNone(parse_retry_after('soon'))
+        self.assertIsNone(parse_retry_after(None))
@@ -1,8 +1,55 @@
 from freelancersdk.exceptions import AuthTokenNotSuppliedException
 from freelancersdk.session import Session
+try:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+except ImportError:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+try:
+    from unittest.mock import Mock
+except ImportError:
+    from mock import Mock
+import socket
+import threading
 import unittest
 
 
+class FakeAPIHandler(BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        body = b'{"status": "success", "result": {}}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+
+    daemon_threads = True
+
+
+class LocalServer:
+
+    def __init__(self, handler=FakeAPIHandler):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        self.url = 'http://127.0.0.1:{}'.format(self.server.server_port)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
 class TestSession(unittest.TestCase):
     def setUp(self):
         pass
@@ -24,3 +71,84 @@ class TestSession(unittest.TestCase):
         s = Session(oauth_token=oauth_token)
         self.assertEquals('Freelancer.com SDK',
                           s.session.headers['User-Agent'])
+
+    def test_create_session_configures_connection_pool(self):
+        s = Session(oauth_token='$866somtoken', pool_connections=4,
+                    pool_maxsize=32, pool_block=True)
+        adapter = s.session.get_adapter('https://www.freelancer.com')
+        self.assertIs(adapter, s.adapter)
+        self.assertEqual(adapter.poolmanager.connection_pool_kw['maxsize'], 32)
+        self.assertEqual(adapter.poolmanager.connection_pool_kw['block'], True)
+        self.assertIn((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+                      adapter.poolmanager.connection_pool_kw['socket_options'])
+
+    def test_create_session_without_keep_alive(self):
+        s = Session(oauth_token='$866somtoken', keep_alive=False)
+        self.assertNotIn('socket_options',
+                         s.adapter.poolmanager.connection_pool_kw)
+
+    def test_connection_stats_counts_reused_connections(self):
+        server = LocalServer()
+        try:
+            s = Session(oauth_token='$866somtoken', url=server.url)
+            for _ in range(3):
+                s.session.get(server.url + '/api/projects/0.1/projects/')
+            stats = s.connection_stats()
+            s.session.close()
+        finally:
+            server.stop()
+        self.assertEqual(stats['requests'], 3)
+        self.assertEqual(stats['connections'], 1)
+        self.assertEqual(stats['reused'], 2)
+        self.assertEqual(stats['hosts']['127.0.0.1']['requests'], 3)
+
+    def test_request_caches_base_url_per_api(self):
+        s = Session(oauth_token='$866somtoken', url='https://fake-fln.com')
+        s.session.get = Mock()
+        s.request('GET', 'api/projects/0.1', 'bids/1', params={'a': 1})
+        s.session.get.assert_called_once_with(
+            url='https://fake-fln.com/api/projects/0.1/bids/1/',
+            params={'a': 1}, verify=True)
+        self.assertEqual(s.base_url('api/projects/0.1'),
+                         ('https://fake-fln.com/api/projects/0.1/',
+                          'projects'))
+
+        s.url = 'https://other-fln.com'
+        s.request('GET', 'api/projects/0.1', 'bids')
+        self.assertEqual(s.session.get.call_args[1]['url'],
+                         'https://other-fln.com/api/projects/0.1/bids/')
+
+    def test_middleware_wraps_every_request(self):
+        calls = []
+
+        def outer(request, send):
+            calls.append(('outer', request.namespace, request.endpoint))
+            request.options['headers'] = {'X-Trace': '1'}
+            return send(request)
+
+        def inner(request, send):
+            calls.append(('inner', request.namespace, request.endpoint))
+            response = send(request)
+            response.seen = True
+            return response
+
+        s = Session(oauth_token='$866somtoken', url='https://fake-fln.com',
+                    middlewares=[outer])
+        s.add_middleware(inner)
+        s.session.post = Mock()
+        response = s.request('POST', 'api/users/0.1', 'self/jobs',
+                             json={'jobs[]': [1]})
+        self.assertEqual(calls, [('outer', 'users', 'self/jobs'),
+                                 ('inner', 'users', 'self/jobs')])
+        s.session.post.assert_called_once_with(
+            url='https://fake-fln.com/api/users/0.1/self/jobs/',
+            json={'jobs[]': [1]}, headers={'X-Trace': '1'}, verify=True)
+        self.assertTrue(response.seen)
+
+        s.remove_middleware(outer)
+        self.assertEqual(s.middlewares, (inner,))
+        s.request('POST', 'api/users/0.1', 'self/jobs')
+        self.assertEqual(calls[-1], ('inner', 'users', 'self/jobs'))
+        self.assertEqual(len(calls), 3)
+        with self.assertRaises(AttributeError):
+            s.middlewares = [outer]
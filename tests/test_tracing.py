@@ -0,0 +1,170 @@
+from freelancersdk.session import Session
+from freelancersdk.retry import RetryPolicy
+from freelancersdk.tracing import InMemoryExporter, Tracer, current_span
+from freelancersdk.resources.projects import (
+    create_milestone_payment, get_bids, get_projects_bulk,
+)
+from freelancersdk.resources.projects.exceptions import (
+    MilestoneNotCreatedException,
+)
+try:
+    from unittest.mock import Mock
+except ImportError:
+    from mock import Mock
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+
+import json
+import threading
+import unittest
+
+
+class FakeResponse:
+
+    def __init__(self, status_code, result=None):
+        self.status_code = status_code
+        self.headers = {}
+        self.url = 'https://fake-fln.com'
+        self.encoding = 'utf-8'
+        body = {'status': 'success', 'result': result}
+        if status_code != 200:
+            body = {'status': 'error', 'message': 'failed',
+                    'error_code': 'ProjectExceptionCodes.UNKNOWN'}
+        self.content = json.dumps(body).encode('utf-8')
+
+    def json(self):
+        return json.loads(self.content.decode('utf-8'))
+
+
+class BidsHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        body = json.dumps({'status': 'success',
+                           'result': {'bids': [{'id': 1}]}}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestTracing(unittest.TestCase):
+    def setUp(self):
+        self.exporter = InMemoryExporter()
+        self.session = Session(oauth_token='$sometoken',
+                               url='https://fake-fln.com',
+                               tracer=Tracer(self.exporter))
+        self.session.session.get = Mock()
+        self.session.session.post = Mock()
+
+    def tearDown(self):
+        pass
+
+    def test_span_per_resource_function(self):
+        self.session.session.post.return_value = FakeResponse(
+            200, {'id': 5, 'amount': 10})
+        create_milestone_payment(self.session, 101, 202, 10, 'partial', 1)
+
+        [call] = self.exporter.find('projects.create_milestone_payment')
+        self.assertIsNone(call.parent_id)
+        self.assertEqual(call.status, 'ok')
+        self.assertEqual(call.attributes['sdk.project_id'], 101)
+        self.assertEqual(call.attributes['sdk.bidder_id'], 202)
+        self.assertEqual(call.attributes['sdk.retries'], 0)
+
+        [send] = self.exporter.find('send')
+        self.assertEqual(send.parent_id, call.span_id)
+        self.assertEqual(send.trace_id, call.trace_id)
+        self.assertEqual(send.attributes['http.method'], 'POST')
+        self.assertEqual(send.attributes['sdk.endpoint'], 'milestones')
+        self.assertEqual(send.attributes['http.status_code'], 200)
+
+        [decode] = self.exporter.find('decode')
+        self.assertEqual(decode.parent_id, call.span_id)
+        self.assertGreaterEqual(call.duration, 0)
+        self.assertIsNone(current_span())
+
+    def test_failed_call(self):
+        self.session.session.post.return_value = FakeResponse(500)
+        with self.assertRaises(MilestoneNotCreatedException):
+            create_milestone_payment(self.session, 101, 202, 10,
+                                     'partial', 1)
+        [call] = self.exporter.find('projects.create_milestone_payment')
+        self.assertEqual(call.status, 'error')
+        self.assertEqual(call.attributes['error.type'],
+                         'MilestoneNotCreatedException')
+
+    def test_retries(self):
+        self.session.add_middleware(RetryPolicy(sleep=lambda delay: None))
+        self.session.session.get.side_effect = [
+            FakeResponse(503), FakeResponse(200, {'bids': []})]
+        get_bids(self.session, project_ids=[101, 102])
+
+        [call] = self.exporter.find('projects.get_bids')
+        self.assertEqual(call.attributes['sdk.project_ids'], (101, 102))
+        self.assertEqual(call.attributes['sdk.retries'], 1)
+        sends = self.exporter.find('send')
+        self.assertEqual([s.attributes['sdk.retries'] for s in sends],
+                         [0, 1])
+        self.assertEqual([s.attributes['http.status_code'] for s in sends],
+                         [503, 200])
+
+    def test_bulk_calls_keep_parent(self):
+        self.session.session.get.side_effect = lambda url, **kwargs: \
+            FakeResponse(200, {'projects': [
+                {'id': int(i)} for i in kwargs['params']['projects[]']]})
+        result = get_projects_bulk(self.session,
+                                   {'projects[]': list(range(100))},
+                                   max_workers=4, max_query_length=100)
+        self.assertEqual(len(result['projects']), 100)
+
+        [bulk] = self.exporter.find('projects.get_projects_bulk')
+        chunks = self.exporter.find('projects.get_projects')
+        self.assertTrue(len(chunks) > 1)
+        for chunk in chunks:
+            self.assertEqual(chunk.trace_id, bulk.trace_id)
+            self.assertEqual(chunk.parent_id, bulk.span_id)
+        chunk_ids = set(chunk.span_id for chunk in chunks)
+        sends = self.exporter.find('send')
+        self.assertEqual(len(sends), len(chunks))
+        for send in sends:
+            self.assertEqual(send.trace_id, bulk.trace_id)
+            self.assertIn(send.parent_id, chunk_ids)
+
+    def test_no_tracer(self):
+        self.session.tracer = None
+        self.session.session.get.return_value = FakeResponse(
+            200, {'bids': []})
+        self.assertEqual(get_bids(self.session, project_ids=[101]),
+                         {'bids': []})
+        self.assertEqual(self.exporter.spans, [])
+
+    def test_http_phases(self):
+        server = HTTPServer(('127.0.0.1', 0), BidsHandler)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        try:
+            session = Session(
+                oauth_token='$sometoken',
+                url='http://127.0.0.1:{}'.format(server.server_port),
+                tracer=Tracer(self.exporter))
+            result = get_bids(session, bid_ids=[1])
+        finally:
+            server.shutdown()
+            server.server_close()
+        self.assertEqual(result['bids'], [{'id': 1}])
+
+        [send] = self.exporter.find('send')
+        [connect] = self.exporter.find('connect')
+        [wait] = self.exporter.find('wait')
+        self.assertEqual(connect.parent_id, send.span_id)
+        self.assertEqual(connect.attributes['net.peer.name'], '127.0.0.1')
+        self.assertEqual(wait.parent_id, send.span_id)
+        self.assertLessEqual(wait.end_time, send.end_time)
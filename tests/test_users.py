@@ -1,11 +1,14 @@
 from freelancersdk.session import Session
 from freelancersdk.resources.users.helpers import (
-    create_get_users_object,
+    create_get_users_object, create_get_users_bulk_queries,
+    create_get_users_details_object,
 )
 from freelancersdk.resources.users import (
     add_user_jobs, set_user_jobs, delete_user_jobs,
-    get_users,
+    get_users, get_users_bulk, get_self_user_id,
 )
+from freelancersdk.resources.users.exceptions import UsersNotFoundException
+from freelancersdk.resources.users.types import User, UsersResult
 try:
     from unittest.mock import Mock
 except ImportError:
@@ -66,6 +69,51 @@ class FakeGetUsersGetResponse:
         }
 
 
+class FakeGetSelfUserIdGetResponse:
+
+    status_code = 200
+
+    def json(self):
+        return {
+            'status': 'success',
+            'result': {
+                'id': 100,
+                'username': 'user1',
+            }
+        }
+
+
+class FakeGetUsersChunks:
+
+    def __init__(self, failing_username=None):
+        self.failing_username = failing_username
+        self.chunks = []
+
+    def __call__(self, url, params, verify):
+        ids = params.get('users[]', [])
+        usernames = params.get('usernames[]', [])
+        self.chunks.append(ids or usernames)
+        response = Mock()
+        if self.failing_username in usernames:
+            response.status_code = 404
+            response.json.return_value = {
+                'status': 'error',
+                'message': 'User not found',
+                'error_code': 'NOT_FOUND',
+            }
+            return response
+        users = [{'id': i, 'username': 'user{}'.format(i)} for i in ids]
+        users += [{'id': int(u[4:]), 'username': u} for u in usernames]
+        response.status_code = 200
+        response.json.return_value = {
+            'status': 'success',
+            'result': {
+                'users': dict((str(u['id']), u) for u in users),
+            },
+        }
+        return response
+
+
 class TestUsers(unittest.TestCase):
     def setUp(self):
         self.session = Session(oauth_token='$sometoken', url='https://fake-fln.com')
@@ -88,7 +136,7 @@ class TestUsers(unittest.TestCase):
         user_jobs_data.update({'jobs[]': user_jobs_data['job_ids']})
         del user_jobs_data['job_ids']
         self.session.session.post.assert_called_once_with(
-            'https://fake-fln.com/api/users/0.1/self/jobs/',
+            url='https://fake-fln.com/api/users/0.1/self/jobs/',
             json=user_jobs_data,
             verify=True)
         self.assertEquals(p, 'success')
@@ -108,7 +156,7 @@ class TestUsers(unittest.TestCase):
         user_jobs_data.update({'jobs[]': user_jobs_data['job_ids']})
         del user_jobs_data['job_ids']
         self.session.session.put.assert_called_once_with(
-            'https://fake-fln.com/api/users/0.1/self/jobs/',
+            url='https://fake-fln.com/api/users/0.1/self/jobs/',
             headers=None,
             params=None,
             data=None,
@@ -131,7 +179,7 @@ class TestUsers(unittest.TestCase):
         user_jobs_data.update({'jobs[]': user_jobs_data['job_ids']})
         del user_jobs_data['job_ids']
         self.session.session.delete.assert_called_once_with(
-            'https://fake-fln.com/api/users/0.1/self/jobs/',
+            url='https://fake-fln.com/api/users/0.1/self/jobs/',
             headers=None,
             params=None,
             data=None,
@@ -147,8 +195,53 @@ class TestUsers(unittest.TestCase):
         self.session.session.get = Mock()
         self.session.session.get.return_value = FakeGetUsersGetResponse()
 
-        get_users(self.session, query)
+        result = get_users(self.session, query)
         self.assertTrue(self.session.session.get.called)
+        self.assertIsInstance(result, UsersResult)
+        self.assertEqual(sorted(result.users), [100, 200])
+        self.assertEqual(result.users[200].id, 200)
 
         query_params = self.session.session.get.call_args[1]
         self.assertIn(('users[]', [100, 200]), query_params['params'].items())
+
+    def test_get_self_user_id(self):
+        self.session.session.get = Mock()
+        self.session.session.get.return_value = FakeGetSelfUserIdGetResponse()
+        user_id = get_self_user_id(self.session)
+        self.session.session.get.assert_called_once_with(
+            url='https://fake-fln.com/api/users/0.1/self/',
+            params=None,
+            verify=True)
+        self.assertEqual(user_id, 100)
+
+    def test_create_get_users_bulk_queries(self):
+        query = create_get_users_object(
+            user_ids=[1, 2, 1, 3, 2, 4, 5],
+            usernames=['user9', 'user9'],
+            user_details=create_get_users_details_object(reputation=True),
+        )
+        queries = create_get_users_bulk_queries(query, max_users=2)
+        self.assertEqual(
+            [(q.get('users[]'), q.get('usernames[]')) for q in queries],
+            [([1, 2], None), ([3, 4], None), ([5], None), (None, ['user9'])])
+        for q in queries:
+            self.assertEqual(q['reputation'], True)
+
+    def test_get_users_bulk(self):
+        chunks = FakeGetUsersChunks(failing_username='user404')
+        self.session.session.get = Mock(side_effect=chunks)
+        user_ids = list(range(250)) * 2
+        query = create_get_users_object(user_ids=user_ids,
+                                        usernames=['user300', 'user404'])
+        result = get_users_bulk(self.session, query, max_users=100)
+        self.assertEqual(sorted(len(c) for c in chunks.chunks),
+                         [2, 50, 100, 100])
+        self.assertEqual(sorted(result['users']),
+                         sorted(str(i) for i in range(250)))
+        self.assertEqual(len(result['failed']), 1)
+        self.assertEqual(result['failed'][0].item['usernames[]'],
+                         ['user300', 'user404'])
+        self.assertIsInstance(result['failed'][0].exception,
+                              UsersNotFoundException)
+        self.assertIsInstance(result, UsersResult)
+        self.assertIsInstance(result.users[249], User)